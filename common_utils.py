@@ -3,11 +3,15 @@
 用于所有demo测试文件的统一配置
 """
 import asyncio
+import base64
+import mimetypes
 import requests
 import numpy as np
 from lightrag.llm.openai import openai_complete_if_cache
 from lightrag.utils import EmbeddingFunc
-from remote_image_server import convert_base64_to_url
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+from remote_image_server import convert_base64_to_url, convert_path_to_url
 
 # API配置
 API_KEY = ''
@@ -16,6 +20,42 @@ LLM_API_URL = "http://223.109.239.14:10018/v1/chat/completions"
 VISION_API_URL = "http://223.109.239.14:10018/v1/chat/completions"
 IMAGE_SERVER_URL = "http://223.109.239.14:10017"
 
+def _file_url_to_path(url):
+    """file:// URL转换为本地路径，其他URL返回None"""
+    if isinstance(url, str) and url.startswith("file://"):
+        return url2pathname(urlparse(url).path)
+    return None
+
+def _replace_file_image_urls(messages, convert):
+    """将messages中file://图片URL逐个替换为convert(path)的结果，转换失败的图片被跳过"""
+    resolved = []
+    for msg in messages:
+        content = msg.get("content") if isinstance(msg, dict) else None
+        if not isinstance(content, list):
+            resolved.append(msg)
+            continue
+        parts = []
+        for part in content:
+            file_path = None
+            if isinstance(part, dict) and part.get("type") == "image_url":
+                file_path = _file_url_to_path(part.get("image_url", {}).get("url"))
+            if file_path is None:
+                parts.append(part)
+                continue
+            url = convert(file_path)
+            if url:
+                parts.append({"type": "image_url", "image_url": {"url": url}})
+            else:
+                print(f"Warning: Failed to convert image file to URL, skipping image: {file_path}")
+        resolved.append({**msg, "content": parts})
+    return resolved
+
+def _file_to_data_url(file_path):
+    """本地图片文件编码为data URL（仅外部API回退时使用）"""
+    mime_type = mimetypes.guess_type(file_path)[0] or "image/jpeg"
+    with open(file_path, "rb") as f:
+        return f"data:{mime_type};base64,{base64.b64encode(f.read()).decode('utf-8')}"
+
 def get_llm_model_func():
     """获取LLM模型函数（异步版本，供LightRAG使用）"""
     async def llm_model_func(prompt, system_prompt=None, history_messages=[], **kwargs):
@@ -62,16 +102,18 @@ def get_llm_model_func():
 def get_vision_model_func():
     """获取视觉模型函数（同步版本，供modal processors使用）"""
     async def vision_model_func(
-        prompt, system_prompt=None, history_messages=[], image_data=None, messages=None, **kwargs
+        prompt, system_prompt=None, history_messages=[], image_data=None, messages=None,
+        image_path=None, **kwargs
     ):
         # 构建请求消息
         request_messages = []
         
         # 如果提供了messages格式（用于多模态VLM增强查询），直接使用
+        # file://图片由图片服务器按路径发布，无需base64往返
         if messages:
-            request_messages = messages
-        # 传统单图片格式
-        elif image_data:
+            request_messages = _replace_file_image_urls(messages, convert_path_to_url)
+        # 传统单图片格式（base64数据或文件路径）
+        elif image_data or image_path:
             if system_prompt:
                 request_messages.append({"role": "system", "content": system_prompt})
             
@@ -83,9 +125,12 @@ def get_vision_model_func():
             
             # 构建多模态用户消息
             user_content = [{"type": "text", "text": prompt}]
-            if image_data:
-                # 将base64图片转换为可访问的URL
-                image_url = convert_base64_to_url(image_data)
+            if image_data or image_path:
+                # 文件路径直接发布原文件，base64图片则解码后保存
+                image_url = (
+                    convert_path_to_url(image_path) if image_path
+                    else convert_base64_to_url(image_data)
+                )
                 if image_url:
                     user_content.append({
                         "type": "image_url",
@@ -127,8 +172,12 @@ def get_vision_model_func():
             
         except Exception as e:
             print(f"Vision model request failed: {e}")
-            # 回退到原始实现
+            # 回退到原始实现，外部API无法访问本地文件，此时才编码为base64
+            if image_path and not image_data:
+                with open(image_path, "rb") as f:
+                    image_data = base64.b64encode(f.read()).decode("utf-8")
             if messages:
+                messages = _replace_file_image_urls(messages, _file_to_data_url)
                 return openai_complete_if_cache(
                     "gpt-4o",
                     "",
@@ -277,16 +326,18 @@ async def get_async_llm_model_func():
 async def get_async_vision_model_func():
     """获取异步视觉模型函数"""
     async def vision_model_func(
-        prompt, system_prompt=None, history_messages=[], image_data=None, messages=None, **kwargs
+        prompt, system_prompt=None, history_messages=[], image_data=None, messages=None,
+        image_path=None, **kwargs
     ):
         # 构建请求消息
         request_messages = []
         
         # 如果提供了messages格式（用于多模态VLM增强查询），直接使用
+        # file://图片由图片服务器按路径发布，无需base64往返
         if messages:
-            request_messages = messages
-        # 传统单图片格式
-        elif image_data:
+            request_messages = _replace_file_image_urls(messages, convert_path_to_url)
+        # 传统单图片格式（base64数据或文件路径）
+        elif image_data or image_path:
             if system_prompt:
                 request_messages.append({"role": "system", "content": system_prompt})
             
@@ -298,9 +349,12 @@ async def get_async_vision_model_func():
             
             # 构建多模态用户消息
             user_content = [{"type": "text", "text": prompt}]
-            if image_data:
-                # 将base64图片转换为可访问的URL
-                image_url = convert_base64_to_url(image_data)
+            if image_data or image_path:
+                # 文件路径直接发布原文件，base64图片则解码后保存
+                image_url = (
+                    convert_path_to_url(image_path) if image_path
+                    else convert_base64_to_url(image_data)
+                )
                 if image_url:
                     user_content.append({
                         "type": "image_url",
@@ -345,8 +399,12 @@ async def get_async_vision_model_func():
             return await asyncio.to_thread(_call)
         except Exception as e:
             print(f"Async vision model request failed: {e}")
-            # 回退到原始实现
+            # 回退到原始实现，外部API无法访问本地文件，此时才编码为base64
+            if image_path and not image_data:
+                with open(image_path, "rb") as f:
+                    image_data = base64.b64encode(f.read()).decode("utf-8")
             if messages:
+                messages = _replace_file_image_urls(messages, _file_to_data_url)
                 return await openai_complete_if_cache(
                     "gpt-4o",
                     "",
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+MinerU Worker Pool Benchmark for RAG-Anything
+
+This script compares parse latency of spawning the `mineru` CLI per document
+(cold start, models reloaded every run) against a persistent MinerU worker
+pool (models loaded once and kept warm).
+
+Requirements:
+- MinerU 2.0 installed: pip install -U 'mineru[core]'
+- RAG-Anything package
+
+Usage:
+    python mineru_pool_benchmark.py --file path/to/document.pdf --runs 3
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from raganything.mineru_pool import MineruWorkerPool
+from raganything.parser import MineruParser
+
+
+def time_parse(parser: MineruParser, file_path: Path, method: str) -> float:
+    """Parse a document into a fresh output directory and return elapsed seconds"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        content_list = parser.parse_document(
+            file_path, method=method, output_dir=output_dir
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"    {elapsed:7.2f}s  ({len(content_list)} content blocks)")
+    return elapsed
+
+
+def report(label: str, timings: list) -> None:
+    """Print latency summary for a series of runs"""
+    print(
+        f"{label:<12} first: {timings[0]:7.2f}s  "
+        f"median: {statistics.median(timings):7.2f}s  "
+        f"min: {min(timings):7.2f}s"
+    )
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark MinerU CLI cold start against a warm worker pool"
+    )
+    parser.add_argument("--file", required=True, help="Document to parse")
+    parser.add_argument("--runs", type=int, default=3, help="Number of parses per mode")
+    parser.add_argument(
+        "--method",
+        choices=["auto", "txt", "ocr"],
+        default="auto",
+        help="Parsing method",
+    )
+    args = parser.parse_args()
+
+    file_path = Path(args.file)
+    if not file_path.exists():
+        print(f"❌ File does not exist: {file_path}")
+        return 1
+
+    if not MineruParser().check_installation():
+        print("❌ MinerU is not installed: pip install -U 'mineru[core]'")
+        return 1
+
+    print(f"🧪 Benchmarking {file_path.name} ({args.runs} runs per mode)")
+
+    print("\n🥶 CLI per document (cold start):")
+    cold_parser = MineruParser()
+    cold = [time_parse(cold_parser, file_path, args.method) for _ in range(args.runs)]
+
+    print("\n🔥 Persistent worker pool (first run loads models):")
+    with MineruWorkerPool(num_workers=1) as pool:
+        warm_parser = MineruParser(worker_pool=pool)
+        warm = [
+            time_parse(warm_parser, file_path, args.method) for _ in range(args.runs)
+        ]
+
+    print("\n📊 Results:")
+    report("CLI", cold)
+    report("Worker pool", warm)
+    if len(warm) > 1:
+        speedup = statistics.median(cold) / statistics.median(warm[1:])
+        print(f"Warm pool speedup (median, excluding first run): {speedup:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@
 import os
 import base64
 import hashlib
+import shutil
 import threading
 import time
 from http.server import HTTPServer, SimpleHTTPRequestHandler
@@ -19,6 +20,8 @@ class ImageServer:
         self.server = None
         self.server_thread = None
         self.running = False
+        # (路径, 修改时间, 大小) -> 内容哈希，避免重复读取同一文件
+        self._file_hashes = {}
         
         # 确保临时目录存在
         os.makedirs(self.temp_dir, exist_ok=True)
@@ -54,14 +57,60 @@ class ImageServer:
             print(f"Error saving base64 image: {e}")
             return None
     
+    def _get_file_hash(self, file_path):
+        """分块计算文件内容的md5，与save_base64_image的命名保持一致"""
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if cache_key not in self._file_hashes:
+            md5 = hashlib.md5()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    md5.update(chunk)
+            self._file_hashes[cache_key] = md5.hexdigest()
+        return self._file_hashes[cache_key]
+
+    def save_image_file(self, file_path):
+        """
+        按内容哈希发布本地图片文件，返回访问URL
+        优先硬链接，其次符号链接，最后才复制，避免base64编码/解码/重写
+        """
+        try:
+            extension = os.path.splitext(file_path)[1].lstrip('.').lower() or "jpg"
+            filename = f"{self._get_file_hash(file_path)}.{extension}"
+            filepath = os.path.join(self.temp_dir, filename)
+
+            # 如果文件不存在则发布
+            if not os.path.exists(filepath):
+                try:
+                    os.link(file_path, filepath)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    # 跨文件系统或不支持硬链接
+                    try:
+                        os.symlink(os.path.abspath(file_path), filepath)
+                    except FileExistsError:
+                        pass
+                    except OSError:
+                        shutil.copyfile(file_path, filepath)
+
+            # 返回访问URL
+            return f"http://127.0.0.1:{self.port}/{filename}"
+
+        except Exception as e:
+            print(f"Error publishing image file: {e}")
+            return None
+
     def start_server(self):
         """启动文件服务器"""
         if self.running:
             return
             
+        serve_dir = self.temp_dir
+
         class CustomHandler(SimpleHTTPRequestHandler):
             def __init__(self, *args, **kwargs):
-                super().__init__(*args, directory=self.temp_dir, **kwargs)
+                super().__init__(*args, directory=serve_dir, **kwargs)
             
             def log_message(self, format, *args):
                 # 禁用访问日志
@@ -113,6 +162,11 @@ def convert_base64_to_url(base64_data):
     server = get_image_server()
     return server.save_base64_image(base64_data)
 
+def convert_path_to_url(file_path):
+    """将本地图片文件发布为可访问的URL"""
+    server = get_image_server()
+    return server.save_image_file(file_path)
+
 if __name__ == "__main__":
     # 测试服务器
     server = ImageServer()
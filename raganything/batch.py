@@ -6,27 +6,419 @@ Contains methods for processing multiple documents in batch mode
 
 import asyncio
 import logging
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 import time
 
 from .batch_parser import BatchParser, BatchProcessingResult
+from .modalprocessors import content_source_scope
+from .utils import insert_text_content, separate_content
 
 if TYPE_CHECKING:
     from .config import RAGAnythingConfig
 
 
+class _BulkIngestState:
+    """Flush schedule and progress of an active bulk ingest session"""
+
+    __slots__ = (
+        "flush_every_documents",
+        "flush_interval",
+        "documents_since_flush",
+        "last_flush",
+        "lock",
+    )
+
+    def __init__(self, flush_every_documents: int, flush_interval: float):
+        self.flush_every_documents = flush_every_documents
+        self.flush_interval = flush_interval
+        self.documents_since_flush = 0
+        self.last_flush = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def flush_due(self) -> bool:
+        if 0 < self.flush_every_documents <= self.documents_since_flush:
+            return True
+        return 0 < self.flush_interval <= time.monotonic() - self.last_flush
+
+
+class _PipelineDocument:
+    """State of one document moving through the staged folder pipeline"""
+
+    __slots__ = (
+        "file_path",
+        "content_list",
+        "doc_id",
+        "text_content",
+        "multimodal_items",
+        "multimodal_data_list",
+        "extraction",
+        "status_txn",
+        "multimodal_processed",
+        "error",
+    )
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.content_list: List[Dict[str, Any]] = []
+        self.doc_id: Optional[str] = None
+        self.text_content = ""
+        self.multimodal_items: List[Dict[str, Any]] = []
+        # Descriptions from the caption stage, None once processed by the fallback
+        self.multimodal_data_list: Optional[List[Dict[str, Any]]] = None
+        # (chunk_records, lightrag_chunks, chunk_results) from the extraction stage
+        self.extraction: Optional[Tuple] = None
+        self.status_txn = None
+        # doc_status already recorded the multimodal content as processed
+        self.multimodal_processed = False
+        # Set when a stage failed, later stages skip the document
+        self.error: Optional[str] = None
+
+
 class BatchMixin:
     """BatchMixin class containing batch processing functionality for RAGAnything"""
 
     # Type hints for mixin attributes (will be available when mixed into RAGAnything)
     config: "RAGAnythingConfig"
     logger: logging.Logger
+    bulk_ingest_state: Optional[_BulkIngestState]
 
     # Type hints for methods that will be available from other mixins
     async def _ensure_lightrag_initialized(self) -> None: ...
     async def process_document_complete(self, file_path: str, **kwargs) -> None: ...
 
+    # ==========================================
+    # BULK INGEST SESSION
+    # ==========================================
+
+    @asynccontextmanager
+    async def bulk_ingest_session(
+        self,
+        flush_every_documents: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        """
+        Defer per-document storage flushes while ingesting many documents
+
+        Inside the session, documents are written to the in-memory storages
+        without persisting the vector databases, graph, doc_status and caches
+        after every document. All storages are persisted every
+        `flush_every_documents` documents or `flush_interval` seconds, and when
+        the session exits. Documents processed since the last flush are lost if
+        the process crashes and are processed again on the next run.
+
+        Nested sessions reuse the outer session.
+
+        Args:
+            flush_every_documents: Persist after this many documents (0 to disable), defaults to config
+            flush_interval: Persist when this many seconds passed since the last flush (0 to disable), defaults to config
+
+        Example:
+            async with rag.bulk_ingest_session(flush_every_documents=50):
+                await rag.process_folder_complete("./documents")
+        """
+        if self.bulk_ingest_state is not None:
+            yield
+            return
+
+        await self._ensure_lightrag_initialized()
+
+        if flush_every_documents is None:
+            flush_every_documents = self.config.bulk_flush_documents
+        if flush_interval is None:
+            flush_interval = self.config.bulk_flush_interval
+
+        self.bulk_ingest_state = _BulkIngestState(flush_every_documents, flush_interval)
+        self.logger.info(
+            f"Bulk ingest session started (flush every {flush_every_documents} documents "
+            f"or {flush_interval}s)"
+        )
+        try:
+            yield
+        finally:
+            state = self.bulk_ingest_state
+            self.bulk_ingest_state = None
+            async with state.lock:
+                await self._flush_ingest_storages()
+            self.logger.info("Bulk ingest session finished, storages persisted")
+
+    async def _flush_ingest_storages(self) -> None:
+        """Persist LightRAG storages and RAGAnything caches"""
+        await self.lightrag._insert_done()
+        for cache in (self.parse_cache, self.caption_cache):
+            if cache is not None:
+                await cache.index_done_callback()
+
+    async def _document_ingested(self) -> None:
+        """Count a finished document and persist storages when a session flush is due"""
+        state = self.bulk_ingest_state
+        if state is None:
+            return
+
+        state.documents_since_flush += 1
+        if not state.flush_due():
+            return
+
+        async with state.lock:
+            # Another document may have flushed while waiting for the lock
+            if not state.flush_due():
+                return
+            documents = state.documents_since_flush
+            await self._flush_ingest_storages()
+            state.documents_since_flush -= documents
+            state.last_flush = time.monotonic()
+        self.logger.info(f"Bulk ingest: persisted storages after {documents} documents")
+
+    # ==========================================
+    # STAGED FOLDER PIPELINE
+    # ==========================================
+
+    async def _process_files_pipelined(
+        self,
+        files: List[Path],
+        output_dir: str,
+        parse_method: str,
+        split_by_character: str | None = None,
+        split_by_character_only: bool = False,
+    ) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Process files with a staged pipeline
+
+        Every document passes the stages parse -> text insert -> caption ->
+        entity extraction -> merge. Each stage has its own workers and takes
+        documents from a bounded queue, so CPU-bound parsing of one document
+        overlaps with LLM-bound captioning and extraction of the previous ones,
+        and at most `pipeline_queue_size` documents wait in front of a stage.
+
+        Args:
+            files: Files to process
+            output_dir: Directory for parsed outputs
+            parse_method: Parsing method to use
+            split_by_character: Character to split text by (optional)
+            split_by_character_only: Whether to split only by character
+
+        Returns:
+            List[Tuple[bool, str, Optional[str]]]: (success, file_path, error) per file
+        """
+
+        async def parse(document: _PipelineDocument):
+            await self._pipeline_parse(document, output_dir, parse_method)
+
+        async def insert_text(document: _PipelineDocument):
+            await self._pipeline_insert_text(
+                document, split_by_character, split_by_character_only
+            )
+
+        stages: List[Tuple[str, int, Callable[[_PipelineDocument], Awaitable]]] = [
+            ("parse", self.config.pipeline_parse_workers, parse),
+            ("text insert", self.config.pipeline_text_workers, insert_text),
+            ("caption", self.config.pipeline_caption_workers, self._pipeline_caption),
+            ("extract", self.config.pipeline_extract_workers, self._pipeline_extract),
+            ("merge", self.config.pipeline_merge_workers, self._pipeline_merge),
+        ]
+        worker_counts = [max(1, workers) for _, workers, _ in stages] + [1]
+        queues = [
+            asyncio.Queue(maxsize=max(1, self.config.pipeline_queue_size))
+            for _ in range(len(stages) + 1)
+        ]
+        results = []
+
+        self.logger.info(
+            "Pipeline workers: "
+            + ", ".join(
+                f"{name}={count}" for (name, _, _), count in zip(stages, worker_counts)
+            )
+        )
+
+        async def feed():
+            for file_path in files:
+                await queues[0].put(_PipelineDocument(str(file_path)))
+            for _ in range(worker_counts[0]):
+                await queues[0].put(None)
+
+        async def run_stage(index: int):
+            name, _, handler = stages[index]
+            inbox, outbox = queues[index], queues[index + 1]
+
+            async def worker():
+                while True:
+                    document = await inbox.get()
+                    if document is None:
+                        return
+                    if document.error is None:
+                        try:
+                            await handler(document)
+                        except Exception as e:
+                            document.error = str(e)
+                            self.logger.error(
+                                f"Failed to process {document.file_path} ({name} stage): {e}"
+                            )
+                    await outbox.put(document)
+
+            await asyncio.gather(*(worker() for _ in range(worker_counts[index])))
+            # Stop the workers of the next stage once this stage is drained
+            for _ in range(worker_counts[index + 1]):
+                await outbox.put(None)
+
+        async def collect():
+            while True:
+                document = await queues[-1].get()
+                if document is None:
+                    return
+                # Keep doc_status changes made before a stage failed
+                if document.status_txn is not None:
+                    await self._commit_doc_status_transaction(document.status_txn)
+                results.append(
+                    (document.error is None, document.file_path, document.error)
+                )
+
+        await asyncio.gather(
+            feed(), collect(), *(run_stage(index) for index in range(len(stages)))
+        )
+        return results
+
+    async def _pipeline_parse(
+        self, document: _PipelineDocument, output_dir: str, parse_method: str
+    ):
+        """Parse stage: parse the document and separate text from multimodal items"""
+        self.logger.info(f"Starting complete document processing: {document.file_path}")
+        document.content_list, document.doc_id = await self.parse_document(
+            document.file_path,
+            output_dir,
+            parse_method,
+            self.config.display_content_stats,
+        )
+        document.text_content, document.multimodal_items = separate_content(
+            document.content_list
+        )
+
+    async def _pipeline_insert_text(
+        self,
+        document: _PipelineDocument,
+        split_by_character: str | None,
+        split_by_character_only: bool,
+    ):
+        """Text insert stage: insert the document's text into LightRAG"""
+        if not document.text_content.strip():
+            return
+        await insert_text_content(
+            self.lightrag,
+            document.text_content,
+            file_paths=os.path.basename(document.file_path),
+            split_by_character=split_by_character,
+            split_by_character_only=split_by_character_only,
+            ids=document.doc_id,
+        )
+        # Only the multimodal items are needed from here on
+        document.text_content = ""
+
+    async def _pipeline_caption(self, document: _PipelineDocument):
+        """Caption stage: generate descriptions of the document's multimodal items"""
+        if not document.multimodal_items:
+            return
+
+        document.status_txn = self._begin_doc_status_transaction(document.doc_id)
+        if await self._is_multimodal_processed(document.status_txn):
+            document.multimodal_processed = True
+            return
+
+        self.logger.info("Starting multimodal content processing...")
+        try:
+            with content_source_scope(
+                document.content_list, self.config.content_format
+            ):
+                document.multimodal_data_list = (
+                    await self._generate_descriptions_type_aware(
+                        document.multimodal_items, document.file_path
+                    )
+                )
+        except Exception as e:
+            await self._pipeline_fallback(document, e)
+            return
+
+        if not document.multimodal_data_list:
+            self.logger.warning("No valid multimodal descriptions generated")
+            return
+        self.logger.info(
+            f"Generated descriptions for {len(document.multimodal_data_list)}/{len(document.multimodal_items)} multimodal items using correct processors"
+        )
+
+    async def _pipeline_extract(self, document: _PipelineDocument):
+        """Entity extraction stage: store multimodal chunks and extract their entities"""
+        if not document.multimodal_data_list:
+            return
+        try:
+            document.extraction = await self._extract_multimodal_chunks(
+                document.multimodal_data_list,
+                document.file_path,
+                document.doc_id,
+                document.status_txn,
+            )
+        except Exception as e:
+            await self._pipeline_fallback(document, e)
+
+    async def _pipeline_merge(self, document: _PipelineDocument):
+        """Merge stage: merge extracted entities into the graph and finish the document"""
+        try:
+            if document.extraction is not None:
+                try:
+                    await self._merge_multimodal_chunks(
+                        *document.extraction,
+                        document.file_path,
+                        document.doc_id,
+                        document.status_txn,
+                    )
+                except Exception as e:
+                    await self._pipeline_fallback(document, e)
+
+            if not document.multimodal_processed:
+                await self._mark_multimodal_processing_complete(
+                    document.doc_id, document.status_txn
+                )
+        finally:
+            if document.status_txn is not None:
+                await self._commit_doc_status_transaction(document.status_txn)
+                document.status_txn = None
+
+        # Persist model responses cached while processing this document
+        if (
+            document.multimodal_items
+            and self.caption_cache is not None
+            and self.bulk_ingest_state is None
+        ):
+            await self.caption_cache.index_done_callback()
+
+        # Persist storages if a bulk ingest session flush is due
+        await self._document_ingested()
+
+        self.logger.info(f"Document {document.file_path} processing complete!")
+
+    async def _pipeline_fallback(self, document: _PipelineDocument, error: Exception):
+        """Process the document's multimodal items one by one after a batch stage failed"""
+        self.logger.error(f"Error in multimodal processing: {error}")
+        self.logger.warning("Falling back to individual multimodal processing")
+        document.multimodal_data_list = None
+        document.extraction = None
+        with content_source_scope(document.content_list, self.config.content_format):
+            await self._process_multimodal_content_individual(
+                document.multimodal_items,
+                document.file_path,
+                document.doc_id,
+                status_txn=document.status_txn,
+            )
+
     # ==========================================
     # ORIGINAL BATCH PROCESSING METHOD (RESTORED)
     # ==========================================
@@ -42,6 +434,7 @@ class BatchMixin:
         file_extensions: Optional[List[str]] = None,
         recursive: bool = None,
         max_workers: int = None,
+        use_pipeline: bool = None,
     ):
         """
         Process all supported files in a folder
@@ -56,6 +449,8 @@ class BatchMixin:
             file_extensions: List of file extensions to process (optional)
             recursive: Whether to process folders recursively (optional)
             max_workers: Maximum number of workers for concurrent processing (optional)
+            use_pipeline: Process files with the staged pipeline instead of one
+                worker per file, worker counts come from the pipeline_* config (optional)
         """
         if output_dir is None:
             output_dir = self.config.parser_output_dir
@@ -69,6 +464,8 @@ class BatchMixin:
             recursive = self.config.recursive_folder_processing
         if max_workers is None:
             max_workers = self.config.max_concurrent_files
+        if use_pipeline is None:
+            use_pipeline = self.config.enable_pipeline_processing
 
         await self._ensure_lightrag_initialized()
 
@@ -100,7 +497,6 @@ class BatchMixin:
 
         # Process files with controlled concurrency
         semaphore = asyncio.Semaphore(max_workers)
-        tasks = []
 
         async def process_single_file(file_path: Path):
             async with semaphore:
@@ -117,13 +513,32 @@ class BatchMixin:
                     self.logger.error(f"Failed to process {file_path}: {str(e)}")
                     return False, str(file_path), str(e)
 
-        # Create tasks for all files
-        for file_path in files_to_process:
-            task = asyncio.create_task(process_single_file(file_path))
-            tasks.append(task)
-
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def process_all_files():
+            if use_pipeline:
+                return await self._process_files_pipelined(
+                    files_to_process,
+                    output_dir=output_dir,
+                    parse_method=parse_method,
+                    split_by_character=split_by_character,
+                    split_by_character_only=split_by_character_only,
+                )
+
+            # Create tasks for all files
+            tasks = []
+            for file_path in files_to_process:
+                task = asyncio.create_task(process_single_file(file_path))
+                tasks.append(task)
+
+            # Wait for all tasks to complete
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Defer per-document storage flushes to a bulk ingest session if enabled
+        if self.config.enable_bulk_ingest:
+            async with self.bulk_ingest_session():
+                results = await process_all_files()
+        else:
+            results = await process_all_files()
+            await self._flush_parse_cache()
 
         # Process results
         successful_files = []
@@ -371,6 +786,9 @@ class BatchMixin:
                         "processed": False,
                     }
 
+            if self.bulk_ingest_state is None:
+                await self._flush_parse_cache()
+
         processing_time = time.time() - start_time
 
         return {
@@ -16,6 +16,7 @@ import time
 from tqdm import tqdm
 
 from .parser import MineruParser, DoclingParser
+from .mineru_pool import MineruWorkerPool
 
 
 @dataclass
@@ -63,6 +64,7 @@ class BatchParser:
         show_progress: bool = True,
         timeout_per_file: int = 300,
         skip_installation_check: bool = False,
+        worker_pool: Optional[MineruWorkerPool] = None,
     ):
         """
         Initialize batch parser
@@ -73,6 +75,7 @@ class BatchParser:
             show_progress: Whether to show progress bars
             timeout_per_file: Timeout in seconds for each file
             skip_installation_check: Skip parser installation check (useful for testing)
+            worker_pool: Optional persistent MinerU worker pool to dispatch parse jobs to
         """
         self.parser_type = parser_type
         self.max_workers = max_workers
@@ -82,7 +85,7 @@ class BatchParser:
 
         # Initialize parser
         if parser_type == "mineru":
-            self.parser = MineruParser()
+            self.parser = MineruParser(worker_pool=worker_pool)
         elif parser_type == "docling":
             self.parser = DoclingParser()
         else:
@@ -386,6 +389,12 @@ def main():
     parser.add_argument(
         "--timeout", type=int, default=300, help="Timeout per file (seconds)"
     )
+    parser.add_argument(
+        "--pool-workers",
+        type=int,
+        default=0,
+        help="Number of persistent MinerU worker processes (0 spawns the CLI per file)",
+    )
 
     args = parser.parse_args()
 
@@ -395,6 +404,10 @@ def main():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    worker_pool = None
+    if args.parser == "mineru" and args.pool_workers > 0:
+        worker_pool = MineruWorkerPool(num_workers=args.pool_workers)
+
     try:
         # Create batch parser
         batch_parser = BatchParser(
@@ -402,6 +415,7 @@ def main():
             max_workers=args.workers,
             show_progress=not args.no_progress,
             timeout_per_file=args.timeout,
+            worker_pool=worker_pool,
         )
 
         # Process files
@@ -425,6 +439,10 @@ def main():
         print(f"Error: {str(e)}")
         return 1
 
+    finally:
+        if worker_pool is not None:
+            worker_pool.close()
+
 
 if __name__ == "__main__":
     exit(main())
@@ -34,6 +34,59 @@ class RAGAnythingConfig:
     )
     """Whether to display content statistics during parsing."""
 
+    parse_cache_mode: str = field(
+        default=get_env_value("PARSE_CACHE_MODE", "mtime", str)
+    )
+    """Parse cache key mode: 'mtime' (file path + modification time) or 'content' (hash of file bytes)."""
+
+    parse_cache_storage: str = field(
+        default=get_env_value("PARSE_CACHE_STORAGE", "kv", str)
+    )
+    """Parse cache payload storage: 'kv' (content list inline in KV storage) or 'blob' (compressed file per document, index in KV storage)."""
+
+    parse_page_window: int = field(default=get_env_value("PARSE_PAGE_WINDOW", 0, int))
+    """Pages per window for streaming MinerU PDF parsing, 0 disables streaming."""
+
+    parse_shards: int = field(default=get_env_value("PARSE_SHARDS", 1, int))
+    """Number of page-range shards a PDF is split into when parsing with MinerU, 1 disables sharding."""
+
+    parse_shard_workers: int = field(
+        default=get_env_value("PARSE_SHARD_WORKERS", 2, int)
+    )
+    """Maximum number of MinerU processes running concurrently for one sharded PDF."""
+
+    mineru_pool_workers: int = field(
+        default=get_env_value("MINERU_POOL_WORKERS", 0, int)
+    )
+    """Number of persistent MinerU worker processes keeping models loaded, 0 runs the mineru CLI per document."""
+
+    parser_executor: str = field(
+        default=get_env_value("PARSER_EXECUTOR", "thread", str)
+    )
+    """Executor that synchronous parsers run on: 'thread' or 'process'."""
+
+    max_parallel_parse: int = field(default=get_env_value("MAX_PARALLEL_PARSE", 2, int))
+    """Maximum number of documents parsed concurrently on the parse executor."""
+
+    docling_backend: str = field(default=get_env_value("DOCLING_BACKEND", "cli", str))
+    """Docling backend: 'cli' (docling command per file) or 'python' (in-process converter reused across files)."""
+
+    enable_conversion_cache: bool = field(
+        default=get_env_value("ENABLE_CONVERSION_CACHE", True, bool)
+    )
+    """Cache Office/text to PDF conversions by source content hash in the working directory."""
+
+    native_text_extensions: List[str] = field(
+        default_factory=lambda: [
+            ext.strip().lower()
+            for ext in get_env_value("NATIVE_TEXT_EXTENSIONS", ".txt,.md", str).split(
+                ","
+            )
+            if ext.strip()
+        ]
+    )
+    """Text file extensions parsed directly into content blocks instead of being converted to PDF (empty to always convert)."""
+
     # Multimodal Processing Configuration
     # ---
     enable_image_processing: bool = field(
@@ -51,6 +104,77 @@ class RAGAnythingConfig:
     )
     """Enable equation content processing."""
 
+    enable_caption_cache: bool = field(
+        default=get_env_value("ENABLE_CAPTION_CACHE", True, bool)
+    )
+    """Reuse model responses for identical images, tables and equations with identical surrounding context, e.g. on re-ingest."""
+
+    enable_image_dedup: bool = field(
+        default=get_env_value("ENABLE_IMAGE_DEDUP", False, bool)
+    )
+    """Caption near-duplicate images of a document once, matched by perceptual hash (requires Pillow)."""
+
+    image_dedup_threshold: int = field(
+        default=get_env_value("IMAGE_DEDUP_THRESHOLD", 10, int)
+    )
+    """Maximum Hamming distance between 256-bit perceptual hashes for images to count as duplicates."""
+
+    enable_image_filter: bool = field(
+        default=get_env_value("ENABLE_IMAGE_FILTER", False, bool)
+    )
+    """Skip uncaptioned decorative images (tiny crops, icons, blank or near-uniform images) before captioning (requires Pillow)."""
+
+    image_filter_min_side: int = field(
+        default=get_env_value("IMAGE_FILTER_MIN_SIDE", 32, int)
+    )
+    """Images narrower or shorter than this many pixels are treated as decorative."""
+
+    image_filter_min_area: int = field(
+        default=get_env_value("IMAGE_FILTER_MIN_AREA", 4096, int)
+    )
+    """Images with fewer pixels (width * height) are treated as decorative."""
+
+    image_filter_min_entropy: float = field(
+        default=get_env_value("IMAGE_FILTER_MIN_ENTROPY", 0.05, float)
+    )
+    """Images with lower grayscale histogram entropy (bits) are treated as decorative."""
+
+    image_filter_min_stddev: float = field(
+        default=get_env_value("IMAGE_FILTER_MIN_STDDEV", 4.0, float)
+    )
+    """Images with lower grayscale standard deviation (near-uniform colour) are treated as decorative."""
+
+    enable_batch_image_captioning: bool = field(
+        default=get_env_value("ENABLE_BATCH_IMAGE_CAPTIONING", False, bool)
+    )
+    """Describe images of the same page with one multi-image request (vision model must accept `messages`)."""
+
+    image_caption_batch_size: int = field(
+        default=get_env_value("IMAGE_CAPTION_BATCH_SIZE", 4, int)
+    )
+    """Maximum number of images per batched captioning request."""
+
+    image_max_long_edge: int = field(
+        default=get_env_value("IMAGE_MAX_LONG_EDGE", 0, int)
+    )
+    """Downscale images whose longer side exceeds this many pixels before sending them to the vision model (0 to disable)."""
+
+    image_encode_format: str = field(
+        default=get_env_value("IMAGE_ENCODE_FORMAT", "original", str)
+    )
+    """Format of images sent to the vision model: 'original', 'jpeg', 'webp' or 'png'."""
+
+    image_encode_quality: int = field(
+        default=get_env_value("IMAGE_ENCODE_QUALITY", 85, int)
+    )
+    """JPEG/WebP quality used when images are recompressed."""
+
+    image_grayscale: bool = field(default=get_env_value("IMAGE_GRAYSCALE", False, bool))
+    """Convert images to grayscale before sending them to the vision model."""
+
+    image_handoff: str = field(default=get_env_value("IMAGE_HANDOFF", "base64", str))
+    """How images reach the vision model: 'base64' (image_data / data URLs) or 'path' (image_path / file:// URLs)."""
+
     # Batch Processing Configuration
     # ---
     max_concurrent_files: int = field(
@@ -72,6 +196,56 @@ class RAGAnythingConfig:
     )
     """Whether to recursively process subfolders in batch mode."""
 
+    enable_bulk_ingest: bool = field(
+        default=get_env_value("ENABLE_BULK_INGEST", False, bool)
+    )
+    """Run process_folder_complete in a bulk ingest session that defers per-document storage flushes."""
+
+    bulk_flush_documents: int = field(
+        default=get_env_value("BULK_FLUSH_DOCUMENTS", 20, int)
+    )
+    """Persist storages after this many documents during a bulk ingest session (0 to disable)."""
+
+    bulk_flush_interval: float = field(
+        default=get_env_value("BULK_FLUSH_INTERVAL", 300.0, float)
+    )
+    """Persist storages when this many seconds passed since the last flush during a bulk ingest session (0 to disable)."""
+
+    enable_pipeline_processing: bool = field(
+        default=get_env_value("ENABLE_PIPELINE_PROCESSING", False, bool)
+    )
+    """Process folders with a staged pipeline so parsing, text insertion, captioning, entity extraction and merging of different documents overlap."""
+
+    pipeline_parse_workers: int = field(
+        default=get_env_value("PIPELINE_PARSE_WORKERS", 2, int)
+    )
+    """Number of documents parsed concurrently by the pipeline."""
+
+    pipeline_text_workers: int = field(
+        default=get_env_value("PIPELINE_TEXT_WORKERS", 1, int)
+    )
+    """Number of documents whose text is inserted into LightRAG concurrently by the pipeline."""
+
+    pipeline_caption_workers: int = field(
+        default=get_env_value("PIPELINE_CAPTION_WORKERS", 2, int)
+    )
+    """Number of documents whose multimodal items are captioned concurrently by the pipeline."""
+
+    pipeline_extract_workers: int = field(
+        default=get_env_value("PIPELINE_EXTRACT_WORKERS", 2, int)
+    )
+    """Number of documents whose multimodal entities are extracted concurrently by the pipeline."""
+
+    pipeline_merge_workers: int = field(
+        default=get_env_value("PIPELINE_MERGE_WORKERS", 1, int)
+    )
+    """Number of documents merged into the knowledge graph concurrently by the pipeline."""
+
+    pipeline_queue_size: int = field(
+        default=get_env_value("PIPELINE_QUEUE_SIZE", 2, int)
+    )
+    """Maximum number of documents waiting in front of each pipeline stage."""
+
     # Context Extraction Configuration
     # ---
     context_window: int = field(default=get_env_value("CONTEXT_WINDOW", 1, int))
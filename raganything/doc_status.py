@@ -0,0 +1,211 @@
+"""
+Per-Document doc_status Transactions
+
+Multimodal processing of a document reads and updates its doc_status record
+several times (status check, chunk list update, completion flag). Each update
+used to end with `index_done_callback`, which persists the whole doc_status
+store. `DocStatusTransaction` collects the changes and commits them with a
+single upsert and flush.
+
+Only the changes are collected, not the record: LightRAG may still update the
+record (e.g. mark the text as PROCESSED) while multimodal content is being
+processed, so the commit re-reads the record and applies the changes on top.
+
+Commits are journaled: the final record is written to a journal file before
+it is sent to the storage and removed once the storage has persisted it.
+`recover_doc_status_journal` replays journal files left behind by a crash.
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from lightrag.utils import logger
+
+
+def _journal_path(journal_dir: Path, doc_id: str) -> Path:
+    return journal_dir / f"{hashlib.md5(doc_id.encode()).hexdigest()}.json"
+
+
+class DocStatusTransaction:
+    """
+    Accumulates doc_status changes of one document and commits them with one write
+
+    Changes are only applied if the document has a doc_status record when they
+    are committed, matching the behaviour of updating the record directly.
+
+    Example:
+        transaction = DocStatusTransaction(lightrag.doc_status, doc_id, journal_dir)
+        record = await transaction.get()
+        await transaction.add_chunks(chunk_ids)
+        await transaction.update(multimodal_processed=True)
+        await transaction.commit()
+    """
+
+    def __init__(
+        self,
+        storage,
+        doc_id: str,
+        journal_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize doc_status transaction
+
+        Args:
+            storage: LightRAG doc_status storage
+            doc_id: Document ID
+            journal_dir: Directory for the commit journal, None disables journaling
+        """
+        self.storage = storage
+        self.doc_id = doc_id
+        self.journal_dir = Path(journal_dir) if journal_dir else None
+        # Record as read by get(), without pending changes
+        self._record: Optional[Dict[str, Any]] = None
+        self._loaded = False
+        # Pending changes, applied to the current record on commit
+        self._chunk_ids: List[str] = []
+        self._fields: Dict[str, Any] = {}
+
+    def _apply(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of the record with the pending changes applied"""
+        record = {**record, **self._fields}
+        if self._chunk_ids:
+            record["chunks_list"] = record.get("chunks_list", []) + self._chunk_ids
+            record["chunks_count"] = record.get("chunks_count", 0) + len(
+                self._chunk_ids
+            )
+        return record
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the document's record including pending changes
+
+        The record is read once; use it for decisions, not as the base of writes.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record, None if the document has no doc_status
+        """
+        if not self._loaded:
+            record = await self.storage.get_by_id(self.doc_id)
+            self._record = dict(record) if record else None
+            self._loaded = True
+        if self._record is None:
+            return None
+        return self._apply(self._record)
+
+    async def add_chunks(self, chunk_ids: List[str]) -> None:
+        """
+        Append chunks to the document's chunks_list and chunks_count
+
+        Args:
+            chunk_ids: IDs of the chunks to add
+        """
+        self._chunk_ids.extend(chunk_ids)
+
+    async def update(self, **fields: Any) -> None:
+        """
+        Set fields of the document's record
+
+        Args:
+            **fields: Fields to set
+        """
+        self._fields.update(fields)
+
+    def _write_journal(self, record: Dict[str, Any]) -> Optional[Path]:
+        """Durably write the record to be committed, returns the journal file"""
+        if self.journal_dir is None:
+            return None
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        journal_path = _journal_path(self.journal_dir, self.doc_id)
+        tmp_path = journal_path.with_name(f".{journal_path.name}.{uuid.uuid4().hex}")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"doc_id": self.doc_id, "record": record}, f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, journal_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return journal_path
+
+    async def commit(self, flush: bool = True) -> bool:
+        """
+        Apply the accumulated changes to the current record and write it with one
+        upsert and one flush
+
+        Args:
+            flush: Persist the storage now. Without a flush the record is only
+                upserted and persisted by the caller's next flush, so no journal is written.
+
+        Returns:
+            bool: True if changes were written, False if there was nothing to commit
+        """
+        if not self._chunk_ids and not self._fields:
+            return False
+
+        # Re-read right before writing so concurrent updates by LightRAG are kept
+        current = await self.storage.get_by_id(self.doc_id)
+        if not current:
+            return False
+
+        record = {
+            **self._apply(current),
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        }
+        if not flush:
+            await self.storage.upsert({self.doc_id: record})
+        else:
+            journal_path = self._write_journal(record)
+
+            await self.storage.upsert({self.doc_id: record})
+            await self.storage.index_done_callback()
+
+            if journal_path is not None:
+                journal_path.unlink(missing_ok=True)
+        self._record = record
+        self._loaded = True
+        self._chunk_ids = []
+        self._fields = {}
+        return True
+
+
+async def recover_doc_status_journal(storage, journal_dir: Union[str, Path]) -> int:
+    """
+    Replay doc_status commits that were journaled but not confirmed persisted
+
+    Args:
+        storage: LightRAG doc_status storage
+        journal_dir: Journal directory used by DocStatusTransaction
+
+    Returns:
+        int: Number of replayed records
+    """
+    journal_dir = Path(journal_dir)
+    if not journal_dir.is_dir():
+        return 0
+
+    entries = {}
+    journal_files = []
+    for journal_path in sorted(journal_dir.glob("*.json")):
+        try:
+            entry = json.loads(journal_path.read_text(encoding="utf-8"))
+            entries[entry["doc_id"]] = entry["record"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(
+                f"Skipping unreadable doc_status journal {journal_path}: {e}"
+            )
+        journal_files.append(journal_path)
+
+    if entries:
+        await storage.upsert(entries)
+        await storage.index_done_callback()
+        logger.info(f"Recovered {len(entries)} doc_status records from journal")
+
+    # Journal files and partial writes interrupted by the crash
+    for journal_path in journal_files + list(journal_dir.glob(".*")):
+        journal_path.unlink(missing_ok=True)
+    return len(entries)
@@ -0,0 +1,185 @@
+"""
+Batched Knowledge Graph Writes
+
+Multimodal processing creates one main entity node per item plus belongs_to
+edges. Writing them one `upsert_node`/`upsert_edge` call at a time costs a
+round trip per item on graph backends with per-call I/O (e.g. Neo4j). This
+module groups those writes:
+
+- `upsert_nodes` / `upsert_edges` write a group with the backend's native
+  `upsert_nodes_batch` / `upsert_edges_batch` when it implements them, otherwise
+  with bounded concurrent single upserts
+- `buffered_graph_writes` collects the writes made while processing a document
+  and flushes them in bulk when the document is done
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from lightrag.utils import logger
+
+# Concurrent single upserts used when the backend has no native batch operation
+_FALLBACK_CONCURRENCY = 8
+
+_active_buffer: ContextVar[Optional["GraphWriteBuffer"]] = ContextVar(
+    "graph_write_buffer", default=None
+)
+
+
+def _has_native_batch(graph, method_name: str) -> bool:
+    """Check whether the graph storage overrides a batch method of BaseGraphStorage"""
+    method = getattr(type(graph), method_name, None)
+    if method is None:
+        return False
+    try:
+        from lightrag.base import BaseGraphStorage
+    except ImportError:
+        return True
+    return method is not getattr(BaseGraphStorage, method_name, None)
+
+
+async def _gather_limited(coroutines: List, limit: int) -> None:
+    """Await coroutines concurrently with at most `limit` in flight"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine):
+        async with semaphore:
+            await coroutine
+
+    await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+
+async def upsert_nodes(graph, nodes: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Insert or update a group of nodes with as few backend calls as possible
+
+    Args:
+        graph: Graph storage instance
+        nodes: List of (node_id, node_data) tuples
+    """
+    if not nodes:
+        return
+    if _has_native_batch(graph, "upsert_nodes_batch"):
+        await graph.upsert_nodes_batch(nodes)
+        return
+    await _gather_limited(
+        [graph.upsert_node(node_id, node_data) for node_id, node_data in nodes],
+        _FALLBACK_CONCURRENCY,
+    )
+
+
+async def upsert_edges(graph, edges: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """
+    Insert or update a group of edges with as few backend calls as possible
+
+    Args:
+        graph: Graph storage instance
+        edges: List of (source_node_id, target_node_id, edge_data) tuples
+    """
+    if not edges:
+        return
+    if _has_native_batch(graph, "upsert_edges_batch"):
+        await graph.upsert_edges_batch(edges)
+        return
+    await _gather_limited(
+        [graph.upsert_edge(source, target, data) for source, target, data in edges],
+        _FALLBACK_CONCURRENCY,
+    )
+
+
+class GraphWriteBuffer:
+    """
+    Collects node and edge writes for one graph and flushes them in bulk
+
+    Repeated writes of the same node or edge keep the last data, matching the
+    result of upserting them one after another. Nodes are flushed before edges
+    so edge endpoints exist.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add_node(self, node_id: str, node_data: Dict[str, Any]) -> None:
+        self.nodes.pop(node_id, None)
+        self.nodes[node_id] = node_data
+
+    def add_edge(self, source: str, target: str, edge_data: Dict[str, Any]) -> None:
+        self.edges.pop((source, target), None)
+        self.edges[(source, target)] = edge_data
+
+    async def flush(self) -> None:
+        """Write all pending nodes and edges"""
+        nodes, self.nodes = list(self.nodes.items()), {}
+        edges, self.edges = self.edges, {}
+        await upsert_nodes(self.graph, nodes)
+        await upsert_edges(
+            self.graph,
+            [(source, target, data) for (source, target), data in edges.items()],
+        )
+        if nodes or edges:
+            logger.debug(f"Flushed {len(nodes)} nodes and {len(edges)} edges to graph")
+
+
+async def write_nodes(graph, nodes: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Write nodes to the active buffer of the graph, or directly in bulk if none is active
+
+    Args:
+        graph: Graph storage instance
+        nodes: List of (node_id, node_data) tuples
+    """
+    buffer = _active_buffer.get()
+    if buffer is not None and buffer.graph is graph:
+        for node_id, node_data in nodes:
+            buffer.add_node(node_id, node_data)
+        return
+    await upsert_nodes(graph, nodes)
+
+
+async def write_edges(graph, edges: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """
+    Write edges to the active buffer of the graph, or directly in bulk if none is active
+
+    Args:
+        graph: Graph storage instance
+        edges: List of (source_node_id, target_node_id, edge_data) tuples
+    """
+    buffer = _active_buffer.get()
+    if buffer is not None and buffer.graph is graph:
+        for source, target, edge_data in edges:
+            buffer.add_edge(source, target, edge_data)
+        return
+    await upsert_edges(graph, edges)
+
+
+@asynccontextmanager
+async def buffered_graph_writes(graph) -> AsyncIterator[GraphWriteBuffer]:
+    """
+    Buffer `write_nodes`/`write_edges` calls for a graph and flush them on exit
+
+    The buffer is bound to the current task context, so documents processed
+    concurrently each get their own buffer. Nested scopes for the same graph
+    reuse the outer buffer.
+
+    Args:
+        graph: Graph storage instance
+
+    Yields:
+        GraphWriteBuffer: The active buffer
+    """
+    outer = _active_buffer.get()
+    if outer is not None and outer.graph is graph:
+        yield outer
+        return
+
+    buffer = GraphWriteBuffer(graph)
+    token = _active_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _active_buffer.reset(token)
+        await buffer.flush()
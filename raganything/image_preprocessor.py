@@ -0,0 +1,231 @@
+"""
+Image Preprocessing for Vision Model Requests
+
+This module shrinks images before they are base64-encoded for the vision model:
+oversized images are downscaled to a maximum long edge and can be recompressed
+as JPEG/WebP or converted to grayscale. Processed images are cached on disk by
+source content hash and settings, so repeated captioning and queries of the
+same image reuse the processed bytes instead of decoding and resizing again.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import uuid
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from raganything.utils import compute_file_content_hash, guess_image_mime_type
+
+# Pillow save format and file extension of each output format
+_FORMATS = {"jpeg": ("JPEG", "jpg"), "webp": ("WEBP", "webp"), "png": ("PNG", "png")}
+
+
+def _format_mime_type(image_format: Optional[str], image_path: Path) -> str:
+    """MIME type of a Pillow image format, falling back to the file extension"""
+    if image_format:
+        from PIL import Image
+
+        if image_format.upper() not in Image.MIME:
+            # Formats register their MIME type when their plugin is loaded
+            Image.init()
+        mime_type = Image.MIME.get(image_format.upper())
+        if mime_type:
+            return mime_type
+    return guess_image_mime_type(str(image_path))
+
+
+class ImagePreprocessor:
+    """
+    Downscale and recompress images for vision model payloads
+
+    Images that already fit the limits are passed through unchanged when the
+    format is "original" and grayscale conversion is off.
+
+    Example:
+        preprocessor = ImagePreprocessor(max_long_edge=1568, image_format="jpeg")
+        image_base64 = preprocessor.encode_base64("figure.png")
+    """
+
+    def __init__(
+        self,
+        max_long_edge: int = 2048,
+        image_format: str = "original",
+        quality: int = 85,
+        grayscale: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize image preprocessor
+
+        Args:
+            max_long_edge: Maximum length of the longer image side in pixels, 0 disables downscaling
+            image_format: Output format: "original" (keep the source format), "jpeg", "webp" or "png"
+            quality: JPEG/WebP quality (1-100)
+            grayscale: Convert images to grayscale
+            cache_dir: Directory caching processed images, None disables the disk cache
+        """
+        image_format = image_format.lower()
+        if image_format != "original" and image_format not in _FORMATS:
+            raise ValueError(
+                f"Unsupported image format: {image_format}. "
+                f"Use 'original' or one of {sorted(_FORMATS)}"
+            )
+
+        self.max_long_edge = max_long_edge
+        self.image_format = image_format
+        self.quality = quality
+        self.grayscale = grayscale
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.logger = logging.getLogger(__name__)
+
+    def settings_tag(self) -> str:
+        """Short hash of the settings, part of the cache file name"""
+        settings = (
+            f"{self.max_long_edge}|{self.image_format}|{self.quality}|{self.grayscale}"
+        )
+        return hashlib.md5(settings.encode()).hexdigest()[:8]
+
+    def _process(
+        self, image_path: Path, source_hash: Optional[str] = None
+    ) -> Tuple[Union[Path, bytes], str]:
+        """
+        Process an image according to the settings
+
+        Args:
+            image_path: Path to the image file
+            source_hash: SHA-256 of the image file if already known, names the cache file
+
+        Returns:
+            Tuple[Union[Path, bytes], str]: The source path when no processing is needed,
+            the cached file when a cache directory is set, otherwise the processed bytes;
+            and the MIME type of that image
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            self.logger.debug("Pillow not installed, sending images unprocessed")
+            return image_path, guess_image_mime_type(str(image_path))
+
+        with Image.open(image_path) as img:
+            long_edge = max(img.size)
+            needs_resize = 0 < self.max_long_edge < long_edge
+            if not (needs_resize or self.grayscale or self.image_format != "original"):
+                return image_path, _format_mime_type(img.format, image_path)
+
+            if self.image_format == "original":
+                save_format = img.format or "PNG"
+                extension = save_format.lower()
+            else:
+                save_format, extension = _FORMATS[self.image_format]
+            mime_type = _format_mime_type(save_format, image_path)
+
+            cache_path = None
+            if self.cache_dir:
+                if source_hash is None:
+                    source_hash = compute_file_content_hash(str(image_path))
+                cache_path = (
+                    self.cache_dir / f"{source_hash}_{self.settings_tag()}.{extension}"
+                )
+                if cache_path.exists():
+                    return cache_path, mime_type
+
+            if needs_resize:
+                scale = self.max_long_edge / long_edge
+                img.draft(
+                    img.mode, (round(img.width * scale), round(img.height * scale))
+                )
+                processed = img.copy()
+                processed.thumbnail(
+                    (self.max_long_edge, self.max_long_edge), Image.Resampling.LANCZOS
+                )
+            else:
+                processed = img.copy()
+
+        if self.grayscale:
+            processed = processed.convert("L")
+        elif save_format == "JPEG" and processed.mode not in ("RGB", "L"):
+            processed = processed.convert("RGB")
+
+        save_kwargs = {}
+        if save_format in ("JPEG", "WEBP"):
+            save_kwargs["quality"] = self.quality
+        elif save_format == "PNG":
+            save_kwargs["optimize"] = True
+
+        if cache_path is None:
+            buffer = BytesIO()
+            processed.save(buffer, format=save_format, **save_kwargs)
+            return buffer.getvalue(), mime_type
+
+        # Write under a unique name first so concurrent writers never expose partial files
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            processed.save(tmp_path, format=save_format, **save_kwargs)
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self.logger.debug(
+            f"Preprocessed {image_path.name}: {image_path.stat().st_size} -> "
+            f"{cache_path.stat().st_size} bytes"
+        )
+        return cache_path, mime_type
+
+    def prepare(self, image_path: Union[str, Path]) -> Tuple[bytes, str]:
+        """
+        Get the bytes to send to the vision model for an image
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Tuple[bytes, str]: Processed image bytes, or the original bytes when no
+            processing is needed, and their MIME type
+        """
+        result, mime_type = self._process(Path(image_path))
+        if not isinstance(result, bytes):
+            result = result.read_bytes()
+        return result, mime_type
+
+    def prepare_path(
+        self, image_path: Union[str, Path], source_hash: Optional[str] = None
+    ) -> Path:
+        """
+        Get the file to hand to the vision model for an image
+
+        Processed images are only materialized in the disk cache, so without a
+        cache directory the original file is returned unprocessed.
+
+        Args:
+            image_path: Path to the image file
+            source_hash: SHA-256 of the image file if already known, avoids hashing it again
+
+        Returns:
+            Path: Processed image in the cache, or the original file when no processing is needed
+        """
+        image_path = Path(image_path)
+        if self.cache_dir is None:
+            return image_path
+        result, _ = self._process(image_path, source_hash)
+        return image_path if isinstance(result, bytes) else result
+
+    def encode_base64(self, image_path: Union[str, Path]) -> str:
+        """
+        Preprocess an image and encode it to base64
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            str: Base64 encoded string, empty string if encoding fails
+        """
+        try:
+            image_bytes, _ = self.prepare(image_path)
+            return base64.b64encode(image_bytes).decode("utf-8")
+        except Exception as e:
+            self.logger.error(f"Failed to encode image {image_path}: {e}")
+            return ""
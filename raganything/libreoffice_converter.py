@@ -0,0 +1,210 @@
+"""
+Profile-Isolated LibreOffice Batch Converter
+
+This module converts many Office documents to PDF with a bounded number of
+concurrent headless LibreOffice runs. Nothing stays resident between calls:
+every run starts a fresh soffice process, which converts its whole share of
+the batch in a single invocation, so process startup is paid once per run
+rather than once per file. Each concurrent run uses its own user profile
+directory, so runs never collide on the shared default profile, and a profile
+is initialized once and then reused by later runs.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from raganything.parser import bind_command_scope, run_command
+
+LIBREOFFICE_INSTALL_HINT = (
+    "Please ensure LibreOffice is installed:\n"
+    "- Windows: Download from https://www.libreoffice.org/download/download/\n"
+    "- macOS: brew install --cask libreoffice\n"
+    "- Ubuntu/Debian: sudo apt-get install libreoffice\n"
+    "- CentOS/RHEL: sudo yum install libreoffice\n"
+    "Alternatively, convert the document to PDF manually."
+)
+
+
+class LibreOfficeBatchConverter:
+    """
+    Batch converter running headless LibreOffice with dedicated profile directories
+
+    Example:
+        converter = LibreOfficeBatchConverter(max_processes=2)
+        pdf_paths = converter.convert_batch(["a.docx", "b.pptx"], "./pdf_output")
+    """
+
+    _shared: Optional["LibreOfficeBatchConverter"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_processes: int = 2,
+        profile_root: Optional[Union[str, Path]] = None,
+        timeout_per_file: float = 60.0,
+    ):
+        """
+        Initialize LibreOffice batch converter
+
+        Args:
+            max_processes: Number of LibreOffice processes that may run concurrently
+            profile_root: Directory holding the per-process profiles (defaults to a temp directory)
+            timeout_per_file: Conversion timeout in seconds for each file of a run
+        """
+        self.max_processes = max(1, max_processes)
+        self.timeout_per_file = timeout_per_file
+        self.logger = logging.getLogger(__name__)
+
+        if profile_root:
+            self.profile_root = Path(profile_root)
+        else:
+            self.profile_root = (
+                Path(tempfile.gettempdir()) / f"raganything_libreoffice_{os.getpid()}"
+            )
+
+        # Idle profile directories, a conversion holds one for its whole run
+        self._profiles: "queue.Queue[Path]" = queue.Queue()
+        for i in range(self.max_processes):
+            self._profiles.put(self.profile_root / f"profile_{i}")
+
+        self._executable: Optional[str] = None
+
+    @classmethod
+    def shared(cls) -> "LibreOfficeBatchConverter":
+        """
+        Get the process-wide converter used by `Parser.convert_office_batch_to_pdf`
+
+        The number of concurrent processes is read from the LIBREOFFICE_BATCH_PROCESSES
+        environment variable (default: 2).
+
+        Returns:
+            LibreOfficeBatchConverter: Shared converter instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                converter = cls(
+                    max_processes=int(os.getenv("LIBREOFFICE_BATCH_PROCESSES", "2"))
+                )
+                atexit.register(
+                    shutil.rmtree, converter.profile_root, ignore_errors=True
+                )
+                cls._shared = converter
+            return cls._shared
+
+    def _get_executable(self) -> str:
+        """Resolve the LibreOffice executable once"""
+        if self._executable is None:
+            for cmd in ["libreoffice", "soffice"]:
+                executable = shutil.which(cmd)
+                if executable:
+                    self._executable = executable
+                    break
+            else:
+                raise RuntimeError(
+                    f"LibreOffice command not found. {LIBREOFFICE_INSTALL_HINT}"
+                )
+        return self._executable
+
+    def _run_conversion(self, doc_paths: List[Path], output_dir: Path) -> None:
+        """Convert files to PDF with one LibreOffice invocation using an idle profile"""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        executable = self._get_executable()
+
+        # Stale PDFs from earlier runs would mask a failed conversion
+        for doc_path in doc_paths:
+            (output_dir / f"{doc_path.stem}.pdf").unlink(missing_ok=True)
+
+        profile_dir = self._profiles.get()
+        try:
+            cmd = [
+                executable,
+                f"-env:UserInstallation={profile_dir.resolve().as_uri()}",
+                "--headless",
+                "--norestore",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(output_dir),
+                *[str(doc_path) for doc_path in doc_paths],
+            ]
+            self.logger.info(
+                f"Converting {len(doc_paths)} file(s) to PDF using LibreOffice "
+                f"({profile_dir.name})..."
+            )
+            result = run_command(cmd, timeout=self.timeout_per_file * len(doc_paths))
+            if result.returncode != 0:
+                self.logger.warning(f"LibreOffice conversion failed: {result.stderr}")
+        finally:
+            self._profiles.put(profile_dir)
+
+    def convert_batch(
+        self, doc_paths: List[Union[str, Path]], output_dir: Union[str, Path]
+    ) -> Dict[str, Path]:
+        """
+        Convert many Office documents to PDF, spreading them over concurrent processes
+
+        Each process converts its share of the files in a single invocation.
+        Files sharing a name are written to separate subdirectories of output_dir.
+
+        Args:
+            doc_paths: Paths to the Office documents
+            output_dir: Base directory receiving the PDF files
+
+        Returns:
+            Dict[str, Path]: Generated PDF path for each successfully converted input path
+        """
+        output_dir = Path(output_dir)
+        doc_paths = [Path(doc_path) for doc_path in doc_paths]
+
+        # Group by occurrence of each file name so no job writes the same PDF twice
+        groups: List[List[Path]] = []
+        seen_stems: Dict[str, int] = {}
+        for doc_path in doc_paths:
+            occurrence = seen_stems.get(doc_path.stem, 0)
+            seen_stems[doc_path.stem] = occurrence + 1
+            if occurrence == len(groups):
+                groups.append([])
+            groups[occurrence].append(doc_path)
+
+        jobs = []
+        for group_index, group in enumerate(groups):
+            group_dir = (
+                output_dir if group_index == 0 else output_dir / str(group_index)
+            )
+            for i in range(self.max_processes):
+                chunk = group[i :: self.max_processes]
+                if chunk:
+                    jobs.append((chunk, group_dir))
+
+        with ThreadPoolExecutor(max_workers=self.max_processes) as executor:
+            futures = [
+                executor.submit(
+                    bind_command_scope(self._run_conversion), chunk, group_dir
+                )
+                for chunk, group_dir in jobs
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"LibreOffice batch run failed: {e}")
+
+        results = {}
+        for chunk, group_dir in jobs:
+            for doc_path in chunk:
+                pdf_path = group_dir / f"{doc_path.stem}.pdf"
+                if pdf_path.exists():
+                    results[str(doc_path)] = pdf_path
+                else:
+                    self.logger.error(f"LibreOffice did not convert {doc_path}")
+
+        self.logger.info(f"Converted {len(results)}/{len(doc_paths)} documents to PDF")
+        return results
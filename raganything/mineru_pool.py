@@ -0,0 +1,455 @@
+"""
+Persistent MinerU Worker Pool
+
+This module keeps MinerU models loaded in long-lived worker processes, so parse
+jobs skip the model loading that every `mineru` CLI invocation pays again.
+Jobs are sent to idle workers over pipes and produce the same output layout as
+the CLI, so results are read back with `MineruParser._read_output_files`.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from raganything.parser import on_command_cancel
+
+
+def _run_parse_job(
+    do_parse,
+    read_fn,
+    input_path: str,
+    output_dir: str,
+    method: str = "auto",
+    lang: Optional[str] = None,
+    backend: Optional[str] = None,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    formula: bool = True,
+    table: bool = True,
+    vlm_url: Optional[str] = None,
+) -> None:
+    """Run a single parse job with MinerU's Python API, mirroring the CLI defaults"""
+    input_path = Path(input_path)
+    do_parse(
+        output_dir=output_dir,
+        pdf_file_names=[input_path.stem],
+        pdf_bytes_list=[read_fn(input_path)],
+        p_lang_list=[lang or "ch"],
+        backend=backend or "pipeline",
+        parse_method=method,
+        formula_enable=formula,
+        table_enable=table,
+        server_url=vlm_url,
+        start_page_id=start_page or 0,
+        end_page_id=end_page,
+    )
+
+
+def _worker_main(
+    conn, device: Optional[str] = None, source: Optional[str] = None
+) -> None:
+    """Worker process loop, runs parse jobs received over the pipe until None arrives"""
+    # The CLI passes these settings to the model loaders through the environment.
+    # Models are loaded once per worker, so they are fixed for the worker's lifetime.
+    if device:
+        os.environ["MINERU_DEVICE_MODE"] = device
+    if source:
+        os.environ["MINERU_MODEL_SOURCE"] = source
+
+    try:
+        from mineru.cli.common import do_parse, read_fn
+
+        import_error = None
+    except ImportError as e:
+        import_error = (
+            f"MinerU Python API is not available ({e}). "
+            "Please install it with: pip install -U 'mineru[core]'"
+        )
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        job_id, params = job
+        if import_error:
+            conn.send((job_id, import_error))
+            continue
+
+        try:
+            _run_parse_job(do_parse, read_fn, **params)
+            conn.send((job_id, None))
+        except Exception as e:
+            conn.send((job_id, f"{type(e).__name__}: {e}"))
+
+
+class _WorkerHandle:
+    """Parent-side handle of a worker process and the job assigned to it"""
+
+    __slots__ = ("process", "conn", "job_id", "terminated")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.job_id: Optional[int] = None
+        # Set when the worker was terminated and only awaits replacement
+        self.terminated = False
+
+
+class MineruWorkerPool:
+    """
+    Pool of long-lived MinerU worker processes
+
+    Workers load MinerU models on their first job and keep them in memory for
+    subsequent jobs. The pool is thread-safe: jobs may be submitted from several
+    threads and are processed by up to `num_workers` processes concurrently.
+    A worker that crashes fails its current job and is replaced. A job that
+    times out or is cancelled is withdrawn, and the worker running it is
+    terminated and replaced.
+
+    Example:
+        with MineruWorkerPool(num_workers=2) as pool:
+            parser = MineruParser(worker_pool=pool)
+            content_list = parser.parse_pdf("document.pdf", output_dir="./output")
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 1,
+        device: Optional[str] = None,
+        source: Optional[str] = None,
+    ):
+        """
+        Initialize worker pool (processes are started lazily on first use)
+
+        Args:
+            num_workers: Number of worker processes
+            device: Inference device the workers load models on (defaults to MinerU's choice)
+            source: Model source the workers load models from (defaults to MinerU's choice)
+        """
+        self.num_workers = max(1, num_workers)
+        self.device = device
+        self.source = source
+        self.logger = logging.getLogger(__name__)
+
+        # Spawn avoids inheriting CUDA state and locks from the parent process
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[_WorkerHandle] = []
+        self._pending: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._futures: Dict[int, Future] = {}
+        self._job_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._collector: Optional[threading.Thread] = None
+        self._closing = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether worker processes have been started"""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start worker processes and the result collector thread"""
+        with self._lock:
+            if self._workers:
+                return
+
+            self._closing = False
+            self._workers = [self._start_worker() for _ in range(self.num_workers)]
+            self._collector = threading.Thread(
+                target=self._collect_results, name="mineru-pool-collector", daemon=True
+            )
+            self._collector.start()
+
+        self.logger.info(f"Started MinerU worker pool with {self.num_workers} workers")
+
+    def _start_worker(self) -> _WorkerHandle:
+        """Start a single worker process"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.device, self.source),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerHandle(process, parent_conn)
+
+    def _dispatch(self, worker: _WorkerHandle) -> None:
+        """Send the next pending job to an idle worker (caller holds the lock)"""
+        if worker.job_id is not None or worker.terminated or not self._pending:
+            return
+        job_id, params = self._pending.popleft()
+        worker.job_id = job_id
+        worker.conn.send((job_id, params))
+
+    def _finish_job(self, job_id: Optional[int], error: Optional[str]) -> None:
+        """Resolve the future of a finished job"""
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+        if future is None:
+            return
+        if error:
+            future.set_exception(RuntimeError(f"MinerU worker job failed: {error}"))
+        else:
+            future.set_result(None)
+
+    def _collect_results(self) -> None:
+        """Resolve job futures from worker results and replace crashed workers"""
+        while True:
+            with self._lock:
+                if self._closing:
+                    return
+                workers = list(self._workers)
+
+            ready = set(
+                wait(
+                    [w.conn for w in workers] + [w.process.sentinel for w in workers],
+                    timeout=1.0,
+                )
+            )
+
+            for worker in workers:
+                if worker.conn in ready:
+                    try:
+                        job_id, error = worker.conn.recv()
+                    except (EOFError, OSError):
+                        # Pipe closed because the worker process died
+                        self._replace_worker(worker)
+                        continue
+                    with self._lock:
+                        worker.job_id = None
+                        if not self._closing:
+                            self._dispatch(worker)
+                    self._finish_job(job_id, error)
+
+                elif worker.process.sentinel in ready:
+                    self._replace_worker(worker)
+
+    def _replace_worker(self, worker: _WorkerHandle) -> None:
+        """Fail the job of a worker that died and start a replacement"""
+        worker.process.join()
+        with self._lock:
+            if self._closing or worker not in self._workers:
+                return
+            job_id = worker.job_id
+            replacement = self._start_worker()
+            self._workers[self._workers.index(worker)] = replacement
+            self._dispatch(replacement)
+
+        worker.conn.close()
+        self.logger.warning(
+            f"MinerU worker {worker.process.pid} exited with code "
+            f"{worker.process.exitcode}, restarted"
+        )
+        if job_id is not None:
+            self._finish_job(
+                job_id, f"worker exited with code {worker.process.exitcode}"
+            )
+
+    def accepts(
+        self, device: Optional[str] = None, source: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether jobs with the given model settings can run on this pool
+
+        Args:
+            device: Inference device requested by the job
+            source: Model source requested by the job
+
+        Returns:
+            bool: True if each setting is unset or matches the pool's setting
+        """
+        return (device is None or device == self.device) and (
+            source is None or source == self.source
+        )
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Withdraw a submitted job, terminating the worker if it is already running
+
+        The terminated worker is replaced by the result collector.
+
+        Args:
+            future: Future returned by `submit`
+
+        Returns:
+            bool: True if the job was withdrawn, False if it had already finished
+        """
+        with self._lock:
+            job_id = next(
+                (job_id for job_id, f in self._futures.items() if f is future), None
+            )
+            if job_id is None:
+                return False
+            del self._futures[job_id]
+
+            running = None
+            for worker in self._workers:
+                if worker.job_id == job_id:
+                    running = worker
+                    break
+            if running is None:
+                self._pending = deque(job for job in self._pending if job[0] != job_id)
+            else:
+                running.terminated = True
+                running.process.terminate()
+
+        future.cancel()
+        if running is not None:
+            self.logger.info(
+                f"Terminated MinerU worker {running.process.pid} running a withdrawn job"
+            )
+        return True
+
+    def submit(
+        self,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        method: str = "auto",
+        lang: Optional[str] = None,
+        backend: Optional[str] = None,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        formula: bool = True,
+        table: bool = True,
+        device: Optional[str] = None,
+        source: Optional[str] = None,
+        vlm_url: Optional[str] = None,
+    ) -> Future:
+        """
+        Submit a parse job, accepting the same options as `MineruParser._run_mineru_command`
+
+        Args:
+            input_path: Path to input file
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            backend: Parsing backend
+            start_page: Starting page number (0-based)
+            end_page: Ending page number (0-based)
+            formula: Enable formula parsing
+            table: Enable table parsing
+            device: Inference device, must match the pool's device when set
+            source: Model source, must match the pool's source when set
+            vlm_url: When the backend is `vlm-sglang-client`, you need to specify the server_url
+
+        Returns:
+            Future: Resolves to None when the output files are written
+
+        Raises:
+            ValueError: If device or source differ from the settings the workers load models with
+        """
+        if not self.accepts(device, source):
+            raise ValueError(
+                f"MinerU worker pool loads models with device={self.device!r} and "
+                f"source={self.source!r}, job requested device={device!r} and source={source!r}"
+            )
+        self.start()
+
+        future = Future()
+        params = {
+            "input_path": str(input_path),
+            "output_dir": str(output_dir),
+            "method": method,
+            "lang": lang,
+            "backend": backend,
+            "start_page": start_page,
+            "end_page": end_page,
+            "formula": formula,
+            "table": table,
+            "vlm_url": vlm_url,
+        }
+
+        with self._lock:
+            job_id = next(self._job_ids)
+            self._futures[job_id] = future
+            self._pending.append((job_id, params))
+            for worker in self._workers:
+                self._dispatch(worker)
+
+        return future
+
+    def run(
+        self,
+        input_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Submit a parse job and wait for it to finish
+
+        The job is withdrawn when the timeout expires or the enclosing
+        run_cancellable call is cancelled.
+
+        Args:
+            input_path: Path to input file
+            output_dir: Output directory path
+            timeout: Maximum time to wait in seconds, None waits indefinitely
+            **kwargs: Parse options, see `submit`
+
+        Raises:
+            concurrent.futures.TimeoutError: If the timeout expires
+            concurrent.futures.CancelledError: If the job was cancelled
+        """
+        future = self.submit(input_path, output_dir, **kwargs)
+        with on_command_cancel(lambda: self.cancel(future)):
+            try:
+                future.result(timeout=timeout)
+            except FutureTimeoutError:
+                self.cancel(future)
+                raise
+
+    def close(self, timeout: float = 30.0) -> None:
+        """
+        Stop worker processes, failing jobs that have not finished
+
+        Args:
+            timeout: Time to wait for each worker to finish its current job before terminating it
+        """
+        with self._lock:
+            if not self._workers:
+                return
+            self._closing = True
+            workers = self._workers
+            self._workers = []
+            self._pending.clear()
+
+        self._collector.join()
+
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout=timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+        for future in pending:
+            future.set_exception(RuntimeError("MinerU worker pool was closed"))
+
+        self.logger.info("MinerU worker pool closed")
+
+    def __enter__(self) -> "MineruWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -11,9 +11,15 @@ Includes:
 
 import re
 import json
+import asyncio
 import time
+import heapq
 import base64
-from typing import Dict, Any, Tuple, List
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Tuple, List, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -22,12 +28,20 @@ from lightrag.utils import (
     compute_mdhash_id,
 )
 from lightrag.lightrag import LightRAG
+from lightrag.base import BaseKVStorage
 from dataclasses import asdict
 from lightrag.kg.shared_storage import get_namespace_data, get_pipeline_status_lock
 from lightrag.operate import extract_entities, merge_nodes_and_edges
 
 # Import prompt templates
 from raganything.prompt import PROMPTS
+from raganything.utils import (
+    compute_file_content_hash,
+    guess_image_mime_type,
+    invoke_model_func,
+)
+from raganything.image_preprocessor import ImagePreprocessor
+from raganything.graph_writer import write_edges, write_nodes
 
 
 @dataclass
@@ -46,6 +60,57 @@ class ContextConfig:
             self.filter_content_types = ["text"]
 
 
+# Number of assembled context strings kept per content source
+_CONTEXT_CACHE_SIZE = 256
+
+# Number of content list indexes kept, documents processed concurrently each need one
+_CONTENT_INDEX_CACHE_SIZE = 8
+
+# (content_source, content_format) used instead of the processor's content source
+_scoped_content_source: ContextVar[Optional[Tuple[Any, str]]] = ContextVar(
+    "content_source", default=None
+)
+
+
+@contextmanager
+def content_source_scope(
+    content_source: Any, content_format: str = "auto"
+) -> Iterator[None]:
+    """Use a content source for context extraction in the current task only
+
+    Unlike `set_content_source`, which changes the content source of a processor
+    for every caller, the scope is bound to the current task context, so
+    documents processed concurrently each extract context from their own content.
+
+    Args:
+        content_source: Source content for context extraction
+        content_format: Format of content source ("minerU", "text_chunks", "auto")
+    """
+    token = _scoped_content_source.set((content_source, content_format))
+    try:
+        yield
+    finally:
+        _scoped_content_source.reset(token)
+
+
+class _ContentIndex:
+    """Context text of a content list, grouped by page for windowed lookups"""
+
+    __slots__ = ("source", "filters", "texts", "pages", "token_counts", "contexts")
+
+    def __init__(self, source: List[Dict], filters: Tuple[str, ...]):
+        self.source = source
+        self.filters = filters
+        # Context text per block, empty for blocks excluded by the filter
+        self.texts: List[str] = []
+        # Page index -> (block position, page index, context text) in content list order
+        self.pages: Dict[int, List[Tuple[int, int, str]]] = {}
+        # (block position, has page marker) -> token count of the context entry
+        self.token_counts: Dict[Tuple[int, bool], int] = {}
+        # LRU of final context strings keyed by window and extraction settings
+        self.contexts: "OrderedDict[Tuple, str]" = OrderedDict()
+
+
 class ContextExtractor:
     """Universal context extractor supporting multiple content source formats"""
 
@@ -58,6 +123,72 @@ class ContextExtractor:
         """
         self.config = config or ContextConfig()
         self.tokenizer = tokenizer
+        # id(content list) -> index, least recently used first
+        self._content_indexes: "OrderedDict[int, _ContentIndex]" = OrderedDict()
+
+    def set_content_source(
+        self, content_source: Any, content_format: str = "auto"
+    ) -> None:
+        """Index a content list once so every context lookup only visits its window
+
+        Indexes are kept for the most recently used content lists and extended when
+        blocks are appended to them, so processors sharing this extractor reuse them.
+
+        Args:
+            content_source: Source content, only MinerU-style content lists are indexed
+            content_format: Format of content source ("minerU", "text_chunks", "auto")
+        """
+        if not isinstance(content_source, list):
+            return
+        if content_format == "minerU" or (
+            content_format == "auto"
+            and all(isinstance(item, dict) for item in content_source)
+        ):
+            self._get_content_index(content_source)
+
+    def _get_content_index(self, content_list: List[Dict]) -> _ContentIndex:
+        """Get the index of a content list, building or extending it as needed
+
+        Args:
+            content_list: List of content items
+
+        Returns:
+            Index covering all blocks of the content list
+        """
+        filters = tuple(self.config.filter_content_types)
+        key = id(content_list)
+        index = self._content_indexes.get(key)
+        if (
+            index is None
+            or index.source is not content_list
+            or index.filters != filters
+            or len(index.texts) > len(content_list)
+        ):
+            index = _ContentIndex(content_list, filters)
+            self._content_indexes[key] = index
+            if len(self._content_indexes) > _CONTENT_INDEX_CACHE_SIZE:
+                self._content_indexes.popitem(last=False)
+        self._content_indexes.move_to_end(key)
+
+        if len(index.texts) < len(content_list):
+            # New blocks may fall into windows of cached contexts
+            index.contexts.clear()
+
+        for position in range(len(index.texts), len(content_list)):
+            item = content_list[position]
+            text_content = ""
+            if item.get("type", "") in self.config.filter_content_types:
+                text_content = self._extract_text_from_item(item)
+                if not (text_content and text_content.strip()):
+                    text_content = ""
+            index.texts.append(text_content)
+            if text_content:
+                item_page = item.get("page_idx", 0)
+                index.pages.setdefault(item_page, []).append(
+                    (position, item_page, text_content)
+                )
+
+        return index
 
     def extract_context(
         self,
@@ -148,27 +279,29 @@ class ContextExtractor:
         start_page = max(0, current_page - window_size)
         end_page = current_page + window_size + 1
 
-        context_texts = []
+        index = self._get_content_index(content_list)
+        cache_key = ("page", start_page, end_page, current_page) + self._settings_key()
+        context = index.contexts.get(cache_key)
+        if context is not None:
+            index.contexts.move_to_end(cache_key)
+            return context
 
-        for item in content_list:
-            item_page = item.get("page_idx", 0)
-            item_type = item.get("type", "")
+        page_entries = [
+            index.pages[item_page]
+            for item_page in range(start_page, end_page)
+            if item_page in index.pages
+        ]
 
-            # Check if item is within context window and matches filter criteria
-            if (
-                start_page <= item_page < end_page
-                and item_type in self.config.filter_content_types
-            ):
-                text_content = self._extract_text_from_item(item)
-                if text_content and text_content.strip():
-                    # Add page marker for better context understanding
-                    if item_page != current_page:
-                        context_texts.append(f"[Page {item_page}] {text_content}")
-                    else:
-                        context_texts.append(text_content)
+        # Merge pages back into content list order
+        entries = [
+            # Add page marker for better context understanding
+            (position, f"[Page {item_page}] " if item_page != current_page else "")
+            for position, item_page, _ in heapq.merge(*page_entries)
+        ]
 
-        context = "\n".join(context_texts)
-        return self._truncate_context(context)
+        context = self._join_within_limit(index, entries)
+        self._cache_context(index, cache_key, context)
+        return context
 
     def _extract_chunk_context(
         self, content_list: List[Dict], current_item_info: Dict
@@ -188,20 +321,80 @@ class ContextExtractor:
         start_idx = max(0, current_index - window_size)
         end_idx = min(len(content_list), current_index + window_size + 1)
 
-        context_texts = []
+        index = self._get_content_index(content_list)
+        cache_key = ("chunk", start_idx, end_idx, current_index) + self._settings_key()
+        context = index.contexts.get(cache_key)
+        if context is not None:
+            index.contexts.move_to_end(cache_key)
+            return context
 
-        for i in range(start_idx, end_idx):
-            if i != current_index:
-                item = content_list[i]
-                item_type = item.get("type", "")
+        entries = [
+            (i, "")
+            for i in range(start_idx, end_idx)
+            if i != current_index and index.texts[i]
+        ]
 
-                if item_type in self.config.filter_content_types:
-                    text_content = self._extract_text_from_item(item)
-                    if text_content and text_content.strip():
-                        context_texts.append(text_content)
+        context = self._join_within_limit(index, entries)
+        self._cache_context(index, cache_key, context)
+        return context
 
-        context = "\n".join(context_texts)
-        return self._truncate_context(context)
+    def _settings_key(self) -> Tuple:
+        """Extraction settings that change the assembled context"""
+        return (
+            tuple(self.config.filter_content_types),
+            self.config.max_context_tokens,
+            self.config.include_headers,
+            self.config.include_captions,
+        )
+
+    @staticmethod
+    def _cache_context(index: _ContentIndex, cache_key: Tuple, context: str) -> None:
+        """Store an assembled context string, evicting the least recently used"""
+        index.contexts[cache_key] = context
+        if len(index.contexts) > _CONTEXT_CACHE_SIZE:
+            index.contexts.popitem(last=False)
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the tokenizer, or characters when there is none"""
+        if self.tokenizer:
+            return len(self.tokenizer.encode(text))
+        return len(text)
+
+    def _join_within_limit(
+        self, index: _ContentIndex, entries: List[Tuple[int, str]]
+    ) -> str:
+        """Join context entries, truncating only when their cached token counts exceed the limit
+
+        Token counts are cached per block, so each block is encoded once per
+        content source. Only the entries up to the limit are encoded again when
+        truncation is needed.
+
+        Args:
+            index: Index of the content list the entries come from
+            entries: (block position, page marker) pairs in output order
+
+        Returns:
+            Context text within the maximum token limit
+        """
+        max_tokens = self.config.max_context_tokens
+        parts = []
+        total_tokens = 0
+
+        for position, marker in entries:
+            text = marker + index.texts[position]
+            count_key = (position, bool(marker))
+            token_count = index.token_counts.get(count_key)
+            if token_count is None:
+                token_count = self._count_tokens(text)
+                index.token_counts[count_key] = token_count
+
+            # One separator between entries
+            total_tokens += token_count + (1 if parts else 0)
+            parts.append(text)
+            if total_tokens > max_tokens:
+                return self._truncate_context("\n".join(parts))
+
+        return "\n".join(parts)
 
     def _extract_text_from_item(self, item: Dict) -> str:
         """Extract text content from a content item
@@ -365,6 +558,7 @@ class BaseModalProcessor:
         lightrag: LightRAG,
         modal_caption_func,
         context_extractor: ContextExtractor = None,
+        caption_cache: Optional[BaseKVStorage] = None,
     ):
         """Initialize base processor
 
@@ -372,9 +566,11 @@ class BaseModalProcessor:
             lightrag: LightRAG instance
             modal_caption_func: Function for generating descriptions
             context_extractor: Context extractor instance
+            caption_cache: KV storage reusing model responses for identical content across documents
         """
         self.lightrag = lightrag
         self.modal_caption_func = modal_caption_func
+        self.caption_cache = caption_cache
 
         # Use LightRAG's storage instances
         self.text_chunks_db = lightrag.text_chunks
@@ -412,6 +608,7 @@ class BaseModalProcessor:
         """
         self.content_source = content_source
         self.content_format = content_format
+        self.context_extractor.set_content_source(content_source, content_format)
         logger.info(f"Content source set with format: {content_format}")
 
     def _get_context_for_item(self, item_info: Dict[str, Any]) -> str:
@@ -423,12 +620,17 @@ class BaseModalProcessor:
         Returns:
             Context text for the item
         """
-        if not self.content_source:
+        scoped = _scoped_content_source.get()
+        if scoped is not None:
+            content_source, content_format = scoped
+        else:
+            content_source, content_format = self.content_source, self.content_format
+        if not content_source:
             return ""
 
         try:
             context = self.context_extractor.extract_context(
-                self.content_source, item_info, self.content_format
+                content_source, item_info, content_format
             )
             if context:
                 logger.debug(
@@ -439,6 +641,90 @@ class BaseModalProcessor:
             logger.error(f"Error getting context for item {item_info}: {e}")
             return ""
 
+    async def _call_caption_func(self, *args, **kwargs) -> Any:
+        """Call modal_caption_func, which may be sync or async, without blocking the event loop"""
+        return await invoke_model_func(self.modal_caption_func, *args, **kwargs)
+
+    def _caption_cache_key(
+        self,
+        content_type: str,
+        content: Union[str, bytes],
+        prompt_template: str,
+        system_prompt: str,
+        context: str = "",
+        **item_fields,
+    ) -> str:
+        """Build the caption cache key of a modal item
+
+        The key covers the content itself, the surrounding document context, the
+        prompt templates and the model. Descriptions depend on the context they
+        were generated with, so a response is only reused for identical content
+        in an identical context, e.g. when a document is ingested again or when
+        context extraction is disabled.
+
+        Args:
+            content_type: Type of modal content
+            content: Image bytes (base64) or textual content of the item
+            prompt_template: Prompt template used for the item
+            system_prompt: System prompt sent with the item
+            context: Surrounding document context included in the prompt
+            **item_fields: Further item fields included in the prompt (captions, footnotes, ...)
+
+        Returns:
+            Cache key for the item
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        key_data = {
+            "content_hash": hashlib.sha256(content).hexdigest(),
+            "context_hash": hashlib.sha256(context.encode("utf-8")).hexdigest(),
+            "prompt": hashlib.sha256(
+                (prompt_template + system_prompt).encode("utf-8")
+            ).hexdigest(),
+            "model": self.global_config.get("llm_model_name", ""),
+            "caption_func": getattr(
+                self.modal_caption_func,
+                "__qualname__",
+                type(self.modal_caption_func).__name__,
+            ),
+            "fields": item_fields,
+        }
+        return compute_mdhash_id(
+            json.dumps(key_data, sort_keys=True, default=str),
+            prefix=f"{content_type}-",
+        )
+
+    async def _get_cached_caption(self, cache_key: str) -> Optional[str]:
+        """Get a cached model response, None on a miss or when caching is disabled"""
+        if self.caption_cache is None:
+            return None
+        try:
+            cached = await self.caption_cache.get_by_id(cache_key)
+        except Exception as e:
+            logger.debug(f"Caption cache lookup failed for {cache_key}: {e}")
+            return None
+        if cached:
+            logger.debug(f"Caption cache hit: {cache_key}")
+            return cached.get("response")
+        return None
+
+    async def _cache_caption(self, cache_key: str, response: Any) -> None:
+        """Store a model response that parses into a description and entity info"""
+        if self.caption_cache is None or not isinstance(response, str):
+            return
+        try:
+            response_data = self._robust_json_parse(response)
+            if not (
+                response_data.get("detailed_description")
+                and response_data.get("entity_info")
+            ):
+                return
+            await self.caption_cache.upsert(
+                {cache_key: {"response": response, "create_time": int(time.time())}}
+            )
+        except Exception as e:
+            logger.debug(f"Failed to cache caption {cache_key}: {e}")
+
     async def generate_description_only(
         self,
         modal_content,
@@ -512,8 +798,8 @@ class BaseModalProcessor:
             "created_at": int(time.time()),
         }
 
-        await self.knowledge_graph_inst.upsert_node(
-            entity_info["entity_name"], node_data
+        await write_nodes(
+            self.knowledge_graph_inst, [(entity_info["entity_name"], node_data)]
         )
 
         # Insert entity into vector database
@@ -721,6 +1007,8 @@ class BaseModalProcessor:
 
         # Add "belongs_to" relationships for all extracted entities
         processed_chunk_results = []
+        belongs_to_edges = []
+        relation_vdb_data = {}
         for maybe_nodes, maybe_edges in chunk_results:
             for entity_name in maybe_nodes.keys():
                 if entity_name != modal_entity_name:  # Skip self-relationship
@@ -732,30 +1020,32 @@ class BaseModalProcessor:
                         "weight": 10.0,
                         "file_path": chunk_data.get("file_path", "manual_creation"),
                     }
-                    await self.knowledge_graph_inst.upsert_edge(
-                        entity_name, modal_entity_name, relation_data
+                    belongs_to_edges.append(
+                        (entity_name, modal_entity_name, relation_data)
                     )
 
                     relation_id = compute_mdhash_id(
                         entity_name + modal_entity_name, prefix="rel-"
                     )
-                    relation_vdb_data = {
-                        relation_id: {
-                            "src_id": entity_name,
-                            "tgt_id": modal_entity_name,
-                            "keywords": relation_data["keywords"],
-                            "content": f"{relation_data['keywords']}\t{entity_name}\n{modal_entity_name}\n{relation_data['description']}",
-                            "source_id": chunk_id,
-                            "file_path": chunk_data.get("file_path", "manual_creation"),
-                        }
+                    relation_vdb_data[relation_id] = {
+                        "src_id": entity_name,
+                        "tgt_id": modal_entity_name,
+                        "keywords": relation_data["keywords"],
+                        "content": f"{relation_data['keywords']}\t{entity_name}\n{modal_entity_name}\n{relation_data['description']}",
+                        "source_id": chunk_id,
+                        "file_path": chunk_data.get("file_path", "manual_creation"),
                     }
-                    await self.relationships_vdb.upsert(relation_vdb_data)
 
                     # Add to maybe_edges
                     maybe_edges[(entity_name, modal_entity_name)] = [relation_data]
 
             processed_chunk_results.append((maybe_nodes, maybe_edges))
 
+        # Write all belongs_to relations of the chunk as one group
+        await write_edges(self.knowledge_graph_inst, belongs_to_edges)
+        if relation_vdb_data:
+            await self.relationships_vdb.upsert(relation_vdb_data)
+
         if not batch_mode:
             # Merge with correct file_path parameter
             file_path = chunk_data.get("file_path", "manual_creation")
@@ -787,6 +1077,9 @@ class ImageModalProcessor(BaseModalProcessor):
         lightrag: LightRAG,
         modal_caption_func,
         context_extractor: ContextExtractor = None,
+        caption_cache: Optional[BaseKVStorage] = None,
+        image_preprocessor: Optional[ImagePreprocessor] = None,
+        image_handoff: str = "base64",
     ):
         """Initialize image processor
 
@@ -794,11 +1087,23 @@ class ImageModalProcessor(BaseModalProcessor):
             lightrag: LightRAG instance
             modal_caption_func: Function for generating descriptions (supporting image understanding)
             context_extractor: Context extractor instance
+            caption_cache: KV storage reusing model responses for identical content across documents
+            image_preprocessor: Downscales/recompresses images before they are sent to the vision model
+            image_handoff: "base64" passes `image_data` and data URLs to the vision model function,
+                "path" passes `image_path` and file:// URLs so the function can serve the file directly
         """
-        super().__init__(lightrag, modal_caption_func, context_extractor)
+        super().__init__(lightrag, modal_caption_func, context_extractor, caption_cache)
+        if image_handoff not in ("base64", "path"):
+            raise ValueError(
+                f"Unsupported image handoff: {image_handoff}. Use 'base64' or 'path'"
+            )
+        self.image_preprocessor = image_preprocessor
+        self.image_handoff = image_handoff
 
     def _encode_image_to_base64(self, image_path: str) -> str:
         """Encode image to base64"""
+        if self.image_preprocessor is not None:
+            return self.image_preprocessor.encode_base64(image_path)
         try:
             with open(image_path, "rb") as image_file:
                 encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
@@ -807,12 +1112,71 @@ class ImageModalProcessor(BaseModalProcessor):
             logger.error(f"Failed to encode image {image_path}: {e}")
             return ""
 
+    def _prepare_image_input(self, image_path: str) -> Tuple[str, str, str]:
+        """Prepare an image for the vision model according to the hand-off mode
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Tuple of (payload, mime_type, cache_content): the base64 data or absolute
+            file path to send, the MIME type of the sent image, and the content
+            identifying the image in the caption cache.
+            All are empty strings if the image cannot be read.
+        """
+        if self.image_handoff == "base64":
+            try:
+                if self.image_preprocessor is not None:
+                    image_bytes, mime_type = self.image_preprocessor.prepare(image_path)
+                else:
+                    image_bytes = Path(image_path).read_bytes()
+                    mime_type = guess_image_mime_type(image_path)
+            except Exception as e:
+                logger.error(f"Failed to encode image {image_path}: {e}")
+                return "", "", ""
+            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+            return image_base64, mime_type, image_base64
+
+        try:
+            source_file = Path(image_path)
+            # Hash the source once, the preprocessor reuses it for its cache file
+            source_hash = compute_file_content_hash(str(source_file))
+            cache_content = f"file:{source_hash}"
+            image_file = source_file
+            if self.image_preprocessor is not None:
+                image_file = self.image_preprocessor.prepare_path(
+                    source_file, source_hash
+                )
+                if image_file != source_file:
+                    cache_content += f"_{self.image_preprocessor.settings_tag()}"
+            return (
+                str(image_file.resolve()),
+                guess_image_mime_type(str(image_file)),
+                cache_content,
+            )
+        except Exception as e:
+            logger.error(f"Failed to prepare image {image_path}: {e}")
+            return "", "", ""
+
+    def _image_call_kwargs(self, payload: str) -> Dict[str, str]:
+        """Keyword argument passing a prepared payload to the vision model function"""
+        if self.image_handoff == "path":
+            return {"image_path": payload}
+        return {"image_data": payload}
+
+    def _image_url(self, payload: str, mime_type: str) -> str:
+        """Build the image_url of a multimodal message part from a prepared payload"""
+        if self.image_handoff == "path":
+            return Path(payload).as_uri()
+        return f"data:{mime_type};base64,{payload}"
+
     async def generate_description_only(
         self,
         modal_content,
         content_type: str,
         item_info: Dict[str, Any] = None,
         entity_name: str = None,
+        prepared_image: Tuple[str, str, str] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Generate image description and entity info only, without entity relation extraction.
@@ -823,6 +1187,8 @@ class ImageModalProcessor(BaseModalProcessor):
             content_type: Type of modal content ("image")
             item_info: Item information for context extraction
             entity_name: Optional predefined entity name
+            prepared_image: (payload, mime_type, cache_content) from `_prepare_image_input`
+                if the image was already prepared
 
         Returns:
             Tuple of (enhanced_caption, entity_info)
@@ -858,10 +1224,13 @@ class ImageModalProcessor(BaseModalProcessor):
                 context = self._get_context_for_item(item_info)
 
             # Build detailed visual analysis prompt with context
+            prompt_template = (
+                PROMPTS.get("vision_prompt_with_context", PROMPTS["vision_prompt"])
+                if context
+                else PROMPTS["vision_prompt"]
+            )
             if context:
-                vision_prompt = PROMPTS.get(
-                    "vision_prompt_with_context", PROMPTS["vision_prompt"]
-                ).format(
+                vision_prompt = prompt_template.format(
                     context=context,
                     entity_name=entity_name
                     if entity_name
@@ -871,7 +1240,7 @@ class ImageModalProcessor(BaseModalProcessor):
                     footnotes=footnotes if footnotes else "None",
                 )
             else:
-                vision_prompt = PROMPTS["vision_prompt"].format(
+                vision_prompt = prompt_template.format(
                     entity_name=entity_name
                     if entity_name
                     else "unique descriptive name for this image",
@@ -880,17 +1249,34 @@ class ImageModalProcessor(BaseModalProcessor):
                     footnotes=footnotes if footnotes else "None",
                 )
 
-            # Encode image to base64
-            image_base64 = self._encode_image_to_base64(image_path)
-            if not image_base64:
-                raise RuntimeError(f"Failed to encode image to base64: {image_path}")
-
-            # Call vision model with encoded image
-            response = self.modal_caption_func(
-                vision_prompt,
-                image_data=image_base64,
-                system_prompt=PROMPTS["IMAGE_ANALYSIS_SYSTEM"],
+            # Encode image to base64, or resolve the file to hand off by path.
+            # Decoding, resizing and hashing run off the event loop.
+            if prepared_image is None:
+                prepared_image = await asyncio.to_thread(
+                    self._prepare_image_input, image_path
+                )
+            image_payload, mime_type, cache_content = prepared_image
+            if not image_payload:
+                raise RuntimeError(f"Failed to prepare image: {image_path}")
+
+            # Reuse the response for identical images, otherwise call vision model
+            cache_key = self._caption_cache_key(
+                "image",
+                cache_content,
+                prompt_template,
+                PROMPTS["IMAGE_ANALYSIS_SYSTEM"],
+                context=context,
+                captions=captions,
+                footnotes=footnotes,
             )
+            response = await self._get_cached_caption(cache_key)
+            if response is None:
+                response = await self._call_caption_func(
+                    vision_prompt,
+                    system_prompt=PROMPTS["IMAGE_ANALYSIS_SYSTEM"],
+                    **self._image_call_kwargs(image_payload),
+                )
+                await self._cache_caption(cache_key, response)
 
             # Parse response (reuse existing logic)
             enhanced_caption, entity_info = self._parse_response(response, entity_name)
@@ -909,6 +1295,213 @@ class ImageModalProcessor(BaseModalProcessor):
             }
             return str(modal_content), fallback_entity
 
+    async def generate_descriptions_batch(
+        self,
+        modal_contents: List[Any],
+        item_infos: List[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Generate descriptions for several images with a single vision model request
+
+        The images (typically from the same page) are sent in one multi-image
+        message, each with its own surrounding context, and the model answers
+        with a JSON array holding one description per image. Images with a
+        cached response are not sent, and images missing from or malformed in
+        the answer are described with their own request, reusing the prepared
+        image. Requires a vision model function that accepts the `messages` argument.
+
+        Args:
+            modal_contents: Image contents to process
+            item_infos: Item information for context extraction, one per image
+
+        Returns:
+            List of (enhanced_caption, entity_info), one per image in input order
+        """
+        item_infos = item_infos or [None] * len(modal_contents)
+        results: List[Optional[Tuple[str, Dict[str, Any]]]] = [None] * len(
+            modal_contents
+        )
+
+        # Collect images that have no cached response
+        batch = []
+        prepared_images: Dict[int, Tuple[str, str, str]] = {}
+        for position, modal_content in enumerate(modal_contents):
+            content_data = modal_content
+            if isinstance(modal_content, str):
+                try:
+                    content_data = json.loads(modal_content)
+                except json.JSONDecodeError:
+                    content_data = {}
+
+            image_path = content_data.get("img_path")
+            if not image_path or not Path(image_path).exists():
+                continue
+            image_payload, mime_type, cache_content = await asyncio.to_thread(
+                self._prepare_image_input, image_path
+            )
+            if not image_payload:
+                continue
+            prepared_images[position] = (image_payload, mime_type, cache_content)
+
+            context = ""
+            if item_infos[position]:
+                context = self._get_context_for_item(item_infos[position])
+
+            captions = content_data.get("img_caption", [])
+            footnotes = content_data.get("img_footnote", [])
+            cache_key = self._caption_cache_key(
+                "image",
+                cache_content,
+                PROMPTS["vision_batch_prompt"] + PROMPTS["vision_batch_image"],
+                PROMPTS["IMAGE_ANALYSIS_SYSTEM"],
+                context=context,
+                captions=captions,
+                footnotes=footnotes,
+            )
+            cached = await self._get_cached_caption(cache_key)
+            if cached is not None:
+                results[position] = self._parse_response(cached)
+                continue
+
+            batch.append(
+                (
+                    position,
+                    image_path,
+                    captions,
+                    footnotes,
+                    context,
+                    image_payload,
+                    mime_type,
+                    cache_key,
+                )
+            )
+
+        if len(batch) > 1:
+            content_parts = [
+                {
+                    "type": "text",
+                    "text": PROMPTS["vision_batch_prompt"].format(
+                        image_count=len(batch)
+                    ),
+                }
+            ]
+            for image_index, (
+                _,
+                image_path,
+                captions,
+                footnotes,
+                context,
+                image_payload,
+                mime_type,
+                _,
+            ) in enumerate(batch, start=1):
+                content_parts.append(
+                    {
+                        "type": "text",
+                        "text": PROMPTS["vision_batch_image"].format(
+                            image_index=image_index,
+                            image_path=image_path,
+                            captions=captions if captions else "None",
+                            footnotes=footnotes if footnotes else "None",
+                            context=context or "None",
+                        ),
+                    }
+                )
+                content_parts.append(
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": self._image_url(image_payload, mime_type)},
+                    }
+                )
+            messages = [
+                {"role": "system", "content": PROMPTS["IMAGE_ANALYSIS_SYSTEM"]},
+                {"role": "user", "content": content_parts},
+            ]
+
+            try:
+                response = await self._call_caption_func("", messages=messages)
+                item_responses = self._split_batch_response(response, len(batch))
+            except Exception as e:
+                logger.warning(f"Batched image captioning failed: {e}")
+                item_responses = [None] * len(batch)
+
+            for (position, *_, cache_key), item_response in zip(batch, item_responses):
+                if item_response is None:
+                    continue
+                results[position] = self._parse_response(item_response)
+                await self._cache_caption(cache_key, item_response)
+
+            logger.info(
+                f"Batched captioning described {sum(r is not None for r in item_responses)}"
+                f"/{len(batch)} images in one request"
+            )
+
+        # Per-item fallback for images the batch did not cover
+        for position, result in enumerate(results):
+            if result is None:
+                results[position] = await self.generate_description_only(
+                    modal_contents[position],
+                    "image",
+                    item_infos[position],
+                    prepared_image=prepared_images.get(position),
+                )
+
+        return results
+
+    def _split_batch_response(self, response: str, count: int) -> List[Optional[str]]:
+        """Split a batched image analysis response into one JSON response per image
+
+        Args:
+            response: Model response holding a JSON array of image analyses
+            count: Number of images in the request
+
+        Returns:
+            List of per-image JSON strings, None for images without a valid analysis
+        """
+        elements = None
+        start, end = response.find("["), response.rfind("]")
+        if start != -1 and end > start:
+            try:
+                elements = json.loads(response[start : end + 1])
+            except json.JSONDecodeError:
+                elements = None
+
+        # Fall back to the individual objects when the array itself is malformed
+        if not isinstance(elements, list):
+            elements = []
+            for candidate in self._extract_all_json_candidates(response):
+                parsed = self._try_parse_json(candidate) or self._try_parse_json(
+                    self._basic_json_cleanup(candidate)
+                )
+                if parsed and "detailed_description" in parsed:
+                    elements.append(parsed)
+
+        item_responses: List[Optional[str]] = [None] * count
+        for order, element in enumerate(elements):
+            if not isinstance(element, dict):
+                continue
+            entity_info = element.get("entity_info")
+            if not (
+                element.get("detailed_description")
+                and isinstance(entity_info, dict)
+                and all(
+                    key in entity_info
+                    for key in ["entity_name", "entity_type", "summary"]
+                )
+            ):
+                continue
+
+            image_index = element.get("image_index")
+            position = (
+                image_index - 1
+                if isinstance(image_index, int) and 1 <= image_index <= count
+                else order
+            )
+            if position < count and item_responses[position] is None:
+                item_responses[position] = json.dumps(element, ensure_ascii=False)
+
+        return item_responses
+
     async def process_multimodal_content(
         self,
         modal_content,
@@ -1051,10 +1644,13 @@ class TableModalProcessor(BaseModalProcessor):
                 context = self._get_context_for_item(item_info)
 
             # Build table analysis prompt with context
+            prompt_template = (
+                PROMPTS.get("table_prompt_with_context", PROMPTS["table_prompt"])
+                if context
+                else PROMPTS["table_prompt"]
+            )
             if context:
-                table_prompt = PROMPTS.get(
-                    "table_prompt_with_context", PROMPTS["table_prompt"]
-                ).format(
+                table_prompt = prompt_template.format(
                     context=context,
                     entity_name=entity_name
                     if entity_name
@@ -1065,7 +1661,7 @@ class TableModalProcessor(BaseModalProcessor):
                     table_footnote=table_footnote if table_footnote else "None",
                 )
             else:
-                table_prompt = PROMPTS["table_prompt"].format(
+                table_prompt = prompt_template.format(
                     entity_name=entity_name
                     if entity_name
                     else "descriptive name for this table",
@@ -1075,11 +1671,24 @@ class TableModalProcessor(BaseModalProcessor):
                     table_footnote=table_footnote if table_footnote else "None",
                 )
 
-            # Call LLM for table analysis
-            response = await self.modal_caption_func(
-                table_prompt,
-                system_prompt=PROMPTS["TABLE_ANALYSIS_SYSTEM"],
+            # Reuse the response for identical tables, otherwise call LLM
+            cache_key = self._caption_cache_key(
+                "table",
+                str(table_body),
+                prompt_template,
+                PROMPTS["TABLE_ANALYSIS_SYSTEM"],
+                context=context,
+                table_img_path=table_img_path if not table_body else None,
+                table_caption=table_caption,
+                table_footnote=table_footnote,
             )
+            response = await self._get_cached_caption(cache_key)
+            if response is None:
+                response = await self._call_caption_func(
+                    table_prompt,
+                    system_prompt=PROMPTS["TABLE_ANALYSIS_SYSTEM"],
+                )
+                await self._cache_caption(cache_key, response)
 
             # Parse response (reuse existing logic)
             enhanced_caption, entity_info = self._parse_table_response(
@@ -1243,10 +1852,13 @@ class EquationModalProcessor(BaseModalProcessor):
                 context = self._get_context_for_item(item_info)
 
             # Build equation analysis prompt with context
+            prompt_template = (
+                PROMPTS.get("equation_prompt_with_context", PROMPTS["equation_prompt"])
+                if context
+                else PROMPTS["equation_prompt"]
+            )
             if context:
-                equation_prompt = PROMPTS.get(
-                    "equation_prompt_with_context", PROMPTS["equation_prompt"]
-                ).format(
+                equation_prompt = prompt_template.format(
                     context=context,
                     equation_text=equation_text,
                     equation_format=equation_format,
@@ -1255,7 +1867,7 @@ class EquationModalProcessor(BaseModalProcessor):
                     else "descriptive name for this equation",
                 )
             else:
-                equation_prompt = PROMPTS["equation_prompt"].format(
+                equation_prompt = prompt_template.format(
                     equation_text=equation_text,
                     equation_format=equation_format,
                     entity_name=entity_name
@@ -1263,11 +1875,22 @@ class EquationModalProcessor(BaseModalProcessor):
                     else "descriptive name for this equation",
                 )
 
-            # Call LLM for equation analysis
-            response = await self.modal_caption_func(
-                equation_prompt,
-                system_prompt=PROMPTS["EQUATION_ANALYSIS_SYSTEM"],
+            # Reuse the response for identical equations, otherwise call LLM
+            cache_key = self._caption_cache_key(
+                "equation",
+                str(equation_text),
+                prompt_template,
+                PROMPTS["EQUATION_ANALYSIS_SYSTEM"],
+                context=context,
+                equation_format=equation_format,
             )
+            response = await self._get_cached_caption(cache_key)
+            if response is None:
+                response = await self._call_caption_func(
+                    equation_prompt,
+                    system_prompt=PROMPTS["EQUATION_ANALYSIS_SYSTEM"],
+                )
+                await self._cache_caption(cache_key, response)
 
             # Parse response (reuse existing logic)
             enhanced_caption, entity_info = self._parse_equation_response(
@@ -1415,10 +2038,13 @@ class GenericModalProcessor(BaseModalProcessor):
                 context = self._get_context_for_item(item_info)
 
             # Build generic analysis prompt with context
+            prompt_template = (
+                PROMPTS.get("generic_prompt_with_context", PROMPTS["generic_prompt"])
+                if context
+                else PROMPTS["generic_prompt"]
+            )
             if context:
-                generic_prompt = PROMPTS.get(
-                    "generic_prompt_with_context", PROMPTS["generic_prompt"]
-                ).format(
+                generic_prompt = prompt_template.format(
                     context=context,
                     content_type=content_type,
                     entity_name=entity_name
@@ -1427,7 +2053,7 @@ class GenericModalProcessor(BaseModalProcessor):
                     content=str(modal_content),
                 )
             else:
-                generic_prompt = PROMPTS["generic_prompt"].format(
+                generic_prompt = prompt_template.format(
                     content_type=content_type,
                     entity_name=entity_name
                     if entity_name
@@ -1435,13 +2061,24 @@ class GenericModalProcessor(BaseModalProcessor):
                     content=str(modal_content),
                 )
 
-            # Call LLM for generic analysis
-            response = await self.modal_caption_func(
-                generic_prompt,
-                system_prompt=PROMPTS["GENERIC_ANALYSIS_SYSTEM"].format(
-                    content_type=content_type
-                ),
+            # Reuse the response for identical content, otherwise call LLM
+            system_prompt = PROMPTS["GENERIC_ANALYSIS_SYSTEM"].format(
+                content_type=content_type
             )
+            cache_key = self._caption_cache_key(
+                content_type,
+                str(modal_content),
+                prompt_template,
+                system_prompt,
+                context=context,
+            )
+            response = await self._get_cached_caption(cache_key)
+            if response is None:
+                response = await self._call_caption_func(
+                    generic_prompt,
+                    system_prompt=system_prompt,
+                )
+                await self._cache_caption(cache_key, response)
 
             # Parse response (reuse existing logic)
             enhanced_caption, entity_info = self._parse_generic_response(
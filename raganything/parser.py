@@ -13,14 +13,27 @@ from __future__ import annotations
 
 
 import json
+import asyncio
 import argparse
 import base64
+import functools
 import subprocess
 import tempfile
 import logging
+import os
+import platform
+import shutil
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Union,
@@ -29,9 +42,268 @@ from typing import (
     TypeVar,
 )
 
+from raganything.text_parser import parse_markdown, parse_plain_text, read_text_file
+
+if TYPE_CHECKING:
+    from raganything.mineru_pool import MineruWorkerPool
+
 T = TypeVar("T")
 
 
+async def run_command_async(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    line_callback: Optional[Callable[[str, str], None]] = None,
+    check: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    Run an external command with asyncio, streaming its output line by line
+
+    The process is killed if the timeout expires or the awaiting task is cancelled.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Maximum run time in seconds, None waits indefinitely
+        line_callback: Optional callable receiving ("stdout" | "stderr", line) for each non-empty line
+        check: Raise CalledProcessError if the command exits with a non-zero code
+
+    Returns:
+        subprocess.CompletedProcess: Return code and captured stdout/stderr text
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+        subprocess.TimeoutExpired: If the timeout expires
+        subprocess.CalledProcessError: If check is True and the command fails
+    """
+    subprocess_kwargs = {}
+    # Hide console window on Windows
+    if platform.system() == "Windows":
+        subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=16 * 1024 * 1024,
+        **subprocess_kwargs,
+    )
+
+    async def read_stream(stream: asyncio.StreamReader, name: str) -> str:
+        lines = []
+        while True:
+            raw_line = await stream.readline()
+            if not raw_line:
+                break
+            line = raw_line.decode("utf-8", errors="ignore").rstrip("\r\n")
+            lines.append(line)
+            if line_callback and line.strip():
+                line_callback(name, line.strip())
+        return "\n".join(lines)
+
+    async def communicate() -> Tuple[str, str, int]:
+        stdout, stderr = await asyncio.gather(
+            read_stream(process.stdout, "stdout"),
+            read_stream(process.stderr, "stderr"),
+        )
+        return stdout, stderr, await process.wait()
+
+    try:
+        stdout, stderr, returncode = await asyncio.wait_for(communicate(), timeout)
+    except asyncio.TimeoutError:
+        await _kill_process(process)
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    except BaseException:
+        # Cancelled or interrupted, don't leave the child running
+        await _kill_process(process)
+        raise
+
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess if it is still running and reap it"""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class _CommandCancelScope:
+    """Commands started by run_command for one cancellable call, cancelled together"""
+
+    __slots__ = ("lock", "cancelled", "callbacks")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cancelled = False
+        self.callbacks: set = set()
+
+    def add(self, callback: Callable[[], None]) -> bool:
+        """Register a cancel callback, returns False if the scope is already cancelled"""
+        with self.lock:
+            if self.cancelled:
+                return False
+            self.callbacks.add(callback)
+            return True
+
+    def remove(self, callback: Callable[[], None]) -> None:
+        with self.lock:
+            self.callbacks.discard(callback)
+
+    def cancel(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            callbacks = list(self.callbacks)
+        for callback in callbacks:
+            callback()
+
+
+_command_cancel_scope: ContextVar[Optional[_CommandCancelScope]] = ContextVar(
+    "command_cancel_scope", default=None
+)
+
+
+def _call_in_cancel_scope(
+    scope: Optional[_CommandCancelScope], func: Callable[..., T], *args, **kwargs
+) -> T:
+    """Call a function with the cancel scope active in the current thread"""
+    token = _command_cancel_scope.set(scope)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _command_cancel_scope.reset(token)
+
+
+def bind_command_scope(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Bind a function to the current cancel scope before handing it to another thread
+
+    Commands the function starts with run_command are then killed when the
+    call that opened the scope (see run_cancellable) is cancelled.
+
+    Args:
+        func: Function to run in another thread
+
+    Returns:
+        Callable: The function, running in the current cancel scope
+    """
+    scope = _command_cancel_scope.get()
+    if scope is None:
+        return func
+    return functools.partial(_call_in_cancel_scope, scope, func)
+
+
+@contextmanager
+def on_command_cancel(callback: Callable[[], None]) -> Iterator[None]:
+    """
+    Call a function when the enclosing run_cancellable call is cancelled
+
+    Lets blocking code that waits on work outside run_command (e.g. a job in
+    a worker process) stop that work together with the cancelled call. The
+    callback runs right away if the call was cancelled before entering.
+
+    Args:
+        callback: Thread-safe function stopping the work
+    """
+    scope = _command_cancel_scope.get()
+    if scope is None:
+        yield
+        return
+
+    if not scope.add(callback):
+        callback()
+    try:
+        yield
+    finally:
+        scope.remove(callback)
+
+
+async def run_cancellable(
+    executor: Optional[Executor], func: Callable[..., T], *args, **kwargs
+) -> T:
+    """
+    Run a blocking function on a thread executor, killing its commands on cancellation
+
+    run_command calls made by the function (or by functions it hands to other
+    threads through bind_command_scope) are killed when the awaiting task is
+    cancelled, instead of running to completion in the background.
+
+    Args:
+        executor: Thread executor, None for the event loop's default executor
+        func: Blocking function
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Result of the function
+    """
+    scope = _CommandCancelScope()
+    call = functools.partial(_call_in_cancel_scope, scope, func, *args, **kwargs)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+    except asyncio.CancelledError:
+        scope.cancel()
+        raise
+
+
+def run_command(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    line_callback: Optional[Callable[[str, str], None]] = None,
+    check: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    Blocking wrapper around run_command_async for synchronous parser code
+
+    Inside run_cancellable, cancelling the awaiting task kills the command.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Maximum run time in seconds, None waits indefinitely
+        line_callback: Optional callable receiving ("stdout" | "stderr", line) for each non-empty line
+        check: Raise CalledProcessError if the command exits with a non-zero code
+
+    Returns:
+        subprocess.CompletedProcess: Return code and captured stdout/stderr text
+    """
+    scope = _command_cancel_scope.get()
+
+    async def run() -> subprocess.CompletedProcess:
+        if scope is None:
+            return await run_command_async(cmd, timeout, line_callback, check)
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+
+        def cancel() -> None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # The command finished and its loop is closed
+                pass
+
+        if not scope.add(cancel):
+            raise asyncio.CancelledError()
+        try:
+            # Cancelling the task kills the child process in run_command_async
+            return await run_command_async(cmd, timeout, line_callback, check)
+        finally:
+            scope.remove(cancel)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run())
+
+    # Called from a thread with a running event loop, run on a separate loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(run())).result()
+
+
 class Parser:
     """
     Base class for document parsing utilities.
@@ -89,9 +361,6 @@ class Parser:
                 # Convert to PDF using LibreOffice
                 logging.info(f"Converting {doc_path.name} to PDF using LibreOffice...")
 
-                # Prepare subprocess parameters to hide console window on Windows
-                import platform
-
                 # Try LibreOffice commands in order of preference
                 commands_to_try = ["libreoffice", "soffice"]
 
@@ -108,24 +377,7 @@ class Parser:
                             str(doc_path),
                         ]
 
-                        # Prepare conversion subprocess parameters
-                        convert_subprocess_kwargs = {
-                            "capture_output": True,
-                            "text": True,
-                            "timeout": 60,  # 60 second timeout
-                            "encoding": "utf-8",
-                            "errors": "ignore",
-                        }
-
-                        # Hide console window on Windows
-                        if platform.system() == "Windows":
-                            convert_subprocess_kwargs["creationflags"] = (
-                                subprocess.CREATE_NO_WINDOW
-                            )
-
-                        result = subprocess.run(
-                            convert_cmd, **convert_subprocess_kwargs
-                        )
+                        result = run_command(convert_cmd, timeout=60)
 
                         if result.returncode == 0:
                             conversion_successful = True
@@ -189,6 +441,26 @@ class Parser:
             logging.error(f"Error in convert_office_to_pdf: {str(e)}")
             raise
 
+    @staticmethod
+    def convert_office_batch_to_pdf(
+        doc_paths: List[Union[str, Path]], output_dir: Union[str, Path]
+    ) -> Dict[str, Path]:
+        """
+        Convert many Office documents to PDF with a few concurrent LibreOffice runs.
+        Each run converts its share of the files in one invocation with its own profile.
+        Requires LibreOffice to be installed.
+
+        Args:
+            doc_paths: Paths to the Office document files
+            output_dir: Output directory for the PDF files
+
+        Returns:
+            Dict[str, Path]: Generated PDF path for each successfully converted document
+        """
+        from raganything.libreoffice_converter import LibreOfficeBatchConverter
+
+        return LibreOfficeBatchConverter.shared().convert_batch(doc_paths, output_dir)
+
     @staticmethod
     def convert_text_to_pdf(
         text_path: Union[str, Path], output_dir: Optional[str] = None
@@ -214,23 +486,7 @@ class Parser:
                 raise ValueError(f"Unsupported text format: {text_path.suffix}")
 
             # Read the text content
-            try:
-                with open(text_path, "r", encoding="utf-8") as f:
-                    text_content = f.read()
-            except UnicodeDecodeError:
-                # Try with different encodings
-                for encoding in ["gbk", "latin-1", "cp1252"]:
-                    try:
-                        with open(text_path, "r", encoding=encoding) as f:
-                            text_content = f.read()
-                        logging.info(f"Successfully read file with {encoding} encoding")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    raise RuntimeError(
-                        f"Could not decode text file {text_path.name} with any supported encoding"
-                    )
+            text_content = read_text_file(text_path)
 
             # Prepare output directory
             if output_dir:
@@ -514,6 +770,47 @@ class Parser:
         """
         raise NotImplementedError("parse_document must be implemented by subclasses")
 
+    def parse_text_native(
+        self,
+        text_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        chars_per_page: int = 3000,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse a text or Markdown file directly, without converting it to PDF
+
+        Markdown structure (headings, tables, code blocks, equations and local
+        images) is mapped onto the same content list format the PDF parsers produce.
+
+        Args:
+            text_path: Path to the text file (.txt, .md)
+            output_dir: Unused, accepted for signature compatibility with other parse methods
+            chars_per_page: Number of characters per approximate page
+            **kwargs: Unused, accepted for signature compatibility with other parse methods
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        text_path = Path(text_path)
+        if not text_path.exists():
+            raise FileNotFoundError(f"Text file does not exist: {text_path}")
+
+        text_content = read_text_file(text_path)
+        if text_path.suffix.lower() in {".md", ".markdown"}:
+            content_list = parse_markdown(
+                text_content,
+                base_dir=text_path.parent.resolve(),
+                chars_per_page=chars_per_page,
+            )
+        else:
+            content_list = parse_plain_text(text_content, chars_per_page=chars_per_page)
+
+        logging.info(
+            f"Parsed {text_path.name} natively into {len(content_list)} content blocks"
+        )
+        return content_list
+
     def check_installation(self) -> bool:
         """
         Abstract method to check if the parser is properly installed.
@@ -537,14 +834,110 @@ class MineruParser(Parser):
     Note: Office documents are no longer directly supported. Please convert them to PDF first.
     """
 
-    __slots__ = ()
+    __slots__ = ("worker_pool", "conversion_cache_dir")
 
     # Class-level logger
     logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        """Initialize MineruParser"""
+    def __init__(
+        self,
+        worker_pool: Optional[MineruWorkerPool] = None,
+        conversion_cache_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize MineruParser
+
+        Args:
+            worker_pool: Optional persistent worker pool; when provided, parse jobs are
+                dispatched to its warm workers instead of spawning the mineru CLI
+            conversion_cache_dir: Optional directory caching Office/text to PDF
+                conversions by source content hash
+        """
         super().__init__()
+        self.worker_pool = worker_pool
+        self.conversion_cache_dir = conversion_cache_dir
+
+    def _convert_to_pdf_cached(
+        self,
+        source_path: Union[str, Path],
+        output_dir: Optional[str],
+        convert: Callable[[Union[str, Path], Optional[str]], Path],
+        default_dir_name: str,
+    ) -> Path:
+        """
+        Convert a file to PDF, reusing an earlier conversion of identical content
+
+        Args:
+            source_path: Path to the source file
+            output_dir: Output directory passed to the converter
+            convert: Conversion function returning the generated PDF path
+            default_dir_name: Directory the converter uses next to the source when output_dir is None
+
+        Returns:
+            Path: PDF named after the source file in the converter's output directory
+        """
+        if self.conversion_cache_dir is None:
+            return convert(source_path, output_dir)
+
+        from raganything.utils import compute_file_content_hash
+
+        source_path = Path(source_path)
+        cache_dir = Path(self.conversion_cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # The converters render by extension (e.g. Markdown vs plain text), so key on both
+        content_hash = compute_file_content_hash(source_path)
+        cached_pdf = cache_dir / f"{content_hash}_{source_path.suffix.lstrip('.')}.pdf"
+
+        if not cached_pdf.exists():
+            pdf_path = convert(source_path, output_dir)
+            temp_pdf = cached_pdf.with_name(
+                f"{cached_pdf.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            shutil.copy2(pdf_path, temp_pdf)
+            os.replace(temp_pdf, cached_pdf)
+            return pdf_path
+
+        logging.info(f"Using cached PDF conversion for {source_path.name}")
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = source_path.parent / default_dir_name
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+
+        # MinerU names its output after the PDF, so keep the source file name
+        pdf_path = base_output_dir / f"{source_path.stem}.pdf"
+        shutil.copy2(cached_pdf, pdf_path)
+        return pdf_path
+
+    def _run_mineru(
+        self, input_path: Union[str, Path], output_dir: Union[str, Path], **kwargs
+    ) -> None:
+        """
+        Run a MinerU parse job on the worker pool if one is set, otherwise via the CLI
+
+        Jobs requesting a device or model source other than the pool's run via the CLI.
+
+        Args:
+            input_path: Path to input file
+            output_dir: Output directory path
+            **kwargs: Parse options accepted by `_run_mineru_command`
+        """
+        if self.worker_pool is not None and self.worker_pool.accepts(
+            kwargs.get("device"), kwargs.get("source")
+        ):
+            logging.info(f"Dispatching {Path(input_path).name} to MinerU worker pool")
+            self.worker_pool.run(input_path, output_dir, **kwargs)
+        else:
+            if self.worker_pool is not None:
+                # Pool workers keep the models they loaded at start
+                logging.info(
+                    "Requested device/source differ from the MinerU worker pool, "
+                    "running the mineru CLI instead"
+                )
+            self._run_mineru_command(
+                input_path=input_path, output_dir=output_dir, **kwargs
+            )
 
     @staticmethod
     def _run_mineru_command(
@@ -560,6 +953,7 @@ class MineruParser(Parser):
         device: Optional[str] = None,
         source: Optional[str] = None,
         vlm_url: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Run mineru command line tool
@@ -577,6 +971,7 @@ class MineruParser(Parser):
             device: Inference device
             source: Model source
             vlm_url: When the backend is `vlm-sglang-client`, you need to specify the server_url
+            timeout: Maximum run time in seconds, None waits indefinitely
         """
         cmd = [
             "mineru",
@@ -607,125 +1002,34 @@ class MineruParser(Parser):
         if vlm_url:
             cmd.extend(["-u", vlm_url])
 
-        try:
-            # Prepare subprocess parameters to hide console window on Windows
-            import platform
-            import threading
-            from queue import Queue, Empty
+        # Log mineru output in real time, stderr lines by severity
+        def log_output(stream: str, line: str) -> None:
+            if stream == "stderr" and "warning" in line.lower():
+                logging.warning(f"[MinerU] {line}")
+            elif stream == "stderr" and "error" in line.lower():
+                logging.error(f"[MinerU] {line}")
+            else:
+                logging.info(f"[MinerU] {line}")
 
+        try:
             # Log the command being executed
             logging.info(f"Executing mineru command: {' '.join(cmd)}")
 
-            subprocess_kwargs = {
-                "stdout": subprocess.PIPE,
-                "stderr": subprocess.PIPE,
-                "text": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-                "bufsize": 1,  # Line buffered
-            }
-
-            # Hide console window on Windows
-            if platform.system() == "Windows":
-                subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-
-            # Function to read output from subprocess and add to queue
-            def enqueue_output(pipe, queue, prefix):
-                try:
-                    for line in iter(pipe.readline, ""):
-                        if line.strip():  # Only add non-empty lines
-                            queue.put((prefix, line.strip()))
-                    pipe.close()
-                except Exception as e:
-                    queue.put((prefix, f"Error reading {prefix}: {e}"))
-
-            # Start subprocess
-            process = subprocess.Popen(cmd, **subprocess_kwargs)
-
-            # Create queues for stdout and stderr
-            stdout_queue = Queue()
-            stderr_queue = Queue()
-
-            # Start threads to read output
-            stdout_thread = threading.Thread(
-                target=enqueue_output, args=(process.stdout, stdout_queue, "STDOUT")
-            )
-            stderr_thread = threading.Thread(
-                target=enqueue_output, args=(process.stderr, stderr_queue, "STDERR")
-            )
-
-            stdout_thread.daemon = True
-            stderr_thread.daemon = True
-            stdout_thread.start()
-            stderr_thread.start()
-
-            # Process output in real time
-            while process.poll() is None:
-                # Check stdout queue
-                try:
-                    while True:
-                        prefix, line = stdout_queue.get_nowait()
-                        # Log mineru output with INFO level, prefixed with [MinerU]
-                        logging.info(f"[MinerU] {line}")
-                except Empty:
-                    pass
-
-                # Check stderr queue
-                try:
-                    while True:
-                        prefix, line = stderr_queue.get_nowait()
-                        # Log mineru errors with WARNING level
-                        if "warning" in line.lower():
-                            logging.warning(f"[MinerU] {line}")
-                        elif "error" in line.lower():
-                            logging.error(f"[MinerU] {line}")
-                        else:
-                            logging.info(f"[MinerU] {line}")
-                except Empty:
-                    pass
-
-                # Small delay to prevent busy waiting
-                import time
-
-                time.sleep(0.1)
-
-            # Process any remaining output after process completion
-            try:
-                while True:
-                    prefix, line = stdout_queue.get_nowait()
-                    logging.info(f"[MinerU] {line}")
-            except Empty:
-                pass
-
-            try:
-                while True:
-                    prefix, line = stderr_queue.get_nowait()
-                    if "warning" in line.lower():
-                        logging.warning(f"[MinerU] {line}")
-                    elif "error" in line.lower():
-                        logging.error(f"[MinerU] {line}")
-                    else:
-                        logging.info(f"[MinerU] {line}")
-            except Empty:
-                pass
-
-            # Wait for process to complete and get return code
-            return_code = process.wait()
+            result = run_command(cmd, timeout=timeout, line_callback=log_output)
 
-            # Wait for threads to finish
-            stdout_thread.join(timeout=5)
-            stderr_thread.join(timeout=5)
-
-            if return_code == 0:
+            if result.returncode == 0:
                 logging.info("[MinerU] Command executed successfully")
             else:
-                raise subprocess.CalledProcessError(return_code, cmd)
+                raise subprocess.CalledProcessError(result.returncode, cmd)
 
         except subprocess.CalledProcessError as e:
             logging.error(f"Error running mineru command: {e}")
             logging.error(f"Command: {' '.join(cmd)}")
             logging.error(f"Return code: {e.returncode}")
             raise
+        except subprocess.TimeoutExpired:
+            logging.error(f"mineru command timed out after {timeout} seconds")
+            raise
         except FileNotFoundError:
             raise RuntimeError(
                 "mineru command not found. Please ensure MinerU 2.0 is properly installed:\n"
@@ -840,7 +1144,7 @@ class MineruParser(Parser):
             base_output_dir.mkdir(parents=True, exist_ok=True)
 
             # Run mineru command
-            self._run_mineru_command(
+            self._run_mineru(
                 input_path=pdf_path,
                 output_dir=base_output_dir,
                 method=method,
@@ -862,6 +1166,278 @@ class MineruParser(Parser):
             logging.error(f"Error in parse_pdf: {str(e)}")
             raise
 
+    @staticmethod
+    def _get_pdf_page_count(pdf_path: Union[str, Path]) -> int:
+        """
+        Get number of pages in a PDF file
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            int: Number of pages
+        """
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            raise RuntimeError(
+                "pypdfium2 is required for page-range parsing. "
+                "It is installed with MinerU: pip install -U 'mineru[core]'"
+            )
+
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    @staticmethod
+    def _split_page_ranges(
+        page_count: int,
+        pages_per_range: int,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Split a page span into consecutive inclusive page ranges
+
+        Args:
+            page_count: Number of pages in the document
+            pages_per_range: Maximum number of pages per range
+            start_page: First page to include (0-based)
+            end_page: Last page to include (0-based, inclusive)
+
+        Returns:
+            List[Tuple[int, int]]: List of (start_page, end_page) pairs
+        """
+        first = max(0, start_page or 0)
+        last = page_count - 1 if end_page is None else min(end_page, page_count - 1)
+        pages_per_range = max(1, pages_per_range)
+
+        return [
+            (range_start, min(range_start + pages_per_range - 1, last))
+            for range_start in range(first, last + 1, pages_per_range)
+        ]
+
+    def _parse_pdf_page_range(
+        self,
+        pdf_path: Path,
+        base_output_dir: Path,
+        start_page: int,
+        end_page: int,
+        method: str = "auto",
+        lang: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse an inclusive page range of a PDF into its own output directory
+
+        Args:
+            pdf_path: Path to the PDF file
+            base_output_dir: Base output directory
+            start_page: First page of the range (0-based)
+            end_page: Last page of the range (0-based, inclusive)
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: Content blocks with document-level page_idx
+        """
+        # Each range gets its own directory so outputs don't overwrite each other
+        range_output_dir = (
+            base_output_dir / f"{pdf_path.stem}_pages_{start_page}-{end_page}"
+        )
+        range_output_dir.mkdir(parents=True, exist_ok=True)
+
+        self._run_mineru(
+            input_path=pdf_path,
+            output_dir=range_output_dir,
+            method=method,
+            lang=lang,
+            start_page=start_page,
+            end_page=end_page,
+            **kwargs,
+        )
+
+        backend = kwargs.get("backend") or ""
+        if backend.startswith("vlm-"):
+            method = "vlm"
+
+        content_list, _ = self._read_output_files(
+            range_output_dir, pdf_path.stem, method=method
+        )
+
+        # MinerU numbers pages relative to the start of the requested range
+        for item in content_list:
+            if isinstance(item, dict):
+                item["page_idx"] = item.get("page_idx", 0) + start_page
+
+        return content_list
+
+    def parse_pdf_sharded(
+        self,
+        pdf_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        method: str = "auto",
+        lang: Optional[str] = None,
+        num_shards: int = 2,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse PDF document by splitting it into page-range shards parsed by
+        concurrent mineru processes, then merging the shard results in page order
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            num_shards: Number of page ranges to split the document into
+            max_workers: Maximum number of concurrent mineru processes (defaults to num_shards)
+            **kwargs: Additional parameters for mineru command
+
+        Returns:
+            List[Dict[str, Any]]: List of content blocks
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file does not exist: {pdf_path}")
+
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = pdf_path.parent / "mineru_output"
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+
+        start_page = kwargs.pop("start_page", None)
+        end_page = kwargs.pop("end_page", None)
+        page_count = self._get_pdf_page_count(pdf_path)
+        first = max(0, start_page or 0)
+        last = page_count - 1 if end_page is None else min(end_page, page_count - 1)
+        pages_per_shard = -(-(last - first + 1) // max(1, num_shards))
+        page_ranges = self._split_page_ranges(
+            page_count, pages_per_shard, start_page, end_page
+        )
+
+        if len(page_ranges) <= 1:
+            return self.parse_pdf(
+                pdf_path,
+                output_dir=output_dir,
+                method=method,
+                lang=lang,
+                start_page=start_page,
+                end_page=end_page,
+                **kwargs,
+            )
+
+        max_workers = min(max_workers or len(page_ranges), len(page_ranges))
+        logging.info(
+            f"Parsing {pdf_path.name} in {len(page_ranges)} shards "
+            f"with up to {max_workers} concurrent mineru processes"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() keeps shard results in page order
+            shard_results = executor.map(
+                bind_command_scope(
+                    lambda page_range: self._parse_pdf_page_range(
+                        pdf_path,
+                        base_output_dir,
+                        page_range[0],
+                        page_range[1],
+                        method,
+                        lang,
+                        **kwargs,
+                    )
+                ),
+                page_ranges,
+            )
+            content_list = [block for shard in shard_results for block in shard]
+
+        logging.info(
+            f"Merged {len(page_ranges)} shards of {pdf_path.name}: "
+            f"{len(content_list)} content blocks"
+        )
+        return content_list
+
+    async def parse_pdf_stream(
+        self,
+        pdf_path: Union[str, Path],
+        output_dir: Optional[str] = None,
+        method: str = "auto",
+        lang: Optional[str] = None,
+        pages_per_window: int = 10,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Parse PDF document window by window, yielding content blocks per page window
+
+        The next window is parsed in a worker thread while the caller consumes
+        the current one, so downstream work overlaps with parsing.
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_dir: Output directory path
+            method: Parsing method (auto, txt, ocr)
+            lang: Document language for OCR optimization
+            pages_per_window: Number of pages parsed per MinerU invocation
+            **kwargs: Additional parameters for mineru command
+
+        Yields:
+            List[Dict[str, Any]]: Content blocks of one page window
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file does not exist: {pdf_path}")
+
+        if output_dir:
+            base_output_dir = Path(output_dir)
+        else:
+            base_output_dir = pdf_path.parent / "mineru_output"
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+
+        start_page = kwargs.pop("start_page", None)
+        end_page = kwargs.pop("end_page", None)
+        page_ranges = self._split_page_ranges(
+            self._get_pdf_page_count(pdf_path), pages_per_window, start_page, end_page
+        )
+
+        def schedule(page_range: Tuple[int, int]) -> asyncio.Future:
+            return asyncio.ensure_future(
+                run_cancellable(
+                    None,
+                    self._parse_pdf_page_range,
+                    pdf_path,
+                    base_output_dir,
+                    page_range[0],
+                    page_range[1],
+                    method,
+                    lang,
+                    **kwargs,
+                )
+            )
+
+        pending = schedule(page_ranges[0]) if page_ranges else None
+        try:
+            for i, (range_start, range_end) in enumerate(page_ranges):
+                content_list = await pending
+                pending = None
+                logging.info(
+                    f"Parsed pages {range_start}-{range_end} of {pdf_path.name}: "
+                    f"{len(content_list)} content blocks"
+                )
+
+                # Start the next window before handing this one downstream
+                if i + 1 < len(page_ranges):
+                    pending = schedule(page_ranges[i + 1])
+
+                yield content_list
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     def parse_image(
         self,
         image_path: Union[str, Path],
@@ -982,7 +1558,7 @@ class MineruParser(Parser):
 
             try:
                 # Run mineru command (images are processed with OCR method)
-                self._run_mineru_command(
+                self._run_mineru(
                     input_path=actual_image_path,
                     output_dir=base_output_dir,
                     method="ocr",  # Images require OCR method
@@ -1035,7 +1611,9 @@ class MineruParser(Parser):
         """
         try:
             # Convert Office document to PDF using base class method
-            pdf_path = self.convert_office_to_pdf(doc_path, output_dir)
+            pdf_path = self._convert_to_pdf_cached(
+                doc_path, output_dir, self.convert_office_to_pdf, "libreoffice_output"
+            )
 
             # Parse the converted PDF
             return self.parse_pdf(
@@ -1069,7 +1647,9 @@ class MineruParser(Parser):
         """
         try:
             # Convert text file to PDF using base class method
-            pdf_path = self.convert_text_to_pdf(text_path, output_dir)
+            pdf_path = self._convert_to_pdf_cached(
+                text_path, output_dir, self.convert_text_to_pdf, "reportlab_output"
+            )
 
             # Parse the converted PDF
             return self.parse_pdf(
@@ -1175,9 +1755,22 @@ class DoclingParser(Parser):
     # Define Docling-specific formats
     HTML_FORMATS = {".html", ".htm", ".xhtml"}
 
-    def __init__(self) -> None:
-        """Initialize DoclingParser"""
+    # In-process converter shared by all instances, models load once per process
+    _converter = None
+    _converter_lock = threading.Lock()
+
+    def __init__(self, backend: str = "cli") -> None:
+        """
+        Initialize DoclingParser
+
+        Args:
+            backend: 'cli' runs the docling command per file, 'python' converts
+                in-process with a DocumentConverter reused across files
+        """
         super().__init__()
+        if backend not in ("cli", "python"):
+            raise ValueError(f"Unsupported Docling backend: {backend}")
+        self.backend = backend
 
     def parse_pdf(
         self,
@@ -1297,46 +1890,27 @@ class DoclingParser(Parser):
         file_output_dir = Path(output_dir) / file_stem / "docling"
         file_output_dir.mkdir(parents=True, exist_ok=True)
 
-        cmd_json = [
+        if self.backend == "python":
+            self._run_docling_python(input_path, file_output_dir)
+            return
+
+        # A single conversion writes both the JSON and Markdown output
+        cmd = [
             "docling",
             "--output",
             str(file_output_dir),
             "--to",
             "json",
-            str(input_path),
-        ]
-        cmd_md = [
-            "docling",
-            "--output",
-            str(file_output_dir),
             "--to",
             "md",
             str(input_path),
         ]
 
         try:
-            # Prepare subprocess parameters to hide console window on Windows
-            import platform
-
-            docling_subprocess_kwargs = {
-                "capture_output": True,
-                "text": True,
-                "check": True,
-                "encoding": "utf-8",
-                "errors": "ignore",
-            }
-
-            # Hide console window on Windows
-            if platform.system() == "Windows":
-                docling_subprocess_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-
-            result_json = subprocess.run(cmd_json, **docling_subprocess_kwargs)
-            result_md = subprocess.run(cmd_md, **docling_subprocess_kwargs)
+            result = run_command(cmd, timeout=kwargs.get("timeout"), check=True)
             logging.info("Docling command executed successfully")
-            if result_json.stdout:
-                logging.debug(f"JSON cmd output: {result_json.stdout}")
-            if result_md.stdout:
-                logging.debug(f"Markdown cmd output: {result_md.stdout}")
+            if result.stdout:
+                logging.debug(f"Docling cmd output: {result.stdout}")
         except subprocess.CalledProcessError as e:
             logging.error(f"Error running docling command: {e}")
             if e.stderr:
@@ -1347,6 +1921,62 @@ class DoclingParser(Parser):
                 "docling command not found. Please ensure Docling is properly installed."
             )
 
+    @classmethod
+    def _get_converter(cls):
+        """Get the shared in-process DocumentConverter, creating it on first use"""
+        with cls._converter_lock:
+            if cls._converter is None:
+                try:
+                    from docling.datamodel.base_models import InputFormat
+                    from docling.datamodel.pipeline_options import PdfPipelineOptions
+                    from docling.document_converter import (
+                        DocumentConverter,
+                        PdfFormatOption,
+                    )
+                except ImportError:
+                    raise RuntimeError(
+                        "docling is required for the in-process Docling backend. "
+                        "Please install it with: pip install docling"
+                    )
+
+                # Keep picture images so they can be embedded like the CLI does
+                pipeline_options = PdfPipelineOptions(generate_picture_images=True)
+                cls._converter = DocumentConverter(
+                    format_options={
+                        InputFormat.PDF: PdfFormatOption(
+                            pipeline_options=pipeline_options
+                        )
+                    }
+                )
+                logging.info("Created in-process Docling converter")
+            return cls._converter
+
+    def _run_docling_python(
+        self, input_path: Union[str, Path], file_output_dir: Path
+    ) -> None:
+        """
+        Convert a file in-process and write the same JSON and Markdown files as the CLI
+
+        Args:
+            input_path: Path to input file
+            file_output_dir: Directory receiving <stem>.json and <stem>.md
+        """
+        from docling_core.types.doc import ImageRefMode
+
+        input_path = Path(input_path)
+        result = self._get_converter().convert(input_path)
+        document = result.document
+
+        document.save_as_json(
+            file_output_dir / f"{input_path.stem}.json",
+            image_mode=ImageRefMode.EMBEDDED,
+        )
+        document.save_as_markdown(
+            file_output_dir / f"{input_path.stem}.md",
+            image_mode=ImageRefMode.EMBEDDED,
+        )
+        logging.info(f"Docling converted {input_path.name} in-process")
+
     def _read_output_files(
         self,
         output_dir: Path,
@@ -6,48 +6,107 @@ Contains methods for parsing documents and processing multimodal content
 
 import os
 import time
+import gzip
 import hashlib
 import json
-from typing import Dict, List, Any, Tuple
+import functools
+import multiprocessing
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Any, Set, Tuple
 from pathlib import Path
-from raganything.parser import MineruParser, DoclingParser
+from raganything.parser import MineruParser, DoclingParser, run_cancellable
+from raganything.mineru_pool import MineruWorkerPool
+from raganything.graph_writer import buffered_graph_writes, write_nodes
+from raganything.doc_status import DocStatusTransaction
 from raganything.utils import (
     separate_content,
     insert_text_content,
     get_processor_for_type,
+    compute_file_content_hash,
+    find_near_duplicate_images,
+    get_decorative_image_reason,
 )
 import asyncio
 from lightrag.utils import compute_mdhash_id
 
 
+class _MultimodalChunkRecord:
+    """Templated chunk of one described multimodal item, shared by the storage stages"""
+
+    __slots__ = (
+        "content",
+        "description",
+        "chunk_id",
+        "tokens",
+        "entity_info",
+        "content_type",
+        "chunk_order_index",
+        "page_idx",
+        "file_path",
+    )
+
+    def __init__(
+        self,
+        content: str,
+        description: str,
+        chunk_id: str,
+        tokens: int,
+        entity_info: Dict[str, Any],
+        content_type: str,
+        chunk_order_index: int,
+        page_idx: int,
+        file_path: str,
+    ):
+        self.content = content
+        self.description = description
+        self.chunk_id = chunk_id
+        self.tokens = tokens
+        self.entity_info = entity_info
+        self.content_type = content_type
+        self.chunk_order_index = chunk_order_index
+        self.page_idx = page_idx
+        self.file_path = file_path
+
+
 class ProcessorMixin:
     """ProcessorMixin class containing document processing functionality for RAGAnything"""
 
     def _generate_cache_key(
-        self, file_path: Path, parse_method: str = None, **kwargs
+        self,
+        file_path: Path,
+        parse_method: str = None,
+        content_hash: str = None,
+        **kwargs,
     ) -> str:
         """
-        Generate cache key based on file path and parsing configuration
+        Generate cache key based on file identity and parsing configuration
 
         Args:
             file_path: Path to the file
             parse_method: Parse method used
+            content_hash: Hash of the file bytes; when provided the key is
+                content-addressed and independent of file path and mtime
             **kwargs: Additional parser parameters
 
         Returns:
             str: Cache key for the file and configuration
         """
 
-        # Get file modification time
-        mtime = file_path.stat().st_mtime
-
         # Create configuration dict for cache key
-        config_dict = {
-            "file_path": str(file_path.absolute()),
-            "mtime": mtime,
-            "parser": self.config.parser,
-            "parse_method": parse_method or self.config.parse_method,
-        }
+        if content_hash:
+            config_dict = {"content_hash": content_hash}
+        else:
+            config_dict = {
+                "file_path": str(file_path.absolute()),
+                "mtime": file_path.stat().st_mtime,
+            }
+        config_dict.update(
+            {
+                "parser": self.config.parser,
+                "parse_method": parse_method or self.config.parse_method,
+            }
+        )
 
         # Add relevant kwargs to config
         relevant_kwargs = {
@@ -67,12 +126,69 @@ class ProcessorMixin:
         }
         config_dict.update(relevant_kwargs)
 
+        # Natively parsed text files produce different blocks than the PDF route
+        if file_path.suffix.lower() in self.config.native_text_extensions:
+            config_dict["text_parser"] = "native"
+
         # Generate hash from config
         config_str = json.dumps(config_dict, sort_keys=True)
         cache_key = hashlib.md5(config_str.encode()).hexdigest()
 
         return cache_key
 
+    async def _get_file_content_hash(self, file_path: Path) -> str:
+        """
+        Get content hash of a file, reusing the stored fingerprint when the
+        file size and modification time are unchanged
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            str: SHA-256 hex digest of the file bytes
+        """
+        stat = file_path.stat()
+        fingerprint_key = compute_mdhash_id(
+            str(file_path.absolute()), prefix="fingerprint-"
+        )
+
+        parse_cache = getattr(self, "parse_cache", None)
+        if parse_cache is not None:
+            try:
+                fingerprint = await parse_cache.get_by_id(fingerprint_key)
+                if (
+                    fingerprint
+                    and fingerprint.get("size") == stat.st_size
+                    and fingerprint.get("mtime") == stat.st_mtime
+                    and fingerprint.get("content_hash")
+                ):
+                    return fingerprint["content_hash"]
+            except Exception as e:
+                self.logger.debug(f"Error reading file fingerprint: {e}")
+
+        # Hash file bytes off the event loop, large documents take a while
+        content_hash = await asyncio.to_thread(
+            compute_file_content_hash, str(file_path)
+        )
+        self.logger.debug(f"Computed content hash for {file_path}: {content_hash}")
+
+        if parse_cache is not None:
+            try:
+                await parse_cache.upsert(
+                    {
+                        fingerprint_key: {
+                            "file_path": str(file_path.absolute()),
+                            "size": stat.st_size,
+                            "mtime": stat.st_mtime,
+                            "content_hash": content_hash,
+                        }
+                    }
+                )
+            except Exception as e:
+                self.logger.debug(f"Error storing file fingerprint: {e}")
+
+        return content_hash
+
     def _generate_content_based_doc_id(self, content_list: List[Dict[str, Any]]) -> str:
         """
         Generate doc_id based on document content
@@ -113,7 +229,12 @@ class ProcessorMixin:
         return doc_id
 
     async def _get_cached_result(
-        self, cache_key: str, file_path: Path, parse_method: str = None, **kwargs
+        self,
+        cache_key: str,
+        file_path: Path,
+        parse_method: str = None,
+        content_hash: str = None,
+        **kwargs,
     ) -> tuple[List[Dict[str, Any]], str] | None:
         """
         Get cached parsing result if available and valid
@@ -122,6 +243,7 @@ class ProcessorMixin:
             cache_key: Cache key to look up
             file_path: Path to the file for mtime check
             parse_method: Parse method used
+            content_hash: Hash of the file bytes, replaces the mtime check when provided
             **kwargs: Additional parser parameters
 
         Returns:
@@ -135,13 +257,19 @@ class ProcessorMixin:
             if not cached_data:
                 return None
 
-            # Check file modification time
-            current_mtime = file_path.stat().st_mtime
-            cached_mtime = cached_data.get("mtime", 0)
+            if content_hash:
+                # Content-addressed entry, identical bytes are always valid
+                if cached_data.get("content_hash") != content_hash:
+                    self.logger.debug(f"Cache invalid - content changed: {cache_key}")
+                    return None
+            else:
+                # Check file modification time
+                current_mtime = file_path.stat().st_mtime
+                cached_mtime = cached_data.get("mtime", 0)
 
-            if current_mtime != cached_mtime:
-                self.logger.debug(f"Cache invalid - file modified: {cache_key}")
-                return None
+                if current_mtime != cached_mtime:
+                    self.logger.debug(f"Cache invalid - file modified: {cache_key}")
+                    return None
 
             # Check parsing configuration
             cached_config = cached_data.get("parse_config", {})
@@ -172,8 +300,14 @@ class ProcessorMixin:
                 self.logger.debug(f"Cache invalid - config changed: {cache_key}")
                 return None
 
-            content_list = cached_data.get("content_list", [])
             doc_id = cached_data.get("doc_id")
+            if cached_data.get("content_blob"):
+                # Payload lives in its own blob file, load it only on a valid hit
+                content_list = await asyncio.to_thread(
+                    self._read_parse_cache_blob, cached_data["content_blob"]
+                )
+            else:
+                content_list = cached_data.get("content_list", [])
 
             if content_list and doc_id:
                 self.logger.debug(
@@ -191,6 +325,67 @@ class ProcessorMixin:
 
         return None
 
+    def _get_parse_cache_blob_dir(self) -> Path:
+        """Get directory holding compressed parse cache payloads"""
+        return Path(self.config.working_dir) / "parse_cache_blobs"
+
+    def _write_parse_cache_blob(
+        self, cache_key: str, content_list: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Write content list to a gzip-compressed JSON blob
+
+        Args:
+            cache_key: Cache key the blob belongs to
+            content_list: Content list to store
+
+        Returns:
+            str: Blob file name relative to the blob directory
+        """
+        blob_dir = self._get_parse_cache_blob_dir()
+        blob_dir.mkdir(parents=True, exist_ok=True)
+
+        blob_name = f"{cache_key}.json.gz"
+        # Unique temp name so concurrent writers of the same key don't clobber each other
+        tmp_path = blob_dir / f".{blob_name}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(content_list, f, ensure_ascii=False)
+            # Atomic rename so readers never see a partially written blob
+            os.replace(tmp_path, blob_dir / blob_name)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        return blob_name
+
+    def _read_parse_cache_blob(self, blob_name: str) -> List[Dict[str, Any]]:
+        """
+        Read content list from a gzip-compressed JSON blob
+
+        Args:
+            blob_name: Blob file name relative to the blob directory
+
+        Returns:
+            List[Dict[str, Any]]: Cached content list, empty if the blob is missing
+        """
+        blob_path = self._get_parse_cache_blob_dir() / blob_name
+        if not blob_path.exists():
+            self.logger.debug(f"Parse cache blob missing: {blob_path}")
+            return []
+
+        with gzip.open(blob_path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    async def _flush_parse_cache(self) -> None:
+        """Persist parse cache entries stored since the last flush"""
+        if self.parse_cache is None:
+            return
+        try:
+            await self.parse_cache.index_done_callback()
+        except Exception as e:
+            self.logger.warning(f"Error persisting parse cache: {e}")
+
     async def _store_cached_result(
         self,
         cache_key: str,
@@ -198,6 +393,7 @@ class ProcessorMixin:
         doc_id: str,
         file_path: Path,
         parse_method: str = None,
+        content_hash: str = None,
         **kwargs,
     ) -> None:
         """
@@ -209,6 +405,7 @@ class ProcessorMixin:
             doc_id: Content-based document ID
             file_path: Path to the file for mtime storage
             parse_method: Parse method used
+            content_hash: Hash of the file bytes for content-addressed entries
             **kwargs: Additional parser parameters
         """
         if not hasattr(self, "parse_cache") or self.parse_cache is None:
@@ -242,29 +439,160 @@ class ProcessorMixin:
             }
             parse_config.update(relevant_kwargs)
 
-            cache_data = {
-                cache_key: {
-                    "content_list": content_list,
-                    "doc_id": doc_id,
-                    "mtime": file_mtime,
-                    "parse_config": parse_config,
-                    "cached_at": time.time(),
-                    "cache_version": "1.0",
-                }
+            cache_entry = {
+                "doc_id": doc_id,
+                "mtime": file_mtime,
+                "content_hash": content_hash,
+                "parse_config": parse_config,
+                "cached_at": time.time(),
+                "cache_version": "1.0",
             }
-            await self.parse_cache.upsert(cache_data)
-            # Ensure data is persisted to disk
-            await self.parse_cache.index_done_callback()
+
+            if self.config.parse_cache_storage == "blob":
+                # Write the payload to its own compressed file so that the KV
+                # store only holds a small index entry per document
+                cache_entry["content_blob"] = await asyncio.to_thread(
+                    self._write_parse_cache_blob, cache_key, content_list
+                )
+                cache_entry["content_count"] = len(content_list)
+            else:
+                cache_entry["content_list"] = content_list
+
+            # Persisting rewrites the whole index, so it is flushed once per
+            # batch (see _flush_parse_cache) or when storages are finalized
+            await self.parse_cache.upsert({cache_key: cache_entry})
             self.logger.info(f"Stored parsing result in cache: {cache_key}")
         except Exception as e:
             self.logger.warning(f"Error storing to parse cache: {e}")
 
+    def _get_mineru_parser(self) -> MineruParser:
+        """
+        Create a MinerU parser, backed by the persistent worker pool when enabled
+
+        Returns:
+            MineruParser: Parser instance
+        """
+        conversion_cache_dir = None
+        if self.config.enable_conversion_cache:
+            conversion_cache_dir = Path(self.config.working_dir) / "conversion_cache"
+
+        if self.config.mineru_pool_workers <= 0:
+            return MineruParser(conversion_cache_dir=conversion_cache_dir)
+
+        if getattr(self, "mineru_worker_pool", None) is None:
+            self.mineru_worker_pool = MineruWorkerPool(
+                num_workers=self.config.mineru_pool_workers
+            )
+        return MineruParser(
+            worker_pool=self.mineru_worker_pool,
+            conversion_cache_dir=conversion_cache_dir,
+        )
+
+    def _get_parse_executor(self) -> Executor:
+        """
+        Get the executor that synchronous parsers run on, creating it on first use
+
+        Returns:
+            Executor: Thread or process pool bounded by config.max_parallel_parse
+        """
+        if getattr(self, "parse_executor", None) is None:
+            max_workers = max(1, self.config.max_parallel_parse)
+            if self.config.parser_executor == "process":
+                self.parse_executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self.parse_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="raganything-parse"
+                )
+            self.logger.info(
+                f"Created {self.config.parser_executor} parse executor with {max_workers} workers"
+            )
+        return self.parse_executor
+
+    async def _run_parser(self, doc_parser, method_name: str, **kwargs):
+        """
+        Run a synchronous parser method on the parse executor without blocking the event loop
+
+        Args:
+            doc_parser: Parser instance
+            method_name: Name of the parser method to call
+            **kwargs: Arguments for the parser method
+
+        Returns:
+            Result of the parser method
+        """
+        executor = self._get_parse_executor()
+        if (
+            isinstance(executor, ProcessPoolExecutor)
+            and getattr(doc_parser, "worker_pool", None) is not None
+        ):
+            # Worker pools can't be sent to another process, run the CLI there instead
+            doc_parser = MineruParser(
+                conversion_cache_dir=doc_parser.conversion_cache_dir
+            )
+        call = functools.partial(getattr(doc_parser, method_name), **kwargs)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            return await asyncio.get_running_loop().run_in_executor(executor, call)
+        # Cancelling the parse kills the parser's external commands
+        return await run_cancellable(executor, call)
+
+    async def _lookup_parse_cache(
+        self, file_path: Path, parse_method: str, **kwargs
+    ) -> tuple[str, str | None, tuple[List[Dict[str, Any]], str] | None]:
+        """
+        Resolve the parse cache key for a file and look up a cached result
+
+        Args:
+            file_path: Path to the file
+            parse_method: Parse method used
+            **kwargs: Additional parser parameters
+
+        Returns:
+            tuple: (cache_key, content_hash, cached_result), where content_hash is None
+                   unless content-addressed caching is enabled and cached_result is None on a miss
+        """
+        # Hash file bytes for content-addressed caching
+        content_hash = None
+        if self.config.parse_cache_mode == "content":
+            content_hash = await self._get_file_content_hash(file_path)
+
+        # Generate cache key based on file and configuration
+        cache_key = self._generate_cache_key(
+            file_path, parse_method, content_hash=content_hash, **kwargs
+        )
+
+        cached_result = await self._get_cached_result(
+            cache_key, file_path, parse_method, content_hash=content_hash, **kwargs
+        )
+        return cache_key, content_hash, cached_result
+
+    def _display_content_stats(self, content_list: List[Dict[str, Any]]) -> None:
+        """Log the number of blocks of a content list per block type"""
+        self.logger.info("\nContent Information:")
+        self.logger.info(f"* Total blocks in content_list: {len(content_list)}")
+
+        # Count elements by type
+        block_types: Dict[str, int] = {}
+        for block in content_list:
+            if isinstance(block, dict):
+                block_type = block.get("type", "unknown")
+                if isinstance(block_type, str):
+                    block_types[block_type] = block_types.get(block_type, 0) + 1
+
+        self.logger.info("* Content block types:")
+        for block_type, count in block_types.items():
+            self.logger.info(f"  - {block_type}: {count}")
+
     async def parse_document(
         self,
         file_path: str,
         output_dir: str = None,
         parse_method: str = None,
         display_stats: bool = None,
+        num_shards: int = None,
         **kwargs,
     ) -> tuple[List[Dict[str, Any]], str]:
         """
@@ -275,6 +603,7 @@ class ProcessorMixin:
             output_dir: Output directory (defaults to config.parser_output_dir)
             parse_method: Parse method (defaults to config.parse_method)
             display_stats: Whether to display content statistics (defaults to config.display_content_stats)
+            num_shards: Number of page-range shards for MinerU PDF parsing (defaults to config.parse_shards)
             **kwargs: Additional parameters for parser (e.g., lang, device, start_page, end_page, formula, table, backend, source)
 
         Returns:
@@ -287,6 +616,8 @@ class ProcessorMixin:
             parse_method = self.config.parse_method
         if display_stats is None:
             display_stats = self.config.display_content_stats
+        if num_shards is None:
+            num_shards = self.config.parse_shards
 
         self.logger.info(f"Starting document parsing: {file_path}")
 
@@ -294,12 +625,9 @@ class ProcessorMixin:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Generate cache key based on file and configuration
-        cache_key = self._generate_cache_key(file_path, parse_method, **kwargs)
-
         # Check cache first
-        cached_result = await self._get_cached_result(
-            cache_key, file_path, parse_method, **kwargs
+        cache_key, content_hash, cached_result = await self._lookup_parse_cache(
+            file_path, parse_method, **kwargs
         )
         if cached_result is not None:
             content_list, doc_id = cached_result
@@ -315,7 +643,9 @@ class ProcessorMixin:
 
         try:
             doc_parser = (
-                DoclingParser() if self.config.parser == "docling" else MineruParser()
+                DoclingParser(backend=self.config.docling_backend)
+                if self.config.parser == "docling"
+                else self._get_mineru_parser()
             )
 
             # Log parser and method information
@@ -323,9 +653,32 @@ class ProcessorMixin:
                 f"Using {self.config.parser} parser with method: {parse_method}"
             )
 
-            if ext in [".pdf"]:
+            if ext in self.config.native_text_extensions:
+                self.logger.info(
+                    "Detected text file, parsing it directly without PDF conversion..."
+                )
+                content_list = await self._run_parser(
+                    doc_parser, "parse_text_native", text_path=file_path
+                )
+            elif ext in [".pdf"] and num_shards > 1 and self.config.parser == "mineru":
+                self.logger.info(
+                    f"Detected PDF file, parsing in {num_shards} page-range shards..."
+                )
+                content_list = await self._run_parser(
+                    doc_parser,
+                    "parse_pdf_sharded",
+                    pdf_path=file_path,
+                    output_dir=output_dir,
+                    method=parse_method,
+                    num_shards=num_shards,
+                    max_workers=self.config.parse_shard_workers,
+                    **kwargs,
+                )
+            elif ext in [".pdf"]:
                 self.logger.info("Detected PDF file, using parser for PDF...")
-                content_list = doc_parser.parse_pdf(
+                content_list = await self._run_parser(
+                    doc_parser,
+                    "parse_pdf",
                     pdf_path=file_path,
                     output_dir=output_dir,
                     method=parse_method,
@@ -344,16 +697,24 @@ class ProcessorMixin:
                 self.logger.info("Detected image file, using parser for images...")
                 # Use the selected parser's image parsing capability
                 if hasattr(doc_parser, "parse_image"):
-                    content_list = doc_parser.parse_image(
-                        image_path=file_path, output_dir=output_dir, **kwargs
+                    content_list = await self._run_parser(
+                        doc_parser,
+                        "parse_image",
+                        image_path=file_path,
+                        output_dir=output_dir,
+                        **kwargs,
                     )
                 else:
                     # Fallback to MinerU for image parsing if current parser doesn't support it
                     self.logger.warning(
                         f"{self.config.parser} parser doesn't support image parsing, falling back to MinerU"
                     )
-                    content_list = MineruParser().parse_image(
-                        image_path=file_path, output_dir=output_dir, **kwargs
+                    content_list = await self._run_parser(
+                        self._get_mineru_parser(),
+                        "parse_image",
+                        image_path=file_path,
+                        output_dir=output_dir,
+                        **kwargs,
                     )
             elif ext in [
                 ".doc",
@@ -369,15 +730,21 @@ class ProcessorMixin:
                 self.logger.info(
                     "Detected Office or HTML document, using parser for Office/HTML..."
                 )
-                content_list = doc_parser.parse_office_doc(
-                    doc_path=file_path, output_dir=output_dir, **kwargs
+                content_list = await self._run_parser(
+                    doc_parser,
+                    "parse_office_doc",
+                    doc_path=file_path,
+                    output_dir=output_dir,
+                    **kwargs,
                 )
             else:
                 # For other or unknown formats, use generic parser
                 self.logger.info(
                     f"Using generic parser for {ext} file (method={parse_method})..."
                 )
-                content_list = doc_parser.parse_document(
+                content_list = await self._run_parser(
+                    doc_parser,
+                    "parse_document",
                     file_path=file_path,
                     method=parse_method,
                     output_dir=output_dir,
@@ -390,7 +757,9 @@ class ProcessorMixin:
             )
             self.logger.warning("Falling back to MinerU parser...")
             # If specific parser fails, fall back to MinerU parser
-            content_list = MineruParser().parse_document(
+            content_list = await self._run_parser(
+                self._get_mineru_parser(),
+                "parse_document",
                 file_path=file_path,
                 method=parse_method,
                 output_dir=output_dir,
@@ -406,30 +775,305 @@ class ProcessorMixin:
 
         # Store result in cache
         await self._store_cached_result(
-            cache_key, content_list, doc_id, file_path, parse_method, **kwargs
+            cache_key,
+            content_list,
+            doc_id,
+            file_path,
+            parse_method,
+            content_hash=content_hash,
+            **kwargs,
         )
 
         # Display content statistics if requested
         if display_stats:
-            self.logger.info("\nContent Information:")
-            self.logger.info(f"* Total blocks in content_list: {len(content_list)}")
+            self._display_content_stats(content_list)
+
+        return content_list, doc_id
 
-            # Count elements by type
-            block_types: Dict[str, int] = {}
-            for block in content_list:
-                if isinstance(block, dict):
-                    block_type = block.get("type", "unknown")
-                    if isinstance(block_type, str):
-                        block_types[block_type] = block_types.get(block_type, 0) + 1
+    async def parse_document_stream(
+        self,
+        file_path: str,
+        output_dir: str = None,
+        parse_method: str = None,
+        pages_per_window: int = None,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Parse document incrementally, yielding content blocks per page window
 
-            self.logger.info("* Content block types:")
-            for block_type, count in block_types.items():
-                self.logger.info(f"  - {block_type}: {count}")
+        Only PDFs parsed with MinerU are streamed. Cached results and other
+        documents are yielded as a single window. The merged result is stored
+        in the parse cache once the last window has been parsed.
 
-        return content_list, doc_id
+        Args:
+            file_path: Path to the file to parse
+            output_dir: Output directory (defaults to config.parser_output_dir)
+            parse_method: Parse method (defaults to config.parse_method)
+            pages_per_window: Pages per window (defaults to config.parse_page_window)
+            **kwargs: Additional parameters for parser (e.g., lang, device, start_page, end_page, formula, table, backend, source)
+
+        Yields:
+            List[Dict[str, Any]]: Content blocks of one page window
+        """
+        # Use config defaults if not provided
+        if output_dir is None:
+            output_dir = self.config.parser_output_dir
+        if parse_method is None:
+            parse_method = self.config.parse_method
+        if pages_per_window is None:
+            pages_per_window = self.config.parse_page_window
+
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        if (
+            pages_per_window <= 0
+            or file_path.suffix.lower() != ".pdf"
+            or self.config.parser != "mineru"
+        ):
+            content_list, _ = await self.parse_document(
+                file_path, output_dir, parse_method, **kwargs
+            )
+            yield content_list
+            return
+
+        cache_key, content_hash, cached_result = await self._lookup_parse_cache(
+            file_path, parse_method, **kwargs
+        )
+        if cached_result is not None:
+            self.logger.info(f"Using cached parsing result for: {file_path}")
+            yield cached_result[0]
+            return
+
+        async for window_blocks in self._stream_pdf_windows(
+            file_path,
+            output_dir,
+            parse_method,
+            pages_per_window,
+            cache_key,
+            content_hash,
+            **kwargs,
+        ):
+            yield window_blocks
+
+    async def _stream_pdf_windows(
+        self,
+        file_path: Path,
+        output_dir: str,
+        parse_method: str,
+        pages_per_window: int,
+        cache_key: str,
+        content_hash: str | None,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Parse a PDF with MinerU window by window and store the merged result in the parse cache
+
+        Args:
+            file_path: Path to the PDF file
+            output_dir: Output directory
+            parse_method: Parse method
+            pages_per_window: Pages per window
+            cache_key: Parse cache key from `_lookup_parse_cache`
+            content_hash: Content hash from `_lookup_parse_cache`
+            **kwargs: Additional parameters for parser
+
+        Yields:
+            List[Dict[str, Any]]: Content blocks of one page window
+        """
+        self.logger.info(
+            f"Starting streaming document parsing: {file_path} ({pages_per_window} pages per window)"
+        )
+
+        # Streaming already splits the document into page ranges
+        kwargs.pop("num_shards", None)
+
+        content_list = []
+        async for window_blocks in self._get_mineru_parser().parse_pdf_stream(
+            pdf_path=file_path,
+            output_dir=output_dir,
+            method=parse_method,
+            pages_per_window=pages_per_window,
+            **kwargs,
+        ):
+            content_list.extend(window_blocks)
+            yield window_blocks
+
+        self.logger.info(
+            f"Parsing complete! Extracted {len(content_list)} content blocks"
+        )
+
+        # Store merged result in cache
+        doc_id = self._generate_content_based_doc_id(content_list)
+        await self._store_cached_result(
+            cache_key,
+            content_list,
+            doc_id,
+            file_path,
+            parse_method,
+            content_hash=content_hash,
+            **kwargs,
+        )
+
+    async def _parse_document_streaming(
+        self,
+        file_path: str,
+        output_dir: str,
+        parse_method: str,
+        display_stats: bool = False,
+        doc_id: str | None = None,
+        **kwargs,
+    ) -> tuple[List[Dict[str, Any]], str, asyncio.Future | None]:
+        """
+        Parse document window by window and start multimodal description
+        generation for each window while later windows are still being parsed
+
+        Descriptions are not started when the document the file was ingested as
+        before (doc_id, or the doc_id of a stale parse cache entry) already has
+        its multimodal content processed.
+
+        Args:
+            file_path: Path to the file to parse
+            output_dir: Output directory
+            parse_method: Parse method
+            display_stats: Whether to display content statistics
+            doc_id: Document ID the content will be inserted as, if known up front
+            **kwargs: Additional parameters for parser
+
+        Returns:
+            tuple: (content_list, doc_id, descriptions_future), where descriptions_future
+                   resolves to the description records of all multimodal items, or is None
+                   when the result was served from the parse cache or descriptions were skipped
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        cache_key, content_hash, cached_result = await self._lookup_parse_cache(
+            Path(file_path), parse_method, **kwargs
+        )
+        if cached_result is not None:
+            # Nothing to overlap with, let the regular flow check processing status first
+            self.logger.info(f"Using cached parsing result for: {file_path}")
+            content_list, doc_id = cached_result
+            if display_stats:
+                self.logger.info(
+                    f"* Total blocks in cached content_list: {len(content_list)}"
+                )
+            return content_list, doc_id, None
+
+        # Re-ingesting an unchanged document must not pay for its captions again
+        describe = not await self._is_known_document_processed(cache_key, doc_id)
+        if not describe:
+            self.logger.info(
+                f"Multimodal content of {file_path} was already processed, "
+                "parsing without early description generation"
+            )
+
+        content_list: List[Dict[str, Any]] = []
+        multimodal_count = 0
+        description_tasks = []
+        semaphore = asyncio.Semaphore(getattr(self.lightrag, "max_parallel_insert", 2))
+
+        try:
+            async for window_blocks in self._stream_pdf_windows(
+                Path(file_path),
+                output_dir,
+                parse_method,
+                self.config.parse_page_window,
+                cache_key,
+                content_hash,
+                **kwargs,
+            ):
+                content_list.extend(window_blocks)
+                if not describe:
+                    continue
+                window_items = [
+                    block
+                    for block in window_blocks
+                    if block.get("type", "text") != "text"
+                ]
+                if not window_items:
+                    continue
+
+                # Context extraction reads the growing content list
+                if not description_tasks and hasattr(
+                    self, "set_content_source_for_context"
+                ):
+                    self.set_content_source_for_context(
+                        content_list, self.config.content_format
+                    )
+
+                description_tasks.append(
+                    asyncio.create_task(
+                        self._generate_descriptions_type_aware(
+                            window_items,
+                            file_path,
+                            start_index=multimodal_count,
+                            semaphore=semaphore,
+                        )
+                    )
+                )
+                multimodal_count += len(window_items)
+        except BaseException:
+            for task in description_tasks:
+                task.cancel()
+            raise
+
+        if display_stats:
+            self._display_content_stats(content_list)
+
+        async def gather_descriptions() -> List[List[Dict[str, Any]]]:
+            try:
+                return await asyncio.gather(*description_tasks)
+            except BaseException:
+                # A failed or cancelled window stops the remaining windows
+                for task in description_tasks:
+                    task.cancel()
+                raise
+
+        content_based_doc_id = self._generate_content_based_doc_id(content_list)
+        if not describe:
+            return content_list, content_based_doc_id, None
+        return (
+            content_list,
+            content_based_doc_id,
+            asyncio.ensure_future(gather_descriptions()),
+        )
+
+    async def _is_known_document_processed(
+        self, cache_key: str, doc_id: str | None = None
+    ) -> bool:
+        """
+        Check whether the document a file was ingested as before has its multimodal content processed
+
+        Args:
+            cache_key: Parse cache key of the file, whose stale entry names the previous doc_id
+            doc_id: Document ID the file will be inserted as, if known up front
+
+        Returns:
+            bool: True if multimodal processing of that document can be skipped
+        """
+        parse_cache = getattr(self, "parse_cache", None)
+        if doc_id is None and parse_cache is not None:
+            try:
+                cached_data = await parse_cache.get_by_id(cache_key)
+            except Exception as e:
+                self.logger.debug(f"Error reading parse cache entry {cache_key}: {e}")
+                cached_data = None
+            doc_id = (cached_data or {}).get("doc_id")
+        if doc_id is None:
+            return False
+        return await self._is_multimodal_processed(
+            self._begin_doc_status_transaction(doc_id)
+        )
 
     async def _process_multimodal_content(
-        self, multimodal_items: List[Dict[str, Any]], file_path: str, doc_id: str
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        multimodal_data_list: List[Dict[str, Any]] = None,
     ):
         """
         Process multimodal content (using specialized processors)
@@ -438,14 +1082,70 @@ class ProcessorMixin:
             multimodal_items: List of multimodal items
             file_path: File path (for reference)
             doc_id: Document ID for proper chunk association
+            multimodal_data_list: Optional pre-generated descriptions for the items
         """
         if not multimodal_items:
             self.logger.debug("No multimodal content to process")
             return
 
+        # Read doc_status once and commit all changes of this document together
+        status_txn = self._begin_doc_status_transaction(doc_id)
+
         # Check multimodal processing status - handle LightRAG's early "PROCESSED" marking
+        if await self._is_multimodal_processed(status_txn):
+            return
+
+        # Use ProcessorMixin's own batch processing that can handle multiple content types
+        self.logger.info("Starting multimodal content processing...")
+
+        try:
+            try:
+                await self._process_multimodal_content_batch_type_aware(
+                    multimodal_items=multimodal_items,
+                    file_path=file_path,
+                    doc_id=doc_id,
+                    multimodal_data_list=multimodal_data_list,
+                    status_txn=status_txn,
+                )
+
+                # Mark multimodal content as processed and update final status
+                await self._mark_multimodal_processing_complete(doc_id, status_txn)
+
+                self.logger.info("Multimodal content processing complete")
+
+            except Exception as e:
+                self.logger.error(f"Error in multimodal processing: {e}")
+                # Fallback to individual processing if batch processing fails
+                self.logger.warning("Falling back to individual multimodal processing")
+                await self._process_multimodal_content_individual(
+                    multimodal_items, file_path, doc_id, status_txn=status_txn
+                )
+
+                # Mark multimodal content as processed even after fallback
+                await self._mark_multimodal_processing_complete(doc_id, status_txn)
+        finally:
+            await self._commit_doc_status_transaction(status_txn)
+
+        # Persist model responses cached while processing this document
+        if self.caption_cache is not None and self.bulk_ingest_state is None:
+            await self.caption_cache.index_done_callback()
+
+    async def _is_multimodal_processed(self, status_txn: DocStatusTransaction) -> bool:
+        """
+        Check whether the multimodal content of a document was already processed
+
+        LightRAG marks a document "PROCESSED" once its text is inserted, so the
+        multimodal_processed flag decides whether multimodal processing is needed.
+
+        Args:
+            status_txn: doc_status transaction of the document
+
+        Returns:
+            bool: True if multimodal processing can be skipped
+        """
+        doc_id = status_txn.doc_id
         try:
-            existing_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
+            existing_doc_status = await status_txn.get()
             if existing_doc_status:
                 # Check if multimodal content is already processed
                 multimodal_processed = existing_doc_status.get(
@@ -456,52 +1156,27 @@ class ProcessorMixin:
                     self.logger.info(
                         f"Document {doc_id} multimodal content is already processed"
                     )
-                    return
+                    return True
 
                 # Even if status is "PROCESSED" (text processing done),
                 # we still need to process multimodal content if not yet done
-                doc_status = existing_doc_status.get("status", "")
-                if doc_status == "PROCESSED" and not multimodal_processed:
+                if existing_doc_status.get("status", "") == "PROCESSED":
                     self.logger.info(
                         f"Document {doc_id} text processing is complete, but multimodal content still needs processing"
                     )
-                    # Continue with multimodal processing
-                elif doc_status == "PROCESSED" and multimodal_processed:
-                    self.logger.info(
-                        f"Document {doc_id} is fully processed (text + multimodal)"
-                    )
-                    return
 
         except Exception as e:
             self.logger.debug(f"Error checking document status for {doc_id}: {e}")
             # Continue with processing if cache check fails
 
-        # Use ProcessorMixin's own batch processing that can handle multiple content types
-        self.logger.info("Starting multimodal content processing...")
-
-        try:
-            await self._process_multimodal_content_batch_type_aware(
-                multimodal_items=multimodal_items, file_path=file_path, doc_id=doc_id
-            )
-
-            # Mark multimodal content as processed and update final status
-            await self._mark_multimodal_processing_complete(doc_id)
-
-            self.logger.info("Multimodal content processing complete")
-
-        except Exception as e:
-            self.logger.error(f"Error in multimodal processing: {e}")
-            # Fallback to individual processing if batch processing fails
-            self.logger.warning("Falling back to individual multimodal processing")
-            await self._process_multimodal_content_individual(
-                multimodal_items, file_path, doc_id
-            )
-
-            # Mark multimodal content as processed even after fallback
-            await self._mark_multimodal_processing_complete(doc_id)
+        return False
 
     async def _process_multimodal_content_individual(
-        self, multimodal_items: List[Dict[str, Any]], file_path: str, doc_id: str
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        status_txn: DocStatusTransaction = None,
     ):
         """
         Process multimodal content individually (fallback method)
@@ -510,6 +1185,8 @@ class ProcessorMixin:
             multimodal_items: List of multimodal items
             file_path: File path (for reference)
             doc_id: Document ID for proper chunk association
+            status_txn: doc_status transaction of the document, changes are committed
+                immediately when not provided
         """
         file_name = os.path.basename(file_path)
 
@@ -518,105 +1195,81 @@ class ProcessorMixin:
         multimodal_chunk_ids = []
 
         # Get current text chunks count to set proper order indexes for multimodal chunks
-        existing_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
+        existing_doc_status = await (
+            status_txn or self._begin_doc_status_transaction(doc_id)
+        ).get()
         existing_chunks_count = (
             existing_doc_status.get("chunks_count", 0) if existing_doc_status else 0
         )
 
-        for i, item in enumerate(multimodal_items):
-            try:
-                content_type = item.get("type", "unknown")
-                self.logger.info(
-                    f"Processing item {i+1}/{len(multimodal_items)}: {content_type} content"
-                )
-
-                # Select appropriate processor
-                processor = get_processor_for_type(self.modal_processors, content_type)
-
-                if processor:
-                    # Prepare item info for context extraction
-                    item_info = {
-                        "page_idx": item.get("page_idx", 0),
-                        "index": i,
-                        "type": content_type,
-                    }
-
-                    # Process content and get chunk results instead of immediately merging
-                    (
-                        enhanced_caption,
-                        entity_info,
-                        chunk_results,
-                    ) = await processor.process_multimodal_content(
-                        modal_content=item,
-                        content_type=content_type,
-                        file_path=file_name,
-                        item_info=item_info,  # Pass item info for context extraction
-                        batch_mode=True,
-                        doc_id=doc_id,  # Pass doc_id for proper association
-                        chunk_order_index=existing_chunks_count
-                        + i,  # Proper order index
-                    )
-
-                    # Collect chunk results for batch processing
-                    all_chunk_results.extend(chunk_results)
-
-                    # Extract chunk ID from the entity_info (actual chunk_id created by processor)
-                    if entity_info and "chunk_id" in entity_info:
-                        chunk_id = entity_info["chunk_id"]
-                        multimodal_chunk_ids.append(chunk_id)
+        decorative = await self._find_decorative_image_items(multimodal_items)
 
+        # Group the per-item graph writes of the document into bulk upserts
+        async with buffered_graph_writes(self.lightrag.chunk_entity_relation_graph):
+            for i, item in enumerate(multimodal_items):
+                if i in decorative:
+                    continue
+                try:
+                    content_type = item.get("type", "unknown")
                     self.logger.info(
-                        f"{content_type} processing complete: {entity_info.get('entity_name', 'Unknown')}"
-                    )
-                else:
-                    self.logger.warning(
-                        f"No suitable processor found for {content_type} type content"
+                        f"Processing item {i+1}/{len(multimodal_items)}: {content_type} content"
                     )
 
-            except Exception as e:
-                self.logger.error(f"Error processing multimodal content: {str(e)}")
-                self.logger.debug("Exception details:", exc_info=True)
-                continue
+                    # Select appropriate processor
+                    processor = get_processor_for_type(
+                        self.modal_processors, content_type
+                    )
 
-        # Update doc_status to include multimodal chunks in the standard chunks_list
-        if multimodal_chunk_ids:
-            try:
-                # Get current document status
-                current_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
+                    if processor:
+                        # Prepare item info for context extraction
+                        item_info = {
+                            "page_idx": item.get("page_idx", 0),
+                            "index": i,
+                            "type": content_type,
+                        }
 
-                if current_doc_status:
-                    existing_chunks_list = current_doc_status.get("chunks_list", [])
-                    existing_chunks_count = current_doc_status.get("chunks_count", 0)
+                        # Process content and get chunk results instead of immediately merging
+                        (
+                            enhanced_caption,
+                            entity_info,
+                            chunk_results,
+                        ) = await processor.process_multimodal_content(
+                            modal_content=item,
+                            content_type=content_type,
+                            file_path=file_name,
+                            item_info=item_info,  # Pass item info for context extraction
+                            batch_mode=True,
+                            doc_id=doc_id,  # Pass doc_id for proper association
+                            chunk_order_index=existing_chunks_count
+                            + i,  # Proper order index
+                        )
 
-                    # Add multimodal chunks to the standard chunks_list
-                    updated_chunks_list = existing_chunks_list + multimodal_chunk_ids
-                    updated_chunks_count = existing_chunks_count + len(
-                        multimodal_chunk_ids
-                    )
+                        # Collect chunk results for batch processing
+                        all_chunk_results.extend(chunk_results)
 
-                    # Update document status with integrated chunk list
-                    await self.lightrag.doc_status.upsert(
-                        {
-                            doc_id: {
-                                **current_doc_status,  # Keep existing fields
-                                "chunks_list": updated_chunks_list,  # Integrated chunks list
-                                "chunks_count": updated_chunks_count,  # Updated total count
-                                "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-                            }
-                        }
-                    )
+                        # Extract chunk ID from the entity_info (actual chunk_id created by processor)
+                        if entity_info and "chunk_id" in entity_info:
+                            chunk_id = entity_info["chunk_id"]
+                            multimodal_chunk_ids.append(chunk_id)
 
-                    # Ensure doc_status update is persisted to disk
-                    await self.lightrag.doc_status.index_done_callback()
+                        self.logger.info(
+                            f"{content_type} processing complete: {entity_info.get('entity_name', 'Unknown')}"
+                        )
+                    else:
+                        self.logger.warning(
+                            f"No suitable processor found for {content_type} type content"
+                        )
 
-                    self.logger.info(
-                        f"Updated doc_status with {len(multimodal_chunk_ids)} multimodal chunks integrated into chunks_list"
-                    )
+                except Exception as e:
+                    self.logger.error(f"Error processing multimodal content: {str(e)}")
+                    self.logger.debug("Exception details:", exc_info=True)
+                    continue
 
-            except Exception as e:
-                self.logger.warning(
-                    f"Error updating doc_status with multimodal chunks: {e}"
-                )
+        # Update doc_status to include multimodal chunks in the standard chunks_list
+        if multimodal_chunk_ids:
+            await self._update_doc_status_with_chunks_type_aware(
+                doc_id, multimodal_chunk_ids, status_txn
+            )
 
         # Batch merge all multimodal content results (similar to text content processing)
         if all_chunk_results:
@@ -644,42 +1297,177 @@ class ProcessorMixin:
                 file_path=file_name,
             )
 
-            await self.lightrag._insert_done()
+            await self._persist_lightrag_storages()
 
         self.logger.info("Individual multimodal content processing complete")
 
         # Mark multimodal content as processed
-        await self._mark_multimodal_processing_complete(doc_id)
+        await self._mark_multimodal_processing_complete(doc_id, status_txn)
 
     async def _process_multimodal_content_batch_type_aware(
-        self, multimodal_items: List[Dict[str, Any]], file_path: str, doc_id: str
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        multimodal_data_list: List[Dict[str, Any]] = None,
+        status_txn: DocStatusTransaction = None,
     ):
         """
-        Type-aware batch processing that selects correct processors based on content type.
-        This is the corrected implementation that handles different modality types properly.
+        Type-aware batch processing that selects correct processors based on content type.
+        This is the corrected implementation that handles different modality types properly.
+
+        Args:
+            multimodal_items: List of multimodal items with different types
+            file_path: File path for citation
+            doc_id: Document ID for proper association
+            multimodal_data_list: Descriptions already generated for the items
+                (e.g. while the document was still being parsed); stage 1 is skipped when provided
+            status_txn: doc_status transaction of the document, changes are committed
+                immediately when not provided
+        """
+        if not multimodal_items:
+            self.logger.debug("No multimodal content to process")
+            return
+
+        # Stage 1: Concurrent generation of descriptions using correct processors for each type
+        if multimodal_data_list is None:
+            multimodal_data_list = await self._generate_descriptions_type_aware(
+                multimodal_items, file_path
+            )
+
+        if not multimodal_data_list:
+            self.logger.warning("No valid multimodal descriptions generated")
+            return
+
+        self.logger.info(
+            f"Generated descriptions for {len(multimodal_data_list)}/{len(multimodal_items)} multimodal items using correct processors"
+        )
+
+        (
+            chunk_records,
+            lightrag_chunks,
+            chunk_results,
+        ) = await self._extract_multimodal_chunks(
+            multimodal_data_list, file_path, doc_id, status_txn
+        )
+        await self._merge_multimodal_chunks(
+            chunk_records, lightrag_chunks, chunk_results, file_path, doc_id, status_txn
+        )
+
+    async def _extract_multimodal_chunks(
+        self,
+        multimodal_data_list: List[Dict[str, Any]],
+        file_path: str,
+        doc_id: str,
+        status_txn: DocStatusTransaction = None,
+    ) -> Tuple[List[_MultimodalChunkRecord], Dict[str, Any], List[Any]]:
+        """
+        Store the chunks of described multimodal items and extract their entities
+        (stages 2-4 of type-aware batch processing)
 
         Args:
-            multimodal_items: List of multimodal items with different types
+            multimodal_data_list: Descriptions generated for the multimodal items
             file_path: File path for citation
             doc_id: Document ID for proper association
-        """
-        if not multimodal_items:
-            self.logger.debug("No multimodal content to process")
-            return
+            status_txn: doc_status transaction of the document
 
+        Returns:
+            Tuple: (chunk_records, lightrag_chunks, chunk_results) for `_merge_multimodal_chunks`
+        """
         # Get existing chunks count for proper order indexing
         try:
-            existing_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
+            existing_doc_status = await (
+                status_txn or self._begin_doc_status_transaction(doc_id)
+            ).get()
             existing_chunks_count = (
                 existing_doc_status.get("chunks_count", 0) if existing_doc_status else 0
             )
         except Exception:
             existing_chunks_count = 0
 
+        for data in multimodal_data_list:
+            data["chunk_order_index"] = existing_chunks_count + data["index"]
+
+        # Stage 2: Render chunk templates once and convert to LightRAG chunks format
+        chunk_records = self._build_multimodal_chunk_records(multimodal_data_list)
+        lightrag_chunks = self._convert_to_lightrag_chunks_type_aware(
+            chunk_records, file_path, doc_id
+        )
+
+        # Stage 3: Store chunks to LightRAG storage
+        await self._store_chunks_to_lightrag_storage_type_aware(lightrag_chunks)
+
+        # Stage 3.5: Store multimodal main entities to entities_vdb
+        await self._store_multimodal_main_entities(chunk_records, file_path)
+
+        # Stage 4: Use LightRAG's batch entity relation extraction
+        chunk_results = await self._batch_extract_entities_lightrag_style_type_aware(
+            lightrag_chunks
+        )
+        return chunk_records, lightrag_chunks, chunk_results
+
+    async def _merge_multimodal_chunks(
+        self,
+        chunk_records: List[_MultimodalChunkRecord],
+        lightrag_chunks: Dict[str, Any],
+        chunk_results: List[Any],
+        file_path: str,
+        doc_id: str,
+        status_txn: DocStatusTransaction = None,
+    ):
+        """
+        Merge extracted multimodal entities into the knowledge graph and record
+        the chunks in doc_status (stages 5-7 of type-aware batch processing)
+
+        Args:
+            chunk_records: Chunk records returned by `_extract_multimodal_chunks`
+            lightrag_chunks: LightRAG chunks returned by `_extract_multimodal_chunks`
+            chunk_results: Extraction results returned by `_extract_multimodal_chunks`
+            file_path: File path for citation
+            doc_id: Document ID for proper association
+            status_txn: doc_status transaction of the document, changes are committed
+                immediately when not provided
+        """
+        # Stage 5: Add belongs_to relations (multimodal-specific)
+        enhanced_chunk_results = await self._batch_add_belongs_to_relations_type_aware(
+            chunk_results, chunk_records
+        )
+
+        # Stage 6: Use LightRAG's batch merge
+        await self._batch_merge_lightrag_style_type_aware(
+            enhanced_chunk_results, file_path
+        )
+
+        # Stage 7: Update doc_status with integrated chunks_list
+        await self._update_doc_status_with_chunks_type_aware(
+            doc_id, list(lightrag_chunks.keys()), status_txn
+        )
+
+    async def _generate_descriptions_type_aware(
+        self,
+        multimodal_items: List[Dict[str, Any]],
+        file_path: str,
+        start_index: int = 0,
+        semaphore: asyncio.Semaphore = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Concurrently generate descriptions for multimodal items using the processor for each type
+
+        Args:
+            multimodal_items: List of multimodal items with different types
+            file_path: File path for citation
+            start_index: Index of the first item within the document's multimodal items
+            semaphore: Shared concurrency limit, defaults to LightRAG's max_parallel_insert
+
+        Returns:
+            List[Dict[str, Any]]: Successfully generated description records
+        """
         # Use LightRAG's concurrency control
-        semaphore = asyncio.Semaphore(getattr(self.lightrag, "max_parallel_insert", 2))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(
+                getattr(self.lightrag, "max_parallel_insert", 2)
+            )
 
-        # Stage 1: Concurrent generation of descriptions using correct processors for each type
         async def process_single_item_with_correct_processor(
             item: Dict[str, Any], index: int, file_path: str
         ):
@@ -723,7 +1511,6 @@ class ProcessorMixin:
                         "entity_info": entity_info,
                         "original_item": item,
                         "item_info": item_info,
-                        "chunk_order_index": existing_chunks_count + index,
                         "processor": processor,  # Keep reference to the processor used
                         "file_path": file_path,  # Add file_path to the result
                     }
@@ -734,105 +1521,326 @@ class ProcessorMixin:
                     )
                     return None
 
-        # Process all items concurrently with correct processors
-        tasks = [
-            asyncio.create_task(
-                process_single_item_with_correct_processor(item, i, file_path)
+        async def process_image_group(
+            positions: List[int],
+        ) -> Dict[int, Dict[str, Any]]:
+            """Describe a group of images with one batched vision model request"""
+            async with semaphore:
+                processor = get_processor_for_type(self.modal_processors, "image")
+                item_infos = [
+                    {
+                        "page_idx": multimodal_items[i].get("page_idx", 0),
+                        "index": start_index + i,
+                        "type": "image",
+                    }
+                    for i in positions
+                ]
+                try:
+                    descriptions = await processor.generate_descriptions_batch(
+                        [multimodal_items[i] for i in positions], item_infos
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error generating batched descriptions for images {positions}: {e}"
+                    )
+                    return {}
+
+                return {
+                    i: {
+                        "index": item_info["index"],
+                        "content_type": "image",
+                        "description": description,
+                        "entity_info": entity_info,
+                        "original_item": multimodal_items[i],
+                        "item_info": item_info,
+                        "processor": processor,
+                        "file_path": file_path,
+                    }
+                    for i, item_info, (description, entity_info) in zip(
+                        positions, item_infos, descriptions
+                    )
+                }
+
+        async def process_items(positions: List[int]) -> Dict[int, Dict[str, Any]]:
+            """Process items at the given positions concurrently with correct processors"""
+            image_groups = self._group_images_for_batch_captioning(
+                multimodal_items, positions
             )
-            for i, item in enumerate(multimodal_items)
-        ]
+            grouped = {i for group in image_groups for i in group}
+            single_positions = [i for i in positions if i not in grouped]
+
+            tasks = [
+                asyncio.create_task(
+                    process_single_item_with_correct_processor(
+                        multimodal_items[i], start_index + i, file_path
+                    )
+                )
+                for i in single_positions
+            ]
+            group_tasks = [
+                asyncio.create_task(process_image_group(group))
+                for group in image_groups
+            ]
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            group_results = await asyncio.gather(*group_tasks, return_exceptions=True)
+
+            # Filter successful results
+            records = {}
+            for position, result in zip(single_positions, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Task failed: {result}")
+                    continue
+                if result is not None:
+                    records[position] = result
+            for result in group_results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Task failed: {result}")
+                    continue
+                records.update(result)
+            return records
+
+        # Decorative images are skipped, near-duplicate images reuse the
+        # description of the first image of their group
+        decorative = await self._find_decorative_image_items(multimodal_items)
+        duplicates = await self._find_duplicate_image_items(
+            multimodal_items, exclude=decorative
+        )
+        records = await process_items(
+            [
+                i
+                for i in range(len(multimodal_items))
+                if i not in duplicates and i not in decorative
+            ]
+        )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Duplicates whose representative failed are described on their own
+        orphans = [i for i, rep in duplicates.items() if rep not in records]
+        if orphans:
+            records.update(await process_items(orphans))
 
-        # Filter successful results
-        multimodal_data_list = []
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Task failed: {result}")
+        for position, rep in duplicates.items():
+            if position in records:
                 continue
-            if result is not None:
-                multimodal_data_list.append(result)
+            item = multimodal_items[position]
+            index = start_index + position
+            # Each duplicate keeps its own entity, merging them under the
+            # representative's name would collapse their chunks into one node
+            entity_info = dict(records[rep]["entity_info"])
+            entity_info["entity_name"] = f"{entity_info['entity_name']} ({index})"
+            records[position] = {
+                **records[rep],
+                "index": index,
+                "entity_info": entity_info,
+                "original_item": item,
+                "item_info": {
+                    "page_idx": item.get("page_idx", 0),
+                    "index": index,
+                    "type": records[rep]["content_type"],
+                },
+            }
 
-        if not multimodal_data_list:
-            self.logger.warning("No valid multimodal descriptions generated")
-            return
+        if duplicates:
+            saved = len(duplicates) - len(orphans)
+            self.logger.info(
+                f"Image deduplication: {saved} near-duplicate images reused the description "
+                f"of {len(set(duplicates.values()))} distinct images ({saved} VLM calls saved)"
+            )
 
-        self.logger.info(
-            f"Generated descriptions for {len(multimodal_data_list)}/{len(multimodal_items)} multimodal items using correct processors"
-        )
+        return [records[position] for position in sorted(records)]
 
-        # Stage 2: Convert to LightRAG chunks format
-        lightrag_chunks = self._convert_to_lightrag_chunks_type_aware(
-            multimodal_data_list, file_path, doc_id
-        )
+    def _group_images_for_batch_captioning(
+        self, multimodal_items: List[Dict[str, Any]], positions: List[int]
+    ) -> List[List[int]]:
+        """
+        Group image items of the same page for batched captioning
 
-        # Stage 3: Store chunks to LightRAG storage
-        await self._store_chunks_to_lightrag_storage_type_aware(lightrag_chunks)
+        Args:
+            multimodal_items: List of multimodal items with different types
+            positions: Positions of the items to be described
 
-        # Stage 3.5: Store multimodal main entities to entities_vdb
-        await self._store_multimodal_main_entities(
-            multimodal_data_list, lightrag_chunks, file_path
-        )
+        Returns:
+            List[List[int]]: Groups of at least two image positions, empty when
+                batched captioning is disabled or unsupported by the image processor
+        """
+        batch_size = self.config.image_caption_batch_size
+        if not self.config.enable_batch_image_captioning or batch_size < 2:
+            return []
+        processor = get_processor_for_type(self.modal_processors, "image")
+        if not hasattr(processor, "generate_descriptions_batch"):
+            return []
+
+        pages: Dict[Any, List[int]] = {}
+        for i in positions:
+            if multimodal_items[i].get("type") == "image":
+                pages.setdefault(multimodal_items[i].get("page_idx", 0), []).append(i)
+
+        groups = []
+        for page_positions in pages.values():
+            for offset in range(0, len(page_positions), batch_size):
+                group = page_positions[offset : offset + batch_size]
+                if len(group) > 1:
+                    groups.append(group)
+        return groups
+
+    async def _find_duplicate_image_items(
+        self, multimodal_items: List[Dict[str, Any]], exclude: Set[int] = None
+    ) -> Dict[int, int]:
+        """
+        Find near-duplicate images among multimodal items by perceptual hash
 
-        # Track chunk IDs for doc_status update
-        chunk_ids = list(lightrag_chunks.keys())
+        Args:
+            multimodal_items: List of multimodal items with different types
+            exclude: Positions of items to leave out of deduplication
 
-        # Stage 4: Use LightRAG's batch entity relation extraction
-        chunk_results = await self._batch_extract_entities_lightrag_style_type_aware(
-            lightrag_chunks
-        )
+        Returns:
+            Dict[int, int]: Position of each duplicate image item -> position of the
+                image item whose description it reuses, empty when deduplication is disabled
+        """
+        if not self.config.enable_image_dedup:
+            return {}
 
-        # Stage 5: Add belongs_to relations (multimodal-specific)
-        enhanced_chunk_results = await self._batch_add_belongs_to_relations_type_aware(
-            chunk_results, multimodal_data_list
-        )
+        image_positions = [
+            i
+            for i, item in enumerate(multimodal_items)
+            if item.get("type") == "image"
+            and item.get("img_path")
+            and not (exclude and i in exclude)
+        ]
+        if len(image_positions) < 2:
+            return {}
 
-        # Stage 6: Use LightRAG's batch merge
-        await self._batch_merge_lightrag_style_type_aware(
-            enhanced_chunk_results, file_path
-        )
+        try:
+            duplicates = await asyncio.to_thread(
+                find_near_duplicate_images,
+                [multimodal_items[i]["img_path"] for i in image_positions],
+                self.config.image_dedup_threshold,
+            )
+        except RuntimeError as e:
+            self.logger.warning(f"Skipping image deduplication: {e}")
+            return {}
 
-        # Stage 7: Update doc_status with integrated chunks_list
-        await self._update_doc_status_with_chunks_type_aware(doc_id, chunk_ids)
+        return {
+            image_positions[duplicate]: image_positions[rep]
+            for duplicate, rep in duplicates.items()
+        }
 
-    def _convert_to_lightrag_chunks_type_aware(
-        self, multimodal_data_list: List[Dict[str, Any]], file_path: str, doc_id: str
-    ) -> Dict[str, Any]:
-        """Convert multimodal data to LightRAG standard chunks format"""
+    async def _find_decorative_image_items(
+        self, multimodal_items: List[Dict[str, Any]]
+    ) -> Set[int]:
+        """
+        Find uncaptioned decorative images (tiny crops, icons, blank images) to skip
 
-        chunks = {}
+        Args:
+            multimodal_items: List of multimodal items with different types
 
-        for data in multimodal_data_list:
-            description = data["description"]
-            entity_info = data["entity_info"]
-            chunk_order_index = data["chunk_order_index"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
+        Returns:
+            Set[int]: Positions of decorative image items, empty when filtering is disabled
+        """
+        if not self.config.enable_image_filter:
+            return set()
+
+        candidates = [
+            (i, item["img_path"])
+            for i, item in enumerate(multimodal_items)
+            if item.get("type") == "image"
+            and item.get("img_path")
+            and not item.get("img_caption")
+        ]
+        if not candidates:
+            return set()
+
+        def classify() -> Dict[int, str]:
+            reasons = {}
+            for i, img_path in candidates:
+                try:
+                    reason = get_decorative_image_reason(
+                        img_path,
+                        min_side=self.config.image_filter_min_side,
+                        min_area=self.config.image_filter_min_area,
+                        min_entropy=self.config.image_filter_min_entropy,
+                        min_stddev=self.config.image_filter_min_stddev,
+                    )
+                except (OSError, ValueError) as e:
+                    self.logger.debug(f"Could not inspect image {img_path}: {e}")
+                    continue
+                if reason:
+                    reasons[i] = reason
+            return reasons
+
+        try:
+            reasons = await asyncio.to_thread(classify)
+        except RuntimeError as e:
+            self.logger.warning(f"Skipping decorative image filter: {e}")
+            return set()
+
+        for i, reason in reasons.items():
+            self.logger.debug(
+                f"Skipping decorative image {multimodal_items[i]['img_path']}: {reason}"
+            )
+        if reasons:
+            self.logger.info(
+                f"Image filter: skipped {len(reasons)} of {len(candidates)} "
+                f"uncaptioned images as decorative"
+            )
+        return set(reasons)
+
+    def _build_multimodal_chunk_records(
+        self, multimodal_data_list: List[Dict[str, Any]]
+    ) -> List[_MultimodalChunkRecord]:
+        """
+        Render the chunk template, chunk ID and token count of each item once
 
+        Args:
+            multimodal_data_list: Descriptions generated in stage 1, with chunk_order_index set
+
+        Returns:
+            List[_MultimodalChunkRecord]: One record per item, in input order
+        """
+        records = []
+        for data in multimodal_data_list:
             # Apply the appropriate chunk template based on content type
             formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
+                data["content_type"], data["original_item"], data["description"]
+            )
+            records.append(
+                _MultimodalChunkRecord(
+                    content=formatted_chunk_content,
+                    description=data["description"],
+                    chunk_id=compute_mdhash_id(
+                        formatted_chunk_content, prefix="chunk-"
+                    ),
+                    tokens=len(self.lightrag.tokenizer.encode(formatted_chunk_content)),
+                    entity_info=data["entity_info"],
+                    content_type=data["content_type"],
+                    chunk_order_index=data["chunk_order_index"],
+                    page_idx=data["item_info"].get("page_idx", 0),
+                    file_path=data.get("file_path", "multimodal_content"),
+                )
             )
+        return records
 
-            # Generate chunk_id
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
+    def _convert_to_lightrag_chunks_type_aware(
+        self, chunk_records: List[_MultimodalChunkRecord], file_path: str, doc_id: str
+    ) -> Dict[str, Any]:
+        """Convert multimodal chunk records to LightRAG standard chunks format"""
 
-            # Calculate tokens
-            tokens = len(self.lightrag.tokenizer.encode(formatted_chunk_content))
+        chunks = {}
 
+        for record in chunk_records:
             # Build LightRAG standard chunk format
-            chunks[chunk_id] = {
-                "content": formatted_chunk_content,  # Now uses the templated content
-                "tokens": tokens,
+            chunks[record.chunk_id] = {
+                "content": record.content,  # Now uses the templated content
+                "tokens": record.tokens,
                 "full_doc_id": doc_id,
-                "chunk_order_index": chunk_order_index,
+                "chunk_order_index": record.chunk_order_index,
                 "file_path": os.path.basename(file_path),
                 "llm_cache_list": [],  # LightRAG will populate this field
                 # Multimodal-specific metadata
                 "is_multimodal": True,
-                "modal_entity_name": entity_info["entity_name"],
-                "original_type": data["content_type"],
-                "page_idx": data["item_info"].get("page_idx", 0),
+                "modal_entity_name": record.entity_info["entity_name"],
+                "original_type": record.content_type,
+                "page_idx": record.page_idx,
             }
 
         self.logger.debug(
@@ -930,8 +1938,7 @@ class ProcessorMixin:
 
     async def _store_multimodal_main_entities(
         self,
-        multimodal_data_list: List[Dict[str, Any]],
-        lightrag_chunks: Dict[str, Any],
+        chunk_records: List[_MultimodalChunkRecord],
         file_path: str,
     ):
         """
@@ -939,29 +1946,18 @@ class ProcessorMixin:
         This ensures that entities like "TableName (table)" are properly indexed.
 
         Args:
-            multimodal_data_list: List of processed multimodal data with entity info
-            lightrag_chunks: Chunks in LightRAG format (already formatted with templates)
+            chunk_records: Chunk records of the processed multimodal items with entity info
+            file_path: File path for citation
         """
-        if not multimodal_data_list:
+        if not chunk_records:
             return
 
         # Create entities_vdb entries for all multimodal main entities
         entities_to_store = {}
 
-        for data in multimodal_data_list:
-            entity_info = data["entity_info"]
+        for record in chunk_records:
+            entity_info = record.entity_info
             entity_name = entity_info["entity_name"]
-            description = data["description"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
-
-            # Apply the same chunk template to get the formatted content
-            formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
-            )
-
-            # Generate chunk_id using the formatted content (same as in _convert_to_lightrag_chunks)
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
 
             # Generate entity_id using LightRAG's standard format
             entity_id = compute_mdhash_id(entity_name, prefix="ent-")
@@ -969,9 +1965,9 @@ class ProcessorMixin:
             # Create entity data in LightRAG format
             entity_data = {
                 "entity_name": entity_name,
-                "entity_type": entity_info.get("entity_type", content_type),
-                "content": entity_info.get("summary", description),
-                "source_id": chunk_id,
+                "entity_type": entity_info.get("entity_type", record.content_type),
+                "content": entity_info.get("summary", record.description),
+                "source_id": record.chunk_id,
                 "file_path": os.path.basename(file_path),
             }
 
@@ -979,28 +1975,28 @@ class ProcessorMixin:
 
         if entities_to_store:
             try:
-                # Store entities in knowledge graph
-                for entity_id, entity_data in entities_to_store.items():
-                    entity_name = entity_data["entity_name"]
-
-                    # Create node data for knowledge graph
-                    node_data = {
-                        "entity_id": entity_name,
-                        "entity_type": entity_data["entity_type"],
-                        "description": entity_data["content"],
-                        "source_id": entity_data["source_id"],
-                        "file_path": entity_data["file_path"],
-                        "created_at": int(time.time()),
-                    }
-
-                    # Store in knowledge graph
-                    await self.lightrag.chunk_entity_relation_graph.upsert_node(
-                        entity_name, node_data
+                # Store entities in knowledge graph with one bulk write
+                created_at = int(time.time())
+                nodes = [
+                    (
+                        entity_data["entity_name"],
+                        {
+                            "entity_id": entity_data["entity_name"],
+                            "entity_type": entity_data["entity_type"],
+                            "description": entity_data["content"],
+                            "source_id": entity_data["source_id"],
+                            "file_path": entity_data["file_path"],
+                            "created_at": created_at,
+                        },
                     )
+                    for entity_data in entities_to_store.values()
+                ]
+                await write_nodes(self.lightrag.chunk_entity_relation_graph, nodes)
 
                 # Store in entities_vdb
                 await self.lightrag.entities_vdb.upsert(entities_to_store)
-                await self.lightrag.entities_vdb.index_done_callback()
+                if self.bulk_ingest_state is None:
+                    await self.lightrag.entities_vdb.index_done_callback()
 
                 self.logger.debug(
                     f"Stored {len(entities_to_store)} multimodal main entities to knowledge graph and entities_vdb"
@@ -1040,26 +2036,16 @@ class ProcessorMixin:
         return chunk_results
 
     async def _batch_add_belongs_to_relations_type_aware(
-        self, chunk_results: List[Tuple], multimodal_data_list: List[Dict[str, Any]]
+        self, chunk_results: List[Tuple], chunk_records: List[_MultimodalChunkRecord]
     ) -> List[Tuple]:
         """Add belongs_to relations for multimodal entities"""
         # Create mapping from chunk_id to modal_entity_name
         chunk_to_modal_entity = {}
         chunk_to_file_path = {}
 
-        for data in multimodal_data_list:
-            description = data["description"]
-            content_type = data["content_type"]
-            original_item = data["original_item"]
-
-            # Use the same template formatting as in _convert_to_lightrag_chunks_type_aware
-            formatted_chunk_content = self._apply_chunk_template(
-                content_type, original_item, description
-            )
-            chunk_id = compute_mdhash_id(formatted_chunk_content, prefix="chunk-")
-
-            chunk_to_modal_entity[chunk_id] = data["entity_info"]["entity_name"]
-            chunk_to_file_path[chunk_id] = data.get("file_path", "multimodal_content")
+        for record in chunk_records:
+            chunk_to_modal_entity[record.chunk_id] = record.entity_info["entity_name"]
+            chunk_to_file_path[record.chunk_id] = record.file_path
 
         enhanced_chunk_results = []
         belongs_to_count = 0
@@ -1130,42 +2116,53 @@ class ProcessorMixin:
             file_path=os.path.basename(file_path),
         )
 
-        await self.lightrag._insert_done()
+        await self._persist_lightrag_storages()
+
+    async def _persist_lightrag_storages(self):
+        """Persist LightRAG storages, deferred to the flush schedule of a bulk ingest session"""
+        if self.bulk_ingest_state is None:
+            await self.lightrag._insert_done()
+
+    def _begin_doc_status_transaction(self, doc_id: str) -> DocStatusTransaction:
+        """Start a doc_status transaction for a document, journaled in the working directory"""
+        return DocStatusTransaction(
+            self.lightrag.doc_status,
+            doc_id,
+            journal_dir=Path(self.working_dir) / "doc_status_journal",
+        )
+
+    async def _commit_doc_status_transaction(self, status_txn: DocStatusTransaction):
+        """Commit a doc_status transaction, logging instead of raising on failure"""
+        try:
+            if await status_txn.commit(flush=self.bulk_ingest_state is None):
+                self.logger.debug(
+                    f"Committed doc_status for document {status_txn.doc_id}"
+                )
+        except Exception as e:
+            self.logger.warning(
+                f"Error committing doc_status for document {status_txn.doc_id}: {e}"
+            )
 
     async def _update_doc_status_with_chunks_type_aware(
-        self, doc_id: str, chunk_ids: List[str]
+        self,
+        doc_id: str,
+        chunk_ids: List[str],
+        status_txn: DocStatusTransaction = None,
     ):
         """Update document status with multimodal chunks"""
         try:
-            # Get current document status
-            current_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
-
-            if current_doc_status:
-                existing_chunks_list = current_doc_status.get("chunks_list", [])
-                existing_chunks_count = current_doc_status.get("chunks_count", 0)
-
-                # Add multimodal chunks to the standard chunks_list
-                updated_chunks_list = existing_chunks_list + chunk_ids
-                updated_chunks_count = existing_chunks_count + len(chunk_ids)
-
-                # Update document status with integrated chunk list
-                await self.lightrag.doc_status.upsert(
-                    {
-                        doc_id: {
-                            **current_doc_status,  # Keep existing fields
-                            "chunks_list": updated_chunks_list,  # Integrated chunks list
-                            "chunks_count": updated_chunks_count,  # Updated total count
-                            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-                        }
-                    }
-                )
+            txn = status_txn or self._begin_doc_status_transaction(doc_id)
 
-                # Ensure doc_status update is persisted to disk
-                await self.lightrag.doc_status.index_done_callback()
+            # Add multimodal chunks to the standard chunks_list
+            await txn.add_chunks(chunk_ids)
+            if status_txn is None:
+                await txn.commit(flush=self.bulk_ingest_state is None)
 
+            record = await txn.get()
+            if record:
                 self.logger.info(
                     f"Updated doc_status: added {len(chunk_ids)} multimodal chunks to standard chunks_list "
-                    f"(total chunks: {updated_chunks_count})"
+                    f"(total chunks: {record.get('chunks_count', 0)})"
                 )
 
         except Exception as e:
@@ -1173,24 +2170,18 @@ class ProcessorMixin:
                 f"Error updating doc_status with multimodal chunks: {e}"
             )
 
-    async def _mark_multimodal_processing_complete(self, doc_id: str):
+    async def _mark_multimodal_processing_complete(
+        self, doc_id: str, status_txn: DocStatusTransaction = None
+    ):
         """Mark multimodal content processing as complete in the document status."""
         try:
-            current_doc_status = await self.lightrag.doc_status.get_by_id(doc_id)
-            if current_doc_status:
-                await self.lightrag.doc_status.upsert(
-                    {
-                        doc_id: {
-                            **current_doc_status,
-                            "multimodal_processed": True,
-                            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-                        }
-                    }
-                )
-                await self.lightrag.doc_status.index_done_callback()
-                self.logger.debug(
-                    f"Marked multimodal content processing as complete for document {doc_id}"
-                )
+            txn = status_txn or self._begin_doc_status_transaction(doc_id)
+            await txn.update(multimodal_processed=True)
+            if status_txn is None:
+                await txn.commit(flush=self.bulk_ingest_state is None)
+            self.logger.debug(
+                f"Marked multimodal content processing as complete for document {doc_id}"
+            )
         except Exception as e:
             self.logger.warning(
                 f"Error marking multimodal processing as complete for document {doc_id}: {e}"
@@ -1310,41 +2301,83 @@ class ProcessorMixin:
         self.logger.info(f"Starting complete document processing: {file_path}")
 
         # Step 1: Parse document
-        content_list, content_based_doc_id = await self.parse_document(
-            file_path, output_dir, parse_method, display_stats, **kwargs
-        )
+        descriptions_future = None
+        if (
+            self.config.parse_page_window > 0
+            and Path(file_path).suffix.lower() == ".pdf"
+            and self.config.parser == "mineru"
+        ):
+            # Stream page windows so multimodal descriptions start before parsing ends
+            (
+                content_list,
+                content_based_doc_id,
+                descriptions_future,
+            ) = await self._parse_document_streaming(
+                file_path,
+                output_dir,
+                parse_method,
+                display_stats,
+                doc_id=doc_id,
+                **kwargs,
+            )
+        else:
+            content_list, content_based_doc_id = await self.parse_document(
+                file_path, output_dir, parse_method, display_stats, **kwargs
+            )
 
         # Use provided doc_id or fall back to content-based doc_id
         if doc_id is None:
             doc_id = content_based_doc_id
 
-        # Step 2: Separate text and multimodal content
-        text_content, multimodal_items = separate_content(content_list)
+        try:
+            # Step 2: Separate text and multimodal content
+            text_content, multimodal_items = separate_content(content_list)
 
-        # Step 2.5: Set content source for context extraction in multimodal processing
-        if hasattr(self, "set_content_source_for_context") and multimodal_items:
-            self.logger.info(
-                "Setting content source for context-aware multimodal processing..."
-            )
-            self.set_content_source_for_context(
-                content_list, self.config.content_format
-            )
+            # Step 2.5: Set content source for context extraction in multimodal processing
+            if hasattr(self, "set_content_source_for_context") and multimodal_items:
+                self.logger.info(
+                    "Setting content source for context-aware multimodal processing..."
+                )
+                self.set_content_source_for_context(
+                    content_list, self.config.content_format
+                )
 
-        # Step 3: Insert pure text content with all parameters
-        if text_content.strip():
-            file_name = os.path.basename(file_path)
-            await insert_text_content(
-                self.lightrag,
-                text_content,
-                file_paths=file_name,
-                split_by_character=split_by_character,
-                split_by_character_only=split_by_character_only,
-                ids=doc_id,
-            )
+            # Step 3: Insert pure text content with all parameters
+            if text_content.strip():
+                file_name = os.path.basename(file_path)
+                await insert_text_content(
+                    self.lightrag,
+                    text_content,
+                    file_paths=file_name,
+                    split_by_character=split_by_character,
+                    split_by_character_only=split_by_character_only,
+                    ids=doc_id,
+                )
+
+            # Step 4: Process multimodal content (using specialized processors)
+            multimodal_data_list = None
+            if descriptions_future is not None:
+                window_results = await descriptions_future
+                multimodal_data_list = sorted(
+                    (data for window in window_results for data in window),
+                    key=lambda data: data["index"],
+                )
+        except BaseException:
+            # Don't leave description tasks calling the vision model in the background
+            if descriptions_future is not None:
+                if descriptions_future.done() and not descriptions_future.cancelled():
+                    # Retrieve a failure nobody awaited so it isn't reported as unhandled
+                    descriptions_future.exception()
+                descriptions_future.cancel()
+            raise
 
-        # Step 4: Process multimodal content (using specialized processors)
         if multimodal_items:
-            await self._process_multimodal_content(multimodal_items, file_path, doc_id)
+            await self._process_multimodal_content(
+                multimodal_items,
+                file_path,
+                doc_id,
+                multimodal_data_list=multimodal_data_list,
+            )
         else:
             # If no multimodal content, mark multimodal processing as complete
             # This ensures the document status properly reflects completion of all processing
@@ -1353,6 +2386,9 @@ class ProcessorMixin:
                 f"No multimodal content found in document {doc_id}, marked multimodal processing as complete"
             )
 
+        # Persist storages if a bulk ingest session flush is due
+        await self._document_ingested()
+
         self.logger.info(f"Document {file_path} processing complete!")
 
     async def insert_content_list(
@@ -1406,20 +2442,7 @@ class ProcessorMixin:
 
         # Display content statistics if requested
         if display_stats:
-            self.logger.info("\nContent Information:")
-            self.logger.info(f"* Total blocks in content_list: {len(content_list)}")
-
-            # Count elements by type
-            block_types: Dict[str, int] = {}
-            for block in content_list:
-                if isinstance(block, dict):
-                    block_type = block.get("type", "unknown")
-                    if isinstance(block_type, str):
-                        block_types[block_type] = block_types.get(block_type, 0) + 1
-
-            self.logger.info("* Content block types:")
-            for block_type, count in block_types.items():
-                self.logger.info(f"  - {block_type}: {count}")
+            self._display_content_stats(content_list)
 
         # Step 1: Separate text and multimodal content
         text_content, multimodal_items = separate_content(content_list)
@@ -1456,4 +2479,7 @@ class ProcessorMixin:
                 f"No multimodal content found in document {doc_id}, marked multimodal processing as complete"
             )
 
+        # Persist storages if a bulk ingest session flush is due
+        await self._document_ingested()
+
         self.logger.info(f"Content list insertion complete for: {file_path}")
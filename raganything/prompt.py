@@ -88,6 +88,37 @@ Image details:
 
 Focus on providing accurate, detailed visual analysis that incorporates the context and would be useful for knowledge retrieval."""
 
+# Batched image analysis prompt, the images follow the prompt in order
+PROMPTS[
+    "vision_batch_prompt"
+] = """Please analyze each of the following {image_count} images in detail, considering the surrounding context given with each image. Provide a JSON array with exactly one object per image, in the order the images are given, with the following structure:
+
+[
+    {{
+        "image_index": 1,
+        "detailed_description": "A comprehensive and detailed visual description of this image following these guidelines:
+        - Describe the overall composition and layout
+        - Identify all objects, people, text, and visual elements
+        - Explain relationships between elements and how they relate to the surrounding context
+        - Note colors, lighting, and visual style
+        - Include technical details if relevant (charts, diagrams, etc.)
+        - Always use specific names instead of pronouns",
+        "entity_info": {{
+            "entity_name": "unique descriptive name for this image",
+            "entity_type": "image",
+            "summary": "concise summary of the image content and its significance (max 100 words)"
+        }}
+    }}
+]
+
+Describe every image on its own, do not merge or skip images. Focus on providing accurate, detailed visual analysis that would be useful for knowledge retrieval."""
+
+PROMPTS["vision_batch_image"] = """Image {image_index}:
+- Image Path: {image_path}
+- Captions: {captions}
+- Footnotes: {footnotes}
+- Context from surrounding content: {context}"""
+
 # Image analysis prompt with text fallback
 PROMPTS["text_prompt"] = """Based on the following image information, provide analysis:
 
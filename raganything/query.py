@@ -5,6 +5,7 @@ Contains all query-related methods for both text and multimodal queries
 """
 
 import json
+import asyncio
 import hashlib
 import re
 from typing import Dict, List, Any
@@ -14,8 +15,9 @@ from lightrag.utils import always_get_an_event_loop
 from raganything.prompt import PROMPTS
 from raganything.utils import (
     get_processor_for_type,
-    encode_image_to_base64,
+    encode_image_to_data_url,
     validate_image_file,
+    invoke_model_func,
 )
 
 
@@ -318,8 +320,8 @@ class QueryMixin:
         self.logger.info(f"Executing VLM enhanced query: {query[:100]}...")
 
         # Clear previous image cache
-        if hasattr(self, "_current_images_base64"):
-            delattr(self, "_current_images_base64")
+        if hasattr(self, "_current_image_urls"):
+            delattr(self, "_current_image_urls")
 
         # 1. Get original retrieval prompt (without generating final answer)
         query_param = QueryParam(mode=mode, only_need_prompt=True, **kwargs)
@@ -442,13 +444,16 @@ class QueryMixin:
 
         if image_path and Path(image_path).exists():
             # If image exists, use vision model to generate description
-            image_base64 = processor._encode_image_to_base64(image_path)
-            if image_base64:
+            image_payload, _, _ = await asyncio.to_thread(
+                processor._prepare_image_input, image_path
+            )
+            if image_payload:
                 prompt = PROMPTS["QUERY_IMAGE_DESCRIPTION"]
-                description = await processor.modal_caption_func(
+                description = await invoke_model_func(
+                    processor.modal_caption_func,
                     prompt,
-                    image_data=image_base64,
                     system_prompt=PROMPTS["QUERY_IMAGE_ANALYST_SYSTEM"],
+                    **processor._image_call_kwargs(image_payload),
                 )
                 return description
 
@@ -474,8 +479,10 @@ class QueryMixin:
             table_data=table_data, table_caption=table_caption
         )
 
-        description = await processor.modal_caption_func(
-            prompt, system_prompt=PROMPTS["QUERY_TABLE_ANALYST_SYSTEM"]
+        description = await invoke_model_func(
+            processor.modal_caption_func,
+            prompt,
+            system_prompt=PROMPTS["QUERY_TABLE_ANALYST_SYSTEM"],
         )
 
         return description
@@ -491,8 +498,10 @@ class QueryMixin:
             latex=latex, equation_caption=equation_caption
         )
 
-        description = await processor.modal_caption_func(
-            prompt, system_prompt=PROMPTS["QUERY_EQUATION_ANALYST_SYSTEM"]
+        description = await invoke_model_func(
+            processor.modal_caption_func,
+            prompt,
+            system_prompt=PROMPTS["QUERY_EQUATION_ANALYST_SYSTEM"],
         )
 
         return description
@@ -507,7 +516,8 @@ class QueryMixin:
             content_type=content_type, content_str=content_str
         )
 
-        description = await processor.modal_caption_func(
+        description = await invoke_model_func(
+            processor.modal_caption_func,
             prompt,
             system_prompt=PROMPTS["QUERY_GENERIC_ANALYST_SYSTEM"].format(
                 content_type=content_type
@@ -530,7 +540,7 @@ class QueryMixin:
         images_processed = 0
 
         # Initialize image cache
-        self._current_images_base64 = []
+        self._current_image_urls = []
 
         # Enhanced regex pattern for matching image paths
         # Matches only the path ending with image file extensions
@@ -563,13 +573,15 @@ class QueryMixin:
                 return match.group(0)  # Keep original if validation fails
 
             try:
-                # Encode image to base64 using utility function
+                # Encode image to a base64 data URL using utility function
                 self.logger.debug(f"Attempting to encode image: {image_path}")
-                image_base64 = encode_image_to_base64(image_path)
-                if image_base64:
+                image_url = encode_image_to_data_url(
+                    image_path, self.image_preprocessor
+                )
+                if image_url:
                     images_processed += 1
-                    # Save base64 to instance variable for later use
-                    self._current_images_base64.append(image_base64)
+                    # Save data URL to instance variable for later use
+                    self._current_image_urls.append(image_url)
 
                     # Keep original path info and add VLM marker
                     result = f"Image Path: {image_path}\n[VLM_IMAGE_{images_processed}]"
@@ -585,9 +597,9 @@ class QueryMixin:
                 self.logger.error(f"Failed to process image {image_path}: {e}")
                 return match.group(0)  # Keep original
 
-        # Execute replacement
-        enhanced_prompt = re.sub(
-            image_path_pattern, replace_image_path, enhanced_prompt
+        # Execute replacement, images are read and encoded off the event loop
+        enhanced_prompt = await asyncio.to_thread(
+            re.sub, image_path_pattern, replace_image_path, enhanced_prompt
         )
 
         return enhanced_prompt, images_processed
@@ -605,9 +617,9 @@ class QueryMixin:
         Returns:
             List[Dict]: VLM message format
         """
-        images_base64 = getattr(self, "_current_images_base64", [])
+        image_urls = getattr(self, "_current_image_urls", [])
 
-        if not images_base64:
+        if not image_urls:
             # Pure text mode
             return [
                 {
@@ -637,13 +649,11 @@ class QueryMixin:
                     remaining_text = marker_match.group(2)
 
                     # Insert corresponding image
-                    if 0 <= image_num < len(images_base64):
+                    if 0 <= image_num < len(image_urls):
                         content_parts.append(
                             {
                                 "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{images_base64[image_num]}"
-                                },
+                                "image_url": {"url": image_urls[image_num]},
                             }
                         )
 
@@ -684,12 +694,13 @@ class QueryMixin:
 
             if isinstance(content, str):
                 # Pure text mode
-                result = await self.vision_model_func(
-                    content, system_prompt=system_prompt
+                result = await invoke_model_func(
+                    self.vision_model_func, content, system_prompt=system_prompt
                 )
             else:
                 # Multimodal mode - pass complete messages directly to VLM
-                result = await self.vision_model_func(
+                result = await invoke_model_func(
+                    self.vision_model_func,
                     "",  # Empty prompt since we're using messages format
                     messages=messages,
                 )
@@ -11,6 +11,7 @@ import os
 from typing import Dict, Any, Optional, Callable
 import sys
 import asyncio
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -32,6 +33,9 @@ from raganything.processor import ProcessorMixin
 from raganything.batch import BatchMixin
 from raganything.utils import get_processor_supports
 from raganything.parser import MineruParser, DoclingParser
+from raganything.mineru_pool import MineruWorkerPool
+from raganything.image_preprocessor import ImagePreprocessor
+from raganything.doc_status import recover_doc_status_journal
 
 # Import specialized processors
 from raganything.modalprocessors import (
@@ -91,6 +95,21 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
     parse_cache: Optional[Any] = field(default=None, init=False)
     """Parse result cache storage using LightRAG KV storage."""
 
+    caption_cache: Optional[Any] = field(default=None, init=False)
+    """Modal processor response cache storage using LightRAG KV storage."""
+
+    image_preprocessor: Optional[ImagePreprocessor] = field(default=None, init=False)
+    """Downscales/recompresses images before they are sent to the vision model."""
+
+    mineru_worker_pool: Optional[MineruWorkerPool] = field(default=None, init=False)
+    """Persistent MinerU worker pool, started on first use when mineru_pool_workers > 0."""
+
+    parse_executor: Optional[Executor] = field(default=None, init=False)
+    """Executor running synchronous parsers off the event loop, created on first use."""
+
+    bulk_ingest_state: Optional[Any] = field(default=None, init=False)
+    """State of the active bulk ingest session, None when storages are flushed per document."""
+
     def __post_init__(self):
         """Post-initialization setup following LightRAG pattern"""
         # Initialize configuration if not provided
@@ -105,7 +124,9 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
 
         # Set up document parser
         self.doc_parser = (
-            DoclingParser() if self.config.parser == "docling" else MineruParser()
+            DoclingParser(backend=self.config.docling_backend)
+            if self.config.parser == "docling"
+            else MineruParser()
         )
 
         # Create working directory if needed
@@ -176,11 +197,30 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
         # Create different multimodal processors based on configuration
         self.modal_processors = {}
 
+        # Shared by image captioning and VLM-enhanced queries, images are sent
+        # unchanged unless a preprocessing setting is active
+        self.image_preprocessor = None
+        if (
+            self.config.image_max_long_edge > 0
+            or self.config.image_grayscale
+            or self.config.image_encode_format.lower() != "original"
+        ):
+            self.image_preprocessor = ImagePreprocessor(
+                max_long_edge=self.config.image_max_long_edge,
+                image_format=self.config.image_encode_format,
+                quality=self.config.image_encode_quality,
+                grayscale=self.config.image_grayscale,
+                cache_dir=Path(self.working_dir) / "image_cache",
+            )
+
         if self.config.enable_image_processing:
             self.modal_processors["image"] = ImageModalProcessor(
                 lightrag=self.lightrag,
                 modal_caption_func=self.vision_model_func or self.llm_model_func,
                 context_extractor=self.context_extractor,
+                caption_cache=self.caption_cache,
+                image_preprocessor=self.image_preprocessor,
+                image_handoff=self.config.image_handoff,
             )
 
         if self.config.enable_table_processing:
@@ -188,6 +228,7 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 lightrag=self.lightrag,
                 modal_caption_func=self.llm_model_func,
                 context_extractor=self.context_extractor,
+                caption_cache=self.caption_cache,
             )
 
         if self.config.enable_equation_processing:
@@ -195,6 +236,7 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 lightrag=self.lightrag,
                 modal_caption_func=self.llm_model_func,
                 context_extractor=self.context_extractor,
+                caption_cache=self.caption_cache,
             )
 
         # Always include generic processor as fallback
@@ -202,6 +244,7 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             lightrag=self.lightrag,
             modal_caption_func=self.llm_model_func,
             context_extractor=self.context_extractor,
+            caption_cache=self.caption_cache,
         )
 
         self.logger.info("Multimodal processors initialized with context support")
@@ -257,8 +300,13 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 )
                 await self.parse_cache.initialize()
 
+            # Initialize caption cache if not already done
+            if self.caption_cache is None:
+                await self._initialize_caption_cache()
+
             # Initialize processors if not already done
             if not self.modal_processors:
+                await self._recover_doc_status_journal()
                 self._initialize_processors()
 
             return
@@ -308,12 +356,37 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             embedding_func=self.embedding_func,
         )
         await self.parse_cache.initialize()
+        await self._initialize_caption_cache()
+        await self._recover_doc_status_journal()
 
         # Initialize processors after LightRAG is ready
         self._initialize_processors()
 
         self.logger.info("LightRAG, parse cache, and multimodal processors initialized")
 
+    async def _initialize_caption_cache(self):
+        """Create the modal processor response cache in LightRAG's KV storage"""
+        if not self.config.enable_caption_cache:
+            return
+
+        self.caption_cache = self.lightrag.key_string_value_json_storage_cls(
+            namespace="caption_cache",
+            workspace=self.lightrag.workspace,
+            global_config=self.lightrag.__dict__,
+            embedding_func=self.embedding_func,
+        )
+        await self.caption_cache.initialize()
+
+    async def _recover_doc_status_journal(self):
+        """Replay doc_status commits interrupted by a crash in a previous run"""
+        try:
+            await recover_doc_status_journal(
+                self.lightrag.doc_status,
+                Path(self.working_dir) / "doc_status_journal",
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to recover doc_status journal: {e}")
+
     async def finalize_storages(self):
         """Finalize all storages including parse cache and LightRAG storages
 
@@ -337,6 +410,12 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
             - All finalization tasks run concurrently for better performance
         """
         try:
+            # Let in-flight parses finish before their storages and workers go away
+            if self.parse_executor is not None:
+                await asyncio.to_thread(self.parse_executor.shutdown)
+                self.parse_executor = None
+                self.logger.debug("Parse executor shut down")
+
             tasks = []
 
             # Finalize parse cache if it exists
@@ -344,11 +423,22 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 tasks.append(self.parse_cache.finalize())
                 self.logger.debug("Scheduled parse cache finalization")
 
+            # Finalize caption cache if it exists
+            if self.caption_cache is not None:
+                tasks.append(self.caption_cache.finalize())
+                self.logger.debug("Scheduled caption cache finalization")
+
             # Finalize LightRAG storages if LightRAG is initialized
             if self.lightrag is not None:
                 tasks.append(self.lightrag.finalize_storages())
                 self.logger.debug("Scheduled LightRAG storages finalization")
 
+            # Stop persistent MinerU workers
+            if self.mineru_worker_pool is not None:
+                tasks.append(asyncio.to_thread(self.mineru_worker_pool.close))
+                self.mineru_worker_pool = None
+                self.logger.debug("Scheduled MinerU worker pool shutdown")
+
             # Run all finalization tasks concurrently
             if tasks:
                 await asyncio.gather(*tasks)
@@ -380,11 +470,37 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 "parser": self.config.parser,
                 "parse_method": self.config.parse_method,
                 "display_content_stats": self.config.display_content_stats,
+                "parse_cache_mode": self.config.parse_cache_mode,
+                "parse_cache_storage": self.config.parse_cache_storage,
+                "parse_page_window": self.config.parse_page_window,
+                "parse_shards": self.config.parse_shards,
+                "parse_shard_workers": self.config.parse_shard_workers,
+                "mineru_pool_workers": self.config.mineru_pool_workers,
+                "parser_executor": self.config.parser_executor,
+                "max_parallel_parse": self.config.max_parallel_parse,
+                "docling_backend": self.config.docling_backend,
+                "enable_conversion_cache": self.config.enable_conversion_cache,
+                "native_text_extensions": self.config.native_text_extensions,
             },
             "multimodal_processing": {
                 "enable_image_processing": self.config.enable_image_processing,
                 "enable_table_processing": self.config.enable_table_processing,
                 "enable_equation_processing": self.config.enable_equation_processing,
+                "enable_caption_cache": self.config.enable_caption_cache,
+                "enable_image_dedup": self.config.enable_image_dedup,
+                "image_dedup_threshold": self.config.image_dedup_threshold,
+                "enable_image_filter": self.config.enable_image_filter,
+                "image_filter_min_side": self.config.image_filter_min_side,
+                "image_filter_min_area": self.config.image_filter_min_area,
+                "image_filter_min_entropy": self.config.image_filter_min_entropy,
+                "image_filter_min_stddev": self.config.image_filter_min_stddev,
+                "enable_batch_image_captioning": self.config.enable_batch_image_captioning,
+                "image_caption_batch_size": self.config.image_caption_batch_size,
+                "image_max_long_edge": self.config.image_max_long_edge,
+                "image_encode_format": self.config.image_encode_format,
+                "image_encode_quality": self.config.image_encode_quality,
+                "image_grayscale": self.config.image_grayscale,
+                "image_handoff": self.config.image_handoff,
             },
             "context_extraction": {
                 "context_window": self.config.context_window,
@@ -398,6 +514,16 @@ class RAGAnything(QueryMixin, ProcessorMixin, BatchMixin):
                 "max_concurrent_files": self.config.max_concurrent_files,
                 "supported_file_extensions": self.config.supported_file_extensions,
                 "recursive_folder_processing": self.config.recursive_folder_processing,
+                "enable_bulk_ingest": self.config.enable_bulk_ingest,
+                "bulk_flush_documents": self.config.bulk_flush_documents,
+                "bulk_flush_interval": self.config.bulk_flush_interval,
+                "enable_pipeline_processing": self.config.enable_pipeline_processing,
+                "pipeline_parse_workers": self.config.pipeline_parse_workers,
+                "pipeline_text_workers": self.config.pipeline_text_workers,
+                "pipeline_caption_workers": self.config.pipeline_caption_workers,
+                "pipeline_extract_workers": self.config.pipeline_extract_workers,
+                "pipeline_merge_workers": self.config.pipeline_merge_workers,
+                "pipeline_queue_size": self.config.pipeline_queue_size,
             },
             "logging": {
                 "note": "Logging fields have been removed - configure logging externally",
@@ -0,0 +1,234 @@
+"""
+Native Text and Markdown Parsing
+
+This module converts plain text and Markdown files directly into MinerU-format
+content lists, without rendering them to PDF and running layout analysis:
+
+- Markdown headings become text blocks with `text_level`
+- Pipe tables become table blocks with the Markdown table in `table_body`
+- Fenced code blocks are kept verbatim as text blocks
+- Display math (`$$ ... $$`) becomes equation blocks
+- Standalone local images (`![alt](path)`) become image blocks with absolute `img_path`
+
+Text files have no pages, so `page_idx` advances every `chars_per_page` characters
+to keep page-based context extraction local.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import unquote
+
+_HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_SETEXT_RE = re.compile(r"^ {0,3}(=+|-+)[ \t]*$")
+_HR_RE = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_IMAGE_RE = re.compile(
+    r"^\s*!\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'][^\"']*[\"'])?\s*\)\s*$"
+)
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_URL_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def read_text_file(text_path: Union[str, Path]) -> str:
+    """
+    Read a text file, falling back to common encodings when it is not UTF-8
+
+    Args:
+        text_path: Path to the text file
+
+    Returns:
+        str: File content
+    """
+    text_path = Path(text_path)
+    for encoding in ["utf-8", "gbk", "latin-1", "cp1252"]:
+        try:
+            return text_path.read_text(encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+    raise RuntimeError(
+        f"Could not decode text file {text_path.name} with any supported encoding"
+    )
+
+
+class _ContentListBuilder:
+    """Collects content blocks and assigns approximate page indices"""
+
+    def __init__(self, chars_per_page: int):
+        self.chars_per_page = max(1, chars_per_page)
+        self.content_list: List[Dict[str, Any]] = []
+        self.char_count = 0
+
+    def add(self, block: Dict[str, Any], size: int) -> None:
+        block["page_idx"] = self.char_count // self.chars_per_page
+        self.content_list.append(block)
+        self.char_count += size
+
+    def add_text(self, text: str, text_level: int = 0) -> None:
+        text = text.strip("\n")
+        if not text.strip():
+            return
+        block = {"type": "text", "text": text}
+        if text_level:
+            block["text_level"] = text_level
+        self.add(block, len(text))
+
+
+def parse_plain_text(text: str, chars_per_page: int = 3000) -> List[Dict[str, Any]]:
+    """
+    Convert plain text into text blocks, one per paragraph
+
+    Args:
+        text: Text content
+        chars_per_page: Number of characters per approximate page
+
+    Returns:
+        List[Dict[str, Any]]: MinerU-format content list
+    """
+    builder = _ContentListBuilder(chars_per_page)
+    for paragraph in re.split(r"\n[ \t]*\n", text.replace("\r\n", "\n")):
+        builder.add_text(paragraph)
+    return builder.content_list
+
+
+def parse_markdown(
+    text: str, base_dir: Optional[Union[str, Path]] = None, chars_per_page: int = 3000
+) -> List[Dict[str, Any]]:
+    """
+    Convert Markdown into a MinerU-format content list
+
+    Args:
+        text: Markdown content
+        base_dir: Directory relative image paths are resolved against
+        chars_per_page: Number of characters per approximate page
+
+    Returns:
+        List[Dict[str, Any]]: MinerU-format content list
+    """
+    base_dir = Path(base_dir) if base_dir else Path.cwd()
+    builder = _ContentListBuilder(chars_per_page)
+    lines = text.replace("\r\n", "\n").split("\n")
+    paragraph: List[str] = []
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            builder.add_text("\n".join(paragraph))
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if not line.strip():
+            flush_paragraph()
+            i += 1
+            continue
+
+        # Fenced code block, kept verbatim including the fences
+        fence_match = _FENCE_RE.match(line)
+        if fence_match:
+            flush_paragraph()
+            fence = fence_match.group(1)
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith(fence):
+                end += 1
+            builder.add_text("\n".join(lines[i : end + 1]))
+            i = end + 1
+            continue
+
+        # Display math: $$...$$ on one line, or a block opened by a line without
+        # its closing $$. Inline $$...$$ followed by text stays in the paragraph.
+        stripped = line.strip()
+        if stripped.startswith("$$"):
+            closer = stripped.find("$$", 2)
+            end = None
+            if closer == -1:
+                end = i + 1
+                while end < len(lines) and "$$" not in lines[end]:
+                    end += 1
+                if end == len(lines):
+                    # Unclosed block, keep the opening line as text
+                    end = None
+            elif not stripped[closer + 2 :].strip():
+                end = i
+            if end is not None:
+                flush_paragraph()
+                latex = "\n".join(lines[i : end + 1]).strip()
+                builder.add(
+                    {"type": "equation", "text": latex, "text_format": "latex"},
+                    len(latex),
+                )
+                i = end + 1
+                continue
+
+        heading_match = _HEADING_RE.match(line)
+        if heading_match:
+            flush_paragraph()
+            builder.add_text(
+                (heading_match.group(2) or "").strip(), len(heading_match.group(1))
+            )
+            i += 1
+            continue
+
+        # Setext heading: a single paragraph line underlined with = or -
+        setext_match = _SETEXT_RE.match(line)
+        if setext_match and len(paragraph) == 1:
+            heading = paragraph.pop().strip()
+            builder.add_text(heading, 1 if setext_match.group(1)[0] == "=" else 2)
+            i += 1
+            continue
+
+        if _HR_RE.match(line):
+            flush_paragraph()
+            i += 1
+            continue
+
+        # Pipe table: header row followed by a separator row
+        if (
+            "|" in line
+            and i + 1 < len(lines)
+            and _TABLE_SEPARATOR_RE.match(lines[i + 1])
+            and "-" in lines[i + 1]
+        ):
+            flush_paragraph()
+            end = i + 2
+            while end < len(lines) and lines[end].strip() and "|" in lines[end]:
+                end += 1
+            table_body = "\n".join(lines[i:end])
+            builder.add(
+                {
+                    "type": "table",
+                    "img_path": "",
+                    "table_caption": [],
+                    "table_body": table_body,
+                    "table_footnote": [],
+                },
+                len(table_body),
+            )
+            i = end
+            continue
+
+        # Standalone local image, remote or missing images stay in the text
+        image_match = _IMAGE_RE.match(line)
+        if image_match and not _URL_RE.match(image_match.group(2)):
+            image_path = (base_dir / unquote(image_match.group(2))).resolve()
+            if image_path.is_file():
+                flush_paragraph()
+                alt_text = image_match.group(1).strip()
+                builder.add(
+                    {
+                        "type": "image",
+                        "img_path": str(image_path),
+                        "img_caption": [alt_text] if alt_text else [],
+                        "img_footnote": [],
+                    },
+                    len(line),
+                )
+                i += 1
+                continue
+
+        paragraph.append(line)
+        i += 1
+
+    flush_paragraph()
+    return builder.content_list
@@ -4,7 +4,11 @@ Utility functions for RAGAnything
 Contains helper functions for content separation, text insertion, and other utilities
 """
 
+import asyncio
 import base64
+import hashlib
+import inspect
+import mimetypes
 from typing import Dict, List, Any, Tuple
 from pathlib import Path
 from lightrag.utils import logger
@@ -56,16 +60,20 @@ def separate_content(
     return text_content, multimodal_items
 
 
-def encode_image_to_base64(image_path: str) -> str:
+def encode_image_to_base64(image_path: str, preprocessor=None) -> str:
     """
     Encode image file to base64 string
 
     Args:
         image_path: Path to the image file
+        preprocessor: Optional ImagePreprocessor downscaling/recompressing the image first
 
     Returns:
         str: Base64 encoded string, empty string if encoding fails
     """
+    if preprocessor is not None:
+        return preprocessor.encode_base64(image_path)
+
     try:
         with open(image_path, "rb") as image_file:
             encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
@@ -75,6 +83,208 @@ def encode_image_to_base64(image_path: str) -> str:
         return ""
 
 
+def guess_image_mime_type(image_path: str) -> str:
+    """
+    Guess the MIME type of an image file from its extension
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        str: MIME type, image/jpeg if the extension is not a known image type
+    """
+    mime_type = mimetypes.guess_type(str(image_path))[0]
+    if mime_type and mime_type.startswith("image/"):
+        return mime_type
+    return "image/jpeg"
+
+
+def encode_image_to_data_url(image_path: str, preprocessor=None) -> str:
+    """
+    Encode image file to a base64 data URL with the MIME type of the encoded bytes
+
+    Args:
+        image_path: Path to the image file
+        preprocessor: Optional ImagePreprocessor downscaling/recompressing the image first
+
+    Returns:
+        str: Data URL, empty string if encoding fails
+    """
+    try:
+        if preprocessor is not None:
+            image_bytes, mime_type = preprocessor.prepare(image_path)
+        else:
+            with open(image_path, "rb") as image_file:
+                image_bytes = image_file.read()
+            mime_type = guess_image_mime_type(image_path)
+        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+        return f"data:{mime_type};base64,{image_base64}"
+    except Exception as e:
+        logger.error(f"Failed to encode image {image_path}: {e}")
+        return ""
+
+
+def compute_file_content_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute SHA-256 hash of file bytes by streaming the file in chunks
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes to read per chunk
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def compute_image_perceptual_hash(
+    image_path: str, hash_size: int = 16
+) -> Tuple[int, float]:
+    """
+    Compute a difference hash (dHash) of an image for near-duplicate detection
+
+    The image is reduced to a (hash_size + 1) x hash_size grayscale thumbnail and
+    each bit records whether a pixel is clearly brighter than its right neighbour,
+    so re-encoded or slightly rescaled copies of an image produce close hashes.
+
+    Args:
+        image_path: Path to the image file
+        hash_size: Hash grid size, the hash has hash_size * hash_size bits
+
+    Returns:
+        Tuple[int, float]: (hash bits, width / height aspect ratio)
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError(
+            "PIL/Pillow is required for image deduplication. "
+            "Please install it using: pip install Pillow"
+        )
+
+    with Image.open(image_path) as img:
+        aspect_ratio = img.width / img.height if img.height else 0.0
+        thumbnail = img.convert("L").resize(
+            (hash_size + 1, hash_size), Image.Resampling.LANCZOS
+        )
+        pixels = list(thumbnail.getdata())
+
+    hash_bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            # Small differences are treated as equal so flat regions stay stable under noise
+            hash_bits = (hash_bits << 1) | (
+                pixels[offset + col] > pixels[offset + col + 1] + 3
+            )
+    return hash_bits, aspect_ratio
+
+
+def get_decorative_image_reason(
+    image_path: str,
+    min_side: int = 32,
+    min_area: int = 4096,
+    min_entropy: float = 0.05,
+    min_stddev: float = 4.0,
+) -> str:
+    """
+    Check whether an image is likely decorative (bullet, icon, rule line, blank crop)
+
+    Args:
+        image_path: Path to the image file
+        min_side: Minimum width and height in pixels
+        min_area: Minimum width * height in pixels
+        min_entropy: Minimum grayscale histogram entropy in bits
+        min_stddev: Minimum grayscale standard deviation, lower means near-uniform colour
+
+    Returns:
+        str: Reason the image is considered decorative, empty string if it is not
+    """
+    try:
+        from PIL import Image, ImageStat
+    except ImportError:
+        raise RuntimeError(
+            "PIL/Pillow is required for decorative image filtering. "
+            "Please install it using: pip install Pillow"
+        )
+
+    with Image.open(image_path) as img:
+        width, height = img.size
+        if min(width, height) < min_side:
+            return f"too small ({width}x{height})"
+        if width * height < min_area:
+            return f"area below {min_area} px ({width}x{height})"
+
+        # Statistics on a thumbnail are close enough and much cheaper on large scans
+        img.draft("L", (256, 256))
+        gray = img.convert("L")
+        gray.thumbnail((256, 256))
+
+        entropy = max(gray.entropy(), 0.0)
+        if entropy < min_entropy:
+            return f"low entropy ({entropy:.2f} bits)"
+        stddev = ImageStat.Stat(gray).stddev[0]
+        if stddev < min_stddev:
+            return f"near-uniform colour (stddev {stddev:.1f})"
+
+    return ""
+
+
+def find_near_duplicate_images(
+    image_paths: List[str], max_distance: int = 10, hash_size: int = 16
+) -> Dict[int, int]:
+    """
+    Group images whose perceptual hashes differ by at most max_distance bits
+
+    Images with clearly different aspect ratios are never grouped. Images that
+    cannot be read are left ungrouped.
+
+    Args:
+        image_paths: Paths to the image files
+        max_distance: Maximum Hamming distance between hashes of duplicates
+        hash_size: Hash grid size passed to compute_image_perceptual_hash
+
+    Returns:
+        Dict[int, int]: Position of each duplicate image -> position of the first
+            image of its group, positions of group representatives are not included
+    """
+    representatives: List[Tuple[int, int, float]] = []
+    exact_hashes: Dict[Tuple[int, float], int] = {}
+    duplicates: Dict[int, int] = {}
+
+    for position, image_path in enumerate(image_paths):
+        try:
+            hash_bits, aspect_ratio = compute_image_perceptual_hash(
+                image_path, hash_size
+            )
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not hash image {image_path}: {e}")
+            continue
+
+        exact_key = (hash_bits, round(aspect_ratio, 2))
+        if exact_key in exact_hashes:
+            duplicates[position] = exact_hashes[exact_key]
+            continue
+
+        for rep_position, rep_hash, rep_aspect in representatives:
+            if (
+                abs(aspect_ratio - rep_aspect) <= 0.1 * max(aspect_ratio, rep_aspect)
+                and bin(hash_bits ^ rep_hash).count("1") <= max_distance
+            ):
+                duplicates[position] = rep_position
+                break
+        else:
+            representatives.append((position, hash_bits, aspect_ratio))
+            exact_hashes[exact_key] = position
+
+    return duplicates
+
+
 def validate_image_file(image_path: str, max_size_mb: int = 50) -> bool:
     """
     Validate if a file is a valid image file
@@ -174,6 +384,33 @@ async def insert_text_content(
     logger.info("Text content insertion complete")
 
 
+async def invoke_model_func(func, *args, **kwargs) -> Any:
+    """
+    Call a model function that may be synchronous or asynchronous
+
+    Coroutine functions are awaited on the event loop. Other callables run in a
+    worker thread so blocking model calls do not stall the loop; when they return
+    an awaitable (e.g. a plain function returning a coroutine) it is awaited too.
+
+    Args:
+        func: LLM or vision model function
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        Any: Model response
+    """
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    ):
+        return await func(*args, **kwargs)
+
+    result = await asyncio.to_thread(func, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
 def get_processor_for_type(modal_processors: Dict[str, Any], content_type: str):
     """
     Get appropriate processor based on content type
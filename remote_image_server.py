@@ -2,14 +2,24 @@
 远程图像服务器客户端
 用于将base64图片上传到远程服务器并获取访问URL
 """
+import os
 import requests
 import base64
 import hashlib
 import json
 
 class RemoteImageClient:
-    def __init__(self, server_url="http://223.109.239.14:10017"):
+    def __init__(self, server_url="http://223.109.239.14:10017", access_url=None):
+        """
+        server_url: 上传与检查所用的远程服务器地址
+        access_url: 返回给模型的访问地址（如vLLM与图像服务器同机时可用http://127.0.0.1:10017），默认同server_url
+        """
         self.server_url = server_url.rstrip('/')
+        self.access_url = (access_url or server_url).rstrip('/')
+
+    def _file_url(self, filename):
+        """由访问地址生成文件URL"""
+        return f"{self.access_url}/{filename}"
         
     def upload_base64_image(self, base64_data, file_extension="jpg"):
         """上传base64图片到远程服务器，返回远程访问URL"""
@@ -28,10 +38,10 @@ class RemoteImageClient:
             try:
                 check_response = requests.head(check_url, timeout=5)
                 if check_response.status_code == 200:
-                    # 文件已存在，直接返回本地访问URL
-                    return f"http://127.0.0.1:10017/{filename}"
-            except:
-                pass  # 文件不存在，继续上传
+                    # 文件已存在，直接返回访问URL
+                    return self._file_url(filename)
+            except requests.RequestException:
+                pass  # 检查失败，继续上传
             
             # 构建上传URL
             upload_url = f"{self.server_url}/upload"
@@ -50,8 +60,7 @@ class RemoteImageClient:
             if response.status_code == 200:
                 result = response.json()
                 if result.get("success"):
-                    # 返回本地访问URL，因为vLLM在同一服务器上
-                    return f"http://127.0.0.1:10017/{filename}"
+                    return self._file_url(filename)
                 else:
                     print(f"Upload failed: {result.get('error', 'Unknown error')}")
                     return None
@@ -63,12 +72,52 @@ class RemoteImageClient:
             print(f"Error uploading base64 image: {e}")
             return None
     
+    def upload_image_file(self, file_path):
+        """
+        上传本地图片文件到远程服务器，返回远程访问URL
+        远程已存在同内容文件时不读取编码，仅在需要上传时才转为base64
+        """
+        try:
+            md5 = hashlib.md5()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    md5.update(chunk)
+            extension = os.path.splitext(file_path)[1].lstrip('.').lower() or "jpg"
+            filename = f"{md5.hexdigest()}.{extension}"
+
+            # 首先检查文件是否已存在
+            try:
+                check_response = requests.head(f"{self.server_url}/{filename}", timeout=5)
+                if check_response.status_code == 200:
+                    return self._file_url(filename)
+            except requests.RequestException:
+                pass  # 检查失败，继续上传
+
+            with open(file_path, 'rb') as f:
+                base64_data = base64.b64encode(f.read()).decode('utf-8')
+            payload = {
+                "filename": filename,
+                "data": base64_data,
+                "extension": extension
+            }
+            headers = {"Content-Type": "application/json"}
+            response = requests.post(f"{self.server_url}/upload", json=payload, headers=headers, timeout=30)
+
+            if response.status_code == 200 and response.json().get("success"):
+                return self._file_url(filename)
+            print(f"Upload failed: HTTP {response.status_code}: {response.text}")
+            return None
+
+        except Exception as e:
+            print(f"Error uploading image file: {e}")
+            return None
+
     def check_server_status(self):
         """检查远程服务器状态"""
         try:
             response = requests.get(f"{self.server_url}/status", timeout=5)
             return response.status_code == 200
-        except:
+        except requests.RequestException:
             return False
 
 # 全局远程图像客户端实例
@@ -108,6 +157,26 @@ def convert_base64_to_url(base64_data):
         print("Warning: Both remote and local image servers unavailable")
         return None
 
+def convert_path_to_url(file_path):
+    """
+    将本地图片文件转换为URL
+    优先尝试远程服务器，失败则由本地服务器直接发布原文件
+    """
+    client = get_remote_image_client()
+    if client.check_server_status():
+        url = client.upload_image_file(file_path)
+        if url:
+            return url
+
+    # 远程服务器不可用，使用本地方案（硬链接/符号链接原文件）
+    try:
+        from image_server import get_image_server
+        server = get_image_server()
+        return server.save_image_file(file_path)
+    except ImportError:
+        print("Warning: Both remote and local image servers unavailable")
+        return None
+
 if __name__ == "__main__":
     # 测试客户端
     client = RemoteImageClient()